@@ -5,8 +5,43 @@ This module implements the inference mechanism for diagnosing plant diseases
 based on observed symptoms and environmental factors.
 """
 
+import heapq
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+
 from knowledge_base import KNOWLEDGE_BASE, PLANT_DISEASE_SUSCEPTIBILITY
 
+# Maximum number of distinct diagnoses remembered per engine
+DIAGNOSIS_CACHE_SIZE = 1024
+
+# Sort key for scored (confidence, disease, matching symptoms) candidates
+_by_confidence = itemgetter(0)
+
+# Severity levels as they arrive from UI widgets, pre-parsed so the common
+# case needs neither float()/int() conversion nor an exception handler
+_SEVERITY_STRINGS = {str(level): level for level in range(6)}
+
+# Ideal environmental conditions for each disease (simplified)
+_DISEASE_ENV_PREFS = {
+    'powdery_mildew': {'temperature': 'warm', 'humidity': 'low', 'air_circulation': 'poor'},
+    'downy_mildew': {'temperature': 'cool', 'humidity': 'high', 'leaf_wetness': 'high'},
+    'botrytis_blight': {'temperature': 'cool', 'humidity': 'high', 'air_circulation': 'poor'},
+    'bacterial_blight': {'temperature': 'warm', 'humidity': 'high', 'leaf_wetness': 'high'},
+    'root_rot': {'soil_moisture': 'high', 'drainage': 'poor'},
+    'fusarium_wilt': {'temperature': 'hot', 'soil_moisture': 'low', 'plant_stress': 'high'},
+    'spider_mite_infestation': {'temperature': 'hot', 'humidity': 'low'},
+    'aphid_infestation': {'temperature': 'moderate', 'new_growth': 'yes'}
+}
+
+# Same preferences as (factor, value) tuples, ready to iterate in the match loop
+_DISEASE_ENV_PREFS_ITEMS = {
+    disease: tuple(prefs.items()) for disease, prefs in _DISEASE_ENV_PREFS.items()
+}
+
 class InferenceEngine:
     """
     Advanced inference engine that uses multiple factors to diagnose plant diseases:
@@ -25,9 +60,113 @@ class InferenceEngine:
         """
         self.knowledge_base = knowledge_base or KNOWLEDGE_BASE
     
-    def diagnose(self, observed_symptoms, symptom_severity=None, plant_type=None, environmental_factors=None):
+    @property
+    def knowledge_base(self):
+        """Knowledge base used for diagnosis."""
+        return self._knowledge_base
+    
+    @knowledge_base.setter
+    def knowledge_base(self, knowledge_base):
+        # Replacing the knowledge base invalidates every precomputed index
+        self._knowledge_base = knowledge_base
+        self._build_indexes()
+    
+    def _build_indexes(self):
+        """
+        Precompute lookup tables derived from the (static) knowledge base so
+        that diagnosis does not have to rescan it for every candidate disease.
+        """
+        # Required symptoms of each disease, as a tuple for fast ordered iteration
+        # and as a set for O(1) membership tests. Kept on the engine rather than
+        # written into the (possibly shared) knowledge base dictionaries.
+        # Symptom strings are interned so lookups can match on identity
+        self._required_tuples = {
+            disease: tuple(sys.intern(symptom) for symptom in data['symptoms'])
+            for disease, data in self.knowledge_base.items()
+        }
+        self._required_sets = {
+            disease: frozenset(symptoms)
+            for disease, symptoms in self._required_tuples.items()
+        }
+        
+        # Number of diseases that list each symptom
+        symptom_disease_count = Counter()
+        for symptoms in self._required_sets.values():
+            symptom_disease_count.update(symptoms)
+        
+        kb_size = max(len(self.knowledge_base), 1)  # Avoid division by zero
+        
+        # Specificity of each symptom (inverse of how common it is)
+        # A symptom that appears in only one disease has highest specificity (1.0)
+        # A symptom that appears in all diseases has lowest specificity
+        self._symptom_specificity = {
+            symptom: 1 - ((count - 1) / kb_size)
+            for symptom, count in symptom_disease_count.items()
+        }
+        
+        # Inverted index: the diseases that list each symptom, so diagnosis only
+        # has to look at diseases sharing at least one symptom with the plant
+        # (built from the symptom tuples, so a symptom listed twice counts twice)
+        self._symptom_to_diseases = {}
+        for disease, symptoms in self._required_tuples.items():
+            for symptom in symptoms:
+                self._symptom_to_diseases.setdefault(symptom, []).append(disease)
+        
+        # Position of each disease in the knowledge base, to keep its order
+        self._disease_order = {disease: index for index, disease in enumerate(self.knowledge_base)}
+        
+        # Number of required symptoms per disease (match percentage denominator)
+        self._required_counts = {
+            disease: len(symptoms) for disease, symptoms in self._required_tuples.items()
+        }
+        
+        # Diseases each plant type is susceptible to: the general susceptibility
+        # map plus every disease that lists the plant type specifically
+        plant_to_diseases = {
+            sys.intern(plant_type): set(diseases)
+            for plant_type, diseases in PLANT_DISEASE_SUSCEPTIBILITY.items()
+        }
+        for disease, data in self.knowledge_base.items():
+            for plant_type in data.get('plant_types', ()):
+                if plant_type in plant_to_diseases:
+                    plant_to_diseases[plant_type].add(disease)
+        self._plant_to_diseases = {
+            plant_type: frozenset(diseases)
+            for plant_type, diseases in plant_to_diseases.items()
+        }
+        
+        # Susceptibility tier of each (plant type, disease) pair
+        self._plant_tier = {}
+        for plant_type, diseases in PLANT_DISEASE_SUSCEPTIBILITY.items():
+            for disease in diseases:
+                self._plant_tier[(plant_type, disease)] = 0.8  # High if in the general list
+        for disease, data in self.knowledge_base.items():
+            for plant_type in data.get('plant_types', ()):
+                self._plant_tier[(plant_type, disease)] = 1.0  # Highest if specifically listed
+        
+        # Display fields of each disease, which are identical for every diagnosis
+        self._display_names = {
+            disease: disease.replace('_', ' ').title() for disease in self.knowledge_base
+        }
+        self._presentation = {
+            disease: {
+                'description': data['description'],
+                'treatment': data['treatment'],
+                'product_recommendations': data.get('product_recommendations', []),
+                'severity_impact': data.get('severity_impact', {})
+            }
+            for disease, data in self.knowledge_base.items()
+        }
+        
+        # Fresh result cache, so entries computed from a previous knowledge base are dropped
+        self._diagnose_cached = lru_cache(maxsize=DIAGNOSIS_CACHE_SIZE)(self._diagnose_uncached)
+    
+    def diagnose(self, observed_symptoms, symptom_severity=None, plant_type=None, environmental_factors=None,
+                 top_k=None):
         """
         Diagnose potential diseases based on observed symptoms and additional factors.
+        Results are memoized, so repeated calls with the same inputs are answered
+        from the cache.
         
         Args:
             observed_symptoms: List of symptoms observed in the plant
@@ -35,6 +174,7 @@ class InferenceEngine:
             plant_type: Type of plant (e.g., 'Tomato', 'Rose')
             environmental_factors: Dictionary with environmental conditions
                 (e.g., {'temperature': 'high', 'humidity': 'high'})
+            top_k: Only return the top_k most likely diseases (all if None)
             
         Returns:
             List of dictionaries containing disease information and confidence score
@@ -42,35 +182,137 @@ class InferenceEngine:
         if not observed_symptoms:
             return []
         
-        # Default severity if not provided
-        if symptom_severity is None:
-            symptom_severity = {symptom: 3 for symptom in observed_symptoms}  # Default to medium severity
+        # Observed symptoms as a set so each membership test is O(1), interned to
+        # share the knowledge base's string objects (e.g. symptoms loaded from JSON)
+        observed_set = frozenset(map(sys.intern, observed_symptoms))
+        
+        # Convert string severity values to integers once, not per matching symptom
+        severity_levels = self._coerce_severity(symptom_severity) if symptom_severity else {}
+        
+        # Normalize the inputs into hashable cache keys. Only the severity of
+        # observed symptoms can affect the result; missing ones default to medium (3)
+        severity_key = tuple(sorted(
+            (symptom, severity_levels.get(symptom, 3)) for symptom in observed_set
+        ))
+        env_key = tuple(sorted(environmental_factors.items())) if environmental_factors else ()
         
-        # Default environmental factors if not provided
-        if environmental_factors is None:
-            environmental_factors = {}
+        # Coverage is measured against the symptoms as given (repeats included)
+        cached_results = self._diagnose_cached(observed_set, len(observed_symptoms), severity_key,
+                                               plant_type, env_key, top_k)
+        
+        # Hand out copies so callers can't corrupt the cached entries
+        return [dict(result, matching_symptoms=list(result['matching_symptoms']))
+                for result in cached_results]
+    
+    def diagnose_batch(self, cases, workers=None):
+        """
+        Diagnose many independent cases in parallel worker processes.
         
-        results = []
+        The knowledge base is read-only during diagnosis, so each worker builds
+        its own engine once and then handles its share of the cases.
+        
+        Args:
+            cases: Iterable of dictionaries holding diagnose() keyword arguments
+                (e.g., {'observed_symptoms': [...], 'plant_type': 'Tomato'})
+            workers: Number of worker processes (defaults to the CPU count);
+                1 diagnoses every case in the current process
+            
+        Returns:
+            List of diagnosis results (as returned by diagnose()), in case order
+        """
+        cases = list(cases)
+        workers = workers or os.cpu_count() or 1
+        
+        # Not worth starting processes for a single worker or case
+        if workers == 1 or len(cases) <= 1:
+            return [self.diagnose(**case) for case in cases]
+        
+        # Hand out cases in chunks to keep inter-process overhead low
+        chunksize = max(1, len(cases) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers,
+                                 initializer=_init_batch_worker,
+                                 initargs=(self.knowledge_base,)) as executor:
+            return list(executor.map(_diagnose_case, cases, chunksize=chunksize))
+    
+    def _diagnose_uncached(self, observed_set, observed_count, severity_key, plant_type, env_key, top_k):
+        """
+        Run the actual diagnosis for normalized inputs (see diagnose()).
+        
+        Args:
+            observed_set: Frozenset of observed symptoms
+            observed_count: Number of symptoms observed in the plant
+            severity_key: Sorted tuple of (symptom, integer severity) pairs
+            plant_type: Type of plant
+            env_key: Sorted tuple of (factor, value) environmental pairs
+            top_k: Number of top results to keep (all if None)
+            
+        Returns:
+            Tuple of result dictionaries, highest confidence first
+        """
+        symptom_severity = dict(severity_key)
+        environmental_factors = dict(env_key)
+        
+        # Scored candidates as (confidence, disease, matching symptoms) tuples.
+        # Result dictionaries are only built for the ones that are returned
+        candidates = []
+        
+        # Pre-select the diseases sharing at least one symptom with the observation
+        # (every other disease would be skipped anyway), counting the matching
+        # symptoms of each in the same pass
+        match_counts = Counter()
+        symptom_to_diseases = self._symptom_to_diseases
+        for symptom in observed_set:
+            match_counts.update(symptom_to_diseases.get(symptom, ()))
+        candidate_diseases = match_counts.keys()
         
         # Filter diseases based on plant type if provided
-        candidate_diseases = self._filter_by_plant_type(plant_type) if plant_type else self.knowledge_base
+        susceptible_diseases = self._filter_by_plant_type(plant_type) if plant_type else None
+        if susceptible_diseases is not None:
+            candidate_diseases &= susceptible_diseases
+        
+        disease_order = self._disease_order
+        if top_k is not None and len(candidate_diseases) > top_k:
+            # Only the best few are wanted: evaluate the most promising diseases
+            # first, and stop once even the best remaining one can't make the cut
+            max_severity = max(symptom_severity.values())
+            evaluation_order = sorted(
+                (
+                    (self._confidence_upper_bound(disease, match_counts[disease],
+                                                  self._required_counts[disease],
+                                                  observed_count, max_severity,
+                                                  plant_type, environmental_factors),
+                     disease)
+                    for disease in candidate_diseases
+                ),
+                key=_by_confidence, reverse=True
+            )
+        else:
+            evaluation_order = [(None, disease)
+                                for disease in sorted(candidate_diseases, key=disease_order.__getitem__)]
         
-        for disease, data in candidate_diseases.items():
-            required_symptoms = data['symptoms']
+        # Lowest confidences among the best top_k found so far (min-heap)
+        best_confidences = []
+        
+        for upper_bound, disease in evaluation_order:
+            if best_confidences and len(best_confidences) == top_k and upper_bound < best_confidences[0]:
+                break
+            
+            required_symptoms = self._required_tuples[disease]
+            required_count = self._required_counts[disease]
             
-            # Count how many of the required symptoms are present
-            matching_symptoms = [s for s in required_symptoms if s in observed_symptoms]
+            # Collect the matching symptoms, keeping the knowledge base order.
+            # When every required symptom matched, that is the whole rule
+            if match_counts[disease] == required_count:
+                matching_symptoms = required_symptoms
+            else:
+                matching_symptoms = [s for s in required_symptoms if s in observed_set]
             
-            # If no symptoms match, skip this disease
-            if not matching_symptoms:
-                continue
-                
             # Calculate confidence score using multiple weighted factors
             confidence = self._calculate_confidence(
                 disease, 
                 matching_symptoms, 
-                required_symptoms, 
-                observed_symptoms, 
+                required_count, 
+                observed_count, 
                 symptom_severity,
                 plant_type,
                 environmental_factors
@@ -78,21 +320,59 @@ class InferenceEngine:
             
             # Only include diseases with at least some confidence
             if confidence > 0:
-                results.append({
-                    'disease': disease,
-                    'name': disease.replace('_', ' ').title(),
-                    'confidence': round(confidence * 100, 1),
-                    'matching_symptoms': matching_symptoms,
-                    'description': data['description'],
-                    'treatment': data['treatment'],
-                    'product_recommendations': data.get('product_recommendations', []),
-                    'severity_impact': data.get('severity_impact', {})
-                })
-        
-        # Sort results by confidence score (highest first)
-        results.sort(key=lambda x: x['confidence'], reverse=True)
-        
-        return results
+                candidates.append((confidence, disease, matching_symptoms))
+                if upper_bound is not None:
+                    if len(best_confidences) < top_k:
+                        heapq.heappush(best_confidences, confidence)
+                    else:
+                        heapq.heappushpop(best_confidences, confidence)
+        
+        if top_k is not None:
+            # Restore knowledge base order first, so equal confidences keep
+            # ranking in a stable order however the candidates were evaluated
+            candidates.sort(key=lambda candidate: disease_order[candidate[1]])
+            
+            # Only the best few are wanted: partial selection beats a full sort
+            candidates = heapq.nlargest(top_k, candidates, key=_by_confidence)
+        else:
+            # Sort candidates by raw confidence score (highest first)
+            candidates.sort(key=_by_confidence, reverse=True)
+        
+        return tuple(
+            {
+                'disease': disease,
+                'name': self._display_names[disease],
+                'confidence': round(confidence * 100, 1),
+                'matching_symptoms': matching_symptoms,
+                **self._presentation[disease]
+            }
+            for confidence, disease, matching_symptoms in candidates
+        )
+    
+    def _coerce_severity(self, symptom_severity):
+        """
+        Convert severity values to integers in a single pass.
+        
+        Args:
+            symptom_severity: Dictionary mapping symptoms to severity levels,
+                possibly given as strings (e.g. values read from UI widgets)
+            
+        Returns:
+            Dictionary mapping symptoms to integer severity levels
+        """
+        severity_levels = {}
+        for symptom, severity in symptom_severity.items():
+            # Convert to integer if it's a string
+            if isinstance(severity, str):
+                level = _SEVERITY_STRINGS.get(severity)
+                if level is None:
+                    try:
+                        level = int(float(severity))
+                    except (ValueError, TypeError):
+                        level = 3  # Default to medium severity if conversion fails
+                severity = level
+            severity_levels[symptom] = severity
+        return severity_levels
     
     def _filter_by_plant_type(self, plant_type):
         """
@@ -102,29 +382,13 @@ class InferenceEngine:
             plant_type: Type of plant
             
         Returns:
-            Dictionary of diseases that can affect this plant type
+            Frozenset of diseases that can affect this plant type, or None if
+            the plant type is 'All Plants' or not recognized (all diseases apply)
         """
-        # If plant type is 'All Plants' or not recognized, return all diseases
-        if plant_type == 'All Plants' or plant_type not in PLANT_DISEASE_SUSCEPTIBILITY:
-            return self.knowledge_base
-        
-        # Get diseases that commonly affect this plant type
-        susceptible_diseases = PLANT_DISEASE_SUSCEPTIBILITY.get(plant_type, [])
-        
-        # Include diseases that list this plant type specifically
-        for disease, data in self.knowledge_base.items():
-            if 'plant_types' in data and plant_type in data['plant_types']:
-                susceptible_diseases.append(disease)
-        
-        # Remove duplicates
-        susceptible_diseases = list(set(susceptible_diseases))
-        
-        # Filter knowledge base to only include relevant diseases
-        return {disease: data for disease, data in self.knowledge_base.items() 
-                if disease in susceptible_diseases}
+        return self._plant_to_diseases.get(plant_type)
     
-    def _calculate_confidence(self, disease, matching_symptoms, required_symptoms, 
-                             observed_symptoms, symptom_severity, plant_type,
+    def _calculate_confidence(self, disease, matching_symptoms, required_count, 
+                             observed_count, symptom_severity, plant_type,
                              environmental_factors):
         """
         Calculate a weighted confidence score based on multiple factors.
@@ -132,9 +396,9 @@ class InferenceEngine:
         Args:
             disease: Disease being evaluated
             matching_symptoms: List of symptoms matching between observed and required
-            required_symptoms: List of symptoms required for this disease
-            observed_symptoms: List of symptoms observed in the plant
-            symptom_severity: Dictionary mapping symptoms to severity levels
+            required_count: Number of symptoms required for this disease
+            observed_count: Number of symptoms observed in the plant
+            symptom_severity: Dictionary mapping symptoms to integer severity levels
             plant_type: Type of plant
             environmental_factors: Dictionary with environmental conditions
             
@@ -142,25 +406,15 @@ class InferenceEngine:
             Confidence score between 0 and 1
         """
         # Calculate basic match percentage (symptoms matched / symptoms required)
-        match_percentage = len(matching_symptoms) / len(required_symptoms)
+        match_percentage = len(matching_symptoms) / required_count
         
         # Calculate coverage percentage (symptoms matched / symptoms observed)
-        coverage_percentage = len(matching_symptoms) / len(observed_symptoms)
+        coverage_percentage = len(matching_symptoms) / observed_count
         
         # Calculate severity factor - higher severity gives higher confidence
         # For symptoms that match this disease, get their average severity (normalized to 0-1 scale)
-        # Convert string values to integers to avoid type errors
-        severity_values = []
-        for s in matching_symptoms:
-            severity = symptom_severity.get(s, 3)
-            # Convert to integer if it's a string
-            if isinstance(severity, str):
-                try:
-                    severity = int(float(severity))
-                except (ValueError, TypeError):
-                    severity = 3  # Default to medium severity if conversion fails
-            severity_values.append(severity)
-            
+        # Severity values have already been converted to integers by diagnose()
+        severity_values = [symptom_severity.get(s, 3) for s in matching_symptoms]
         avg_severity = sum(severity_values) / len(severity_values) if severity_values else 3
         severity_factor = avg_severity / 5.0  # Normalize to 0-1 range
         
@@ -187,6 +441,35 @@ class InferenceEngine:
         
         return confidence
     
+    def _confidence_upper_bound(self, disease, match_count, required_count, observed_count,
+                                max_severity, plant_type, environmental_factors):
+        """
+        Calculate an upper bound of a disease's confidence score without
+        collecting its matching symptoms (see _calculate_confidence()).
+        
+        Args:
+            disease: Disease being evaluated
+            match_count: Number of observed symptoms matching the disease
+            required_count: Number of symptoms required for this disease
+            observed_count: Number of symptoms observed in the plant
+            max_severity: Highest severity level among the observed symptoms
+            plant_type: Type of plant
+            environmental_factors: Dictionary with environmental conditions
+            
+        Returns:
+            Value no lower than the disease's confidence score
+        """
+        # Same weighted sum, with the severity average replaced by its maximum
+        # and the specificity average by its maximum possible value (1.0)
+        return (
+            (match_count / required_count * 0.30) + 
+            (match_count / observed_count * 0.20) + 
+            (max_severity / 5.0 * 0.20) + 
+            (1.0 * 0.15) + 
+            (self._calculate_plant_susceptibility(disease, plant_type) * 0.10) + 
+            (self._calculate_environmental_match(disease, environmental_factors) * 0.05)
+        )
+    
     def _calculate_symptom_specificity(self, symptoms, disease):
         """
         Calculate how specific the matching symptoms are to this disease.
@@ -202,23 +485,11 @@ class InferenceEngine:
         if not symptoms:
             return 0
             
-        # Count how many other diseases have each symptom
-        specificity_scores = []
-        
-        for symptom in symptoms:
-            # Count diseases that include this symptom
-            disease_count = sum(1 for d, data in self.knowledge_base.items() 
-                              if symptom in data['symptoms'])
-            
-            # Calculate symptom specificity (inverse of how common it is)
-            # A symptom that appears in only one disease has highest specificity (1.0)
-            # A symptom that appears in all diseases has lowest specificity
-            max_diseases = max(len(self.knowledge_base), 1)  # Avoid division by zero
-            symptom_specificity = 1 - ((disease_count - 1) / max_diseases)
-            specificity_scores.append(symptom_specificity)
+        specificity = self._symptom_specificity
+        specificity_scores = [specificity[symptom] for symptom in symptoms]
         
         # Average specificity across all matching symptoms
-        return sum(specificity_scores) / len(specificity_scores) if specificity_scores else 0
+        return sum(specificity_scores) / len(specificity_scores)
     
     def _calculate_plant_susceptibility(self, disease, plant_type):
         """
@@ -234,17 +505,8 @@ class InferenceEngine:
         if not plant_type or plant_type == 'All Plants':
             return 0.5  # Neutral if no plant type specified
         
-        # Check if this plant type is specifically listed for this disease
-        disease_data = self.knowledge_base.get(disease, {})
-        if 'plant_types' in disease_data and plant_type in disease_data['plant_types']:
-            return 1.0  # Highest susceptibility if specifically listed
-        
-        # Check if disease is in the susceptibility list for this plant type
-        if plant_type in PLANT_DISEASE_SUSCEPTIBILITY and disease in PLANT_DISEASE_SUSCEPTIBILITY[plant_type]:
-            return 0.8  # High susceptibility if in the general list
-        
-        # Lower susceptibility if not specifically listed
-        return 0.3
+        # Lower susceptibility if not listed anywhere for this plant type
+        return self._plant_tier.get((plant_type, disease), 0.3)
     
     def _calculate_environmental_match(self, disease, environmental_factors):
         """
@@ -260,20 +522,8 @@ class InferenceEngine:
         if not environmental_factors:
             return 0.5  # Neutral if no environmental factors provided
             
-        # Ideal environmental conditions for each disease (simplified)
-        disease_environmental_preferences = {
-            'powdery_mildew': {'temperature': 'warm', 'humidity': 'low', 'air_circulation': 'poor'},
-            'downy_mildew': {'temperature': 'cool', 'humidity': 'high', 'leaf_wetness': 'high'},
-            'botrytis_blight': {'temperature': 'cool', 'humidity': 'high', 'air_circulation': 'poor'},
-            'bacterial_blight': {'temperature': 'warm', 'humidity': 'high', 'leaf_wetness': 'high'},
-            'root_rot': {'soil_moisture': 'high', 'drainage': 'poor'},
-            'fusarium_wilt': {'temperature': 'hot', 'soil_moisture': 'low', 'plant_stress': 'high'},
-            'spider_mite_infestation': {'temperature': 'hot', 'humidity': 'low'},
-            'aphid_infestation': {'temperature': 'moderate', 'new_growth': 'yes'}
-        }
-        
         # Get the preferred conditions for this disease
-        preferred_conditions = disease_environmental_preferences.get(disease, {})
+        preferred_conditions = _DISEASE_ENV_PREFS_ITEMS.get(disease, ())
         
         # If no preferred conditions defined for this disease
         if not preferred_conditions:
@@ -283,9 +533,22 @@ class InferenceEngine:
         matching_factors = 0
         total_factors = len(preferred_conditions)
         
-        for factor, preferred_value in preferred_conditions.items():
+        for factor, preferred_value in preferred_conditions:
             if factor in environmental_factors and environmental_factors[factor] == preferred_value:
                 matching_factors += 1
         
         # Calculate match percentage
         return matching_factors / total_factors if total_factors > 0 else 0.5
+
+
+# Engine owned by each diagnose_batch() worker process
+_batch_engine = None
+
+def _init_batch_worker(knowledge_base):
+    """Create the engine used by a diagnose_batch() worker process."""
+    global _batch_engine
+    _batch_engine = InferenceEngine(knowledge_base)
+
+def _diagnose_case(case):
+    """Diagnose a single diagnose_batch() case in a worker process."""
+    return _batch_engine.diagnose(**case)
@@ -5,6 +5,8 @@ This module contains the facts and rules for diagnosing plant diseases
 based on observed symptoms.
 """
 
+import sys
+
 # Define the knowledge base as a dictionary of rules
 # Format: 'disease': {'symptoms': [list of required symptoms], 'description': str, 'treatment': str, 'product_recommendations': list}
 KNOWLEDGE_BASE = {
@@ -323,36 +325,71 @@ SYMPTOM_SEVERITY = {
 }
 
 # Define plant categories and their associated diseases
+# (tuples, so the shared module data can't be mutated by callers)
 PLANT_CATEGORIES = {
-    "Vegetable Plants": [
+    "Vegetable Plants": (
         "Tomato", "Pepper", "Cucumber", "Bean", "Potato", "Lettuce", "Spinach", "Squash", "Watermelon"
-    ],
-    "Fruit Plants": [
+    ),
+    "Fruit Plants": (
         "Apple", "Strawberry", "Grape", "Citrus", "Cherry", "Pear", "Banana"
-    ],
-    "Ornamental Plants": [
+    ),
+    "Ornamental Plants": (
         "Rose", "Hibiscus", "Peony", "Carnation", "Orchid"
-    ],
-    "Herbs": [
+    ),
+    "Herbs": (
         "Basil", "Mint", "Rosemary", "Thyme", "Lavender"
-    ],
-    "Houseplants": [
+    ),
+    "Houseplants": (
         "Succulent", "Fern", "Palm", "Pothos", "African Violet"
-    ]
+    )
 }
 
 # Map plant types to common diseases they are susceptible to
+# (frozensets, so the shared module data can't be mutated by callers)
 PLANT_DISEASE_SUSCEPTIBILITY = {
-    "Tomato": ["powdery_mildew", "leaf_spot", "aphid_infestation", "root_rot", "spider_mite_infestation", "viral_infection", "bacterial_blight", "fusarium_wilt", "botrytis_blight"],
-    "Pepper": ["leaf_spot", "aphid_infestation", "root_rot", "viral_infection", "bacterial_blight"],
-    "Cucumber": ["powdery_mildew", "downy_mildew", "root_rot", "spider_mite_infestation"],
-    "Bean": ["bacterial_blight", "aphid_infestation", "spider_mite_infestation", "fusarium_wilt"],
-    "Rose": ["powdery_mildew", "aphid_infestation", "spider_mite_infestation", "black_spot", "botrytis_blight"],
-    "Citrus": ["aphid_infestation", "nutrient_deficiency", "citrus_greening"],
-    "Apple": ["leaf_spot", "black_spot", "nutrient_deficiency"],
-    "Grape": ["powdery_mildew", "downy_mildew", "botrytis_blight"],
-    "Potato": ["viral_infection", "bacterial_blight", "fusarium_wilt"],
-    "Succulent": ["root_rot"],
-    "Strawberry": ["leaf_spot", "spider_mite_infestation", "botrytis_blight"],
-    "Houseplants": ["spider_mite_infestation", "nutrient_deficiency", "root_rot"]
+    "Tomato": frozenset({"powdery_mildew", "leaf_spot", "aphid_infestation", "root_rot", "spider_mite_infestation", "viral_infection", "bacterial_blight", "fusarium_wilt", "botrytis_blight"}),
+    "Pepper": frozenset({"leaf_spot", "aphid_infestation", "root_rot", "viral_infection", "bacterial_blight"}),
+    "Cucumber": frozenset({"powdery_mildew", "downy_mildew", "root_rot", "spider_mite_infestation"}),
+    "Bean": frozenset({"bacterial_blight", "aphid_infestation", "spider_mite_infestation", "fusarium_wilt"}),
+    "Rose": frozenset({"powdery_mildew", "aphid_infestation", "spider_mite_infestation", "black_spot", "botrytis_blight"}),
+    "Citrus": frozenset({"aphid_infestation", "nutrient_deficiency", "citrus_greening"}),
+    "Apple": frozenset({"leaf_spot", "black_spot", "nutrient_deficiency"}),
+    "Grape": frozenset({"powdery_mildew", "downy_mildew", "botrytis_blight"}),
+    "Potato": frozenset({"viral_infection", "bacterial_blight", "fusarium_wilt"}),
+    "Succulent": frozenset({"root_rot"}),
+    "Strawberry": frozenset({"leaf_spot", "spider_mite_infestation", "botrytis_blight"}),
+    "Houseplants": frozenset({"spider_mite_infestation", "nutrient_deficiency", "root_rot"})
 }
+
+# Intern all symptom codes so every table shares one string object per symptom
+# and dictionary/set lookups between them can match on identity
+ALL_SYMPTOMS = [sys.intern(symptom) for symptom in ALL_SYMPTOMS]
+SYMPTOM_NAMES = {sys.intern(symptom): name for symptom, name in SYMPTOM_NAMES.items()}
+
+# Freeze the rule symptom lists. Tuples rather than frozensets, because the
+# listed order is the order matching symptoms are reported in
+for _info in KNOWLEDGE_BASE.values():
+    _info['symptoms'] = tuple(map(sys.intern, _info['symptoms']))
+
+# Set of all known symptom codes, for O(1) validation of symptom input
+ALL_SYMPTOMS_SET = frozenset(ALL_SYMPTOMS)
+
+def _index_plant_types(knowledge_base):
+    """
+    Map each plant type to the diseases that list it in 'plant_types'.
+    
+    Args:
+        knowledge_base: Dictionary of disease rules
+        
+    Returns:
+        Dictionary mapping plant types to lists of diseases, in knowledge base order
+    """
+    plant_type_to_diseases = {}
+    for disease, info in knowledge_base.items():
+        for plant_type in info.get('plant_types', ()):
+            plant_type_to_diseases.setdefault(plant_type, []).append(disease)
+    return plant_type_to_diseases
+
+# Plant types -> diseases that list them in 'plant_types' (in knowledge base
+# order), so plant-specific rules can be looked up without scanning every rule
+PLANT_TYPE_TO_DISEASES = _index_plant_types(KNOWLEDGE_BASE)
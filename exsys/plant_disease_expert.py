@@ -7,12 +7,57 @@ receive diagnoses.
 """
 
 import os
-from knowledge_base import ALL_SYMPTOMS, SYMPTOM_NAMES
+import re
+import sys
+from knowledge_base import ALL_SYMPTOMS, ALL_SYMPTOMS_SET, SYMPTOM_NAMES
 from inference_engine import InferenceEngine
 
+# Tab completion of symptom codes (readline is not available on every platform)
+try:
+    import readline
+    READLINE_AVAILABLE = True
+except ImportError:
+    READLINE_AVAILABLE = False
+
+# Numbered symptom menu, formatted once since the symptom list never changes
+_SYMPTOM_MENU_TEXT = "\n".join(
+    f"{i:2}. {SYMPTOM_NAMES[symptom_code]}" for i, symptom_code in enumerate(ALL_SYMPTOMS, 1)
+)
+
+# Display line of each symptom in the diagnosis results, resolved once
+_SYMPTOM_BULLETS = {symptom_code: f"- {SYMPTOM_NAMES[symptom_code]}" for symptom_code in ALL_SYMPTOMS}
+
+# Menu number of each symptom
+_SYMPTOM_NUMBERS = {symptom_code: i for i, symptom_code in enumerate(ALL_SYMPTOMS, 1)}
+
+# Prefix tree over the symptom codes. Each node maps the next character to its
+# child node, and None to the codes (in menu order) that share the node's prefix
+_SYMPTOM_TRIE = {None: list(ALL_SYMPTOMS)}
+for _symptom_code in ALL_SYMPTOMS:
+    _node = _SYMPTOM_TRIE
+    for _char in _symptom_code:
+        _node = _node.setdefault(_char, {None: []})
+        _node[None].append(_symptom_code)
+del _symptom_code, _node, _char
+
+# Valid symptom selection input: optionally signed numbers separated by
+# whitespace (as int() accepts them, so '-1' is reported as out of range)
+_SELECTION_RE = re.compile(r'(?:[+-]?\d+(?:\s+|\Z))*')
+
+# ANSI escape sequence that clears the screen and moves the cursor home
+_CLEAR_SEQUENCE = '\x1b[2J\x1b[H'
+
+# Older Windows consoles don't interpret ANSI escape sequences, so use `cls` there
+_CLEAR_WITH_CLS = os.name == 'nt'
+
 def clear_screen():
     """Clear the console screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    if _CLEAR_WITH_CLS:
+        os.system('cls')
+    else:
+        # Write the escape sequence directly instead of spawning `clear`
+        sys.stdout.write(_CLEAR_SEQUENCE)
+        sys.stdout.flush()
 
 def print_header():
     """Print the application header."""
@@ -21,6 +66,48 @@ def print_header():
     print("=" * 80 + "\n")
     print("This system helps diagnose plant diseases based on observed symptoms.\n")
 
+def symptoms_with_prefix(prefix):
+    """
+    Find the symptom codes that start with a prefix.
+    
+    Args:
+        prefix: Start of a symptom code (spaces are treated as underscores)
+        
+    Returns:
+        List of matching symptom codes, in menu order
+    """
+    node = _SYMPTOM_TRIE
+    for char in prefix.replace(' ', '_'):
+        node = node.get(char)
+        if node is None:
+            return []
+    return node[None]
+
+def complete_symptom(text, state):
+    """
+    readline completer for symptom codes.
+    
+    Args:
+        text: Text typed so far for the current word
+        state: Index of the completion being requested
+        
+    Returns:
+        The state-th symptom code starting with text, or None when exhausted
+    """
+    matches = symptoms_with_prefix(text)
+    return matches[state] if state < len(matches) else None
+
+def setup_completion():
+    """Enable tab completion of symptom codes at the input prompts."""
+    if not READLINE_AVAILABLE:
+        return
+    readline.set_completer(complete_symptom)
+    # macOS ships readline as a libedit wrapper, which uses its own bind syntax
+    if 'libedit' in (readline.__doc__ or ''):
+        readline.parse_and_bind('bind ^I rl_complete')
+    else:
+        readline.parse_and_bind('tab: complete')
+
 def get_user_symptoms():
     """
     Present a menu of symptoms and let the user select which ones they observe.
@@ -29,41 +116,52 @@ def get_user_symptoms():
         List of selected symptom codes
     """
     selected_symptoms = []
+    selected_set = set()  # Same symptoms as a set, for O(1) duplicate checks
+    selected_names = []  # Display names of the selected symptoms, in the same order
     
     print("\nPlease indicate which symptoms you observe in your plant:")
     print("Select symptoms by entering their numbers (separated by spaces).")
+    print("Type the start of a symptom (e.g. 'yellow') to look up matching numbers,")
+    print("or enter symptom codes directly (press Tab to complete them).")
     print("Enter 'done' when finished.\n")
     
-    # Display symptoms in groups of 5 for readability
-    for i, symptom_code in enumerate(ALL_SYMPTOMS, 1):
-        print(f"{i:2}. {SYMPTOM_NAMES[symptom_code]}")
+    print(_SYMPTOM_MENU_TEXT)
     
     while True:
-        print("\nCurrently selected symptoms:", end=" ")
-        if selected_symptoms:
-            selected_names = [SYMPTOM_NAMES[s] for s in selected_symptoms]
-            print(", ".join(selected_names))
-        else:
-            print("None")
+        print("\nCurrently selected symptoms:", ", ".join(selected_names) or "None")
             
         choice = input("\nEnter symptom numbers or 'done': ").strip().lower()
         
         if choice == 'done':
             break
             
-        try:
-            # Parse multiple numbers separated by spaces
-            selections = [int(x) for x in choice.split()]
-            
-            for selection in selections:
-                if 1 <= selection <= len(ALL_SYMPTOMS):
-                    symptom_code = ALL_SYMPTOMS[selection - 1]
-                    if symptom_code not in selected_symptoms:
-                        selected_symptoms.append(symptom_code)
-                else:
-                    print(f"Invalid selection: {selection}. Please enter numbers between 1 and {len(ALL_SYMPTOMS)}.")
-        except ValueError:
-            print("Invalid input. Please enter numbers or 'done'.")
+        tokens = choice.split()
+        if tokens and all(token in ALL_SYMPTOMS_SET for token in tokens):
+            # Symptom codes typed (or tab-completed) directly
+            selections = [_SYMPTOM_NUMBERS[token] for token in tokens]
+        elif _SELECTION_RE.fullmatch(choice):
+            # Multiple numbers separated by spaces, validated up front
+            # rather than failing on a bad token
+            selections = map(int, tokens)
+        else:
+            suggestions = symptoms_with_prefix(choice)
+            if suggestions:
+                print(f"\nSymptoms starting with '{choice}':")
+                for symptom_code in suggestions:
+                    print(f"{_SYMPTOM_NUMBERS[symptom_code]:2}. {SYMPTOM_NAMES[symptom_code]} ({symptom_code})")
+            else:
+                print("Invalid input. Please enter numbers or 'done'.")
+            continue
+        
+        for selection in selections:
+            if 1 <= selection <= len(ALL_SYMPTOMS):
+                symptom_code = ALL_SYMPTOMS[selection - 1]
+                if symptom_code not in selected_set:
+                    selected_set.add(symptom_code)
+                    selected_symptoms.append(symptom_code)
+                    selected_names.append(SYMPTOM_NAMES[symptom_code])
+            else:
+                print(f"Invalid selection: {selection}. Please enter numbers between 1 and {len(ALL_SYMPTOMS)}.")
     
     return selected_symptoms
 
@@ -79,29 +177,30 @@ def display_diagnosis(results):
         print("Consider adding more symptoms or consulting with a plant specialist.")
         return
     
-    print("\n" + "=" * 80)
-    print(" " * 30 + "DIAGNOSIS RESULTS")
-    print("=" * 80 + "\n")
+    # Collect the whole report and write it at once instead of line by line
+    lines = ["\n" + "=" * 80, " " * 30 + "DIAGNOSIS RESULTS", "=" * 80 + "\n"]
     
     # Display top 3 matches or fewer if less available
     for i, result in enumerate(results[:3], 1):
-        print(f"Diagnosis #{i}: {result['name']}")
-        print(f"Confidence: {result['confidence']}%")
-        print(f"\nDescription: {result['description']}")
-        print(f"\nRecommended Treatment: {result['treatment']}")
-        print("\nMatching Symptoms:")
-        for symptom in result['matching_symptoms']:
-            print(f"- {SYMPTOM_NAMES[symptom]}")
-        print("\n" + "-" * 80 + "\n")
+        lines.append(f"Diagnosis #{i}: {result['name']}")
+        lines.append(f"Confidence: {result['confidence']}%")
+        lines.append(f"\nDescription: {result['description']}")
+        lines.append(f"\nRecommended Treatment: {result['treatment']}")
+        lines.append("\nMatching Symptoms:")
+        lines.extend(map(_SYMPTOM_BULLETS.__getitem__, result['matching_symptoms']))
+        lines.append("\n" + "-" * 80 + "\n")
     
     # If there are more results, mention them
     if len(results) > 3:
-        print(f"There are {len(results) - 3} more potential diagnoses with lower confidence.")
+        lines.append(f"There are {len(results) - 3} more potential diagnoses with lower confidence.")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 def main():
     """Main application function."""
     clear_screen()
     print_header()
+    setup_completion()
     
     # Create inference engine
     engine = InferenceEngine()
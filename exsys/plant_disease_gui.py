@@ -8,30 +8,39 @@ diagnosis expert system using Tkinter with a sleek, professional design.
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
 import customtkinter as ctk  # Modern UI toolkit based on tkinter
-from PIL import Image, ImageTk  # For handling images
-from knowledge_base import ALL_SYMPTOMS, SYMPTOM_NAMES, SYMPTOM_SEVERITY, PLANT_CATEGORIES
+from PIL import Image  # For handling images
+from knowledge_base import (ALL_SYMPTOMS, SYMPTOM_NAMES, SYMPTOM_SEVERITY, PLANT_CATEGORIES,
+                            PLANT_TYPE_TO_DISEASES)
 from inference_engine import InferenceEngine
 import json
 import os
 import datetime
 import re
-from functools import partial
+from functools import lru_cache, partial
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import io
 import sys
-from contextlib import redirect_stdout
+from contextlib import contextmanager, redirect_stdout
 import webbrowser  # For opening links to more information
 import platform  # For OS detection
+import threading  # For running diagnoses off the UI thread
+import queue  # For handing worker results back to the UI thread
+import importlib.util  # For optional dependency checks
+import logging  # For reporting errors in UI callbacks
 
-# For PDF export
+# For PDF export (only looked up here; reportlab is imported when exporting)
+REPORTLAB_AVAILABLE = importlib.util.find_spec("reportlab") is not None
+
+# Faster JSON encoding for exports (optional; falls back to the json module)
 try:
-    from reportlab.lib.pagesizes import letter
-    from reportlab.lib import colors
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, ListItem, ListFlowable, Image as ReportLabImage
-    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.lib.units import inch
-    REPORTLAB_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    REPORTLAB_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Errors caught in UI callbacks are logged rather than raised into Tk
+logger = logging.getLogger(__name__)
 
 # Configure customtkinter appearance
 ctk.set_appearance_mode("Light")  # Modes: "System" (standard), "Dark", "Light"
@@ -43,6 +52,13 @@ APP_NAME = "Plant Disease Expert System"
 DEFAULT_FONT = "Segoe UI Variable" if platform.system() == "Windows" else ("SF Pro Text" if platform.system() == "Darwin" else "Ubuntu")
 DEFAULT_PADDING = 10
 CORNER_RADIUS = 8
+SYMPTOM_ROW_BATCH_SIZE = 12  # Symptom rows created per display pass (rest follow when idle)
+FADE_FRAME_DELAY = 16  # Milliseconds between frames of the tab fade animation
+PROGRESS_STEP = 0.05  # Progress bar advance per frame of the diagnosis animation
+PROGRESS_FRAME_DELAY = 50  # Milliseconds between frames of the diagnosis animation
+SETTINGS_APPLY_DELAY = 50  # Milliseconds to gather setting changes before applying them
+HISTORY_SELECT_DELAY = 120  # Milliseconds a history row must stay selected before it is shown
+IMAGE_POLL_DELAY = 20  # Milliseconds between checks for a finished background image load
 
 # Import required assets
 ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets")
@@ -80,13 +96,118 @@ UI_COLORS = {
     'delete_hover': "#CC0000",     # Darker red - hover color for delete button
 }
 
-# Advanced settings
-SETTINGS = {
-    'animations': True,
-    'tooltips': True,
-    'auto_save': True,
-    'expert_mode': False,
-    'auto_update_check': True
+# Severity level colors, indexed by level (0-5)
+SEVERITY_COLORS = (
+    "gray80",
+    UI_COLORS['low_severity'],
+    UI_COLORS['low_severity'],
+    UI_COLORS['medium_severity'],
+    UI_COLORS['medium_severity'],
+    UI_COLORS['high_severity']
+)
+
+# Severity description of a symptom row as (text, color), indexed by level (0-5)
+_SEVERITY_LABEL_STYLES = (("Not present", UI_COLORS['text_secondary']),) + tuple(
+    (SYMPTOM_SEVERITY[level], SEVERITY_COLORS[level]) for level in range(1, 6)
+)
+_SEVERITY_UNKNOWN_STYLE = ("Not specified", UI_COLORS['text_secondary'])
+
+# Severity level button colors, indexed by level (1-5) and then by whether
+# the button is the selected level
+_SEVERITY_BUTTON_STYLES = (None,) + tuple(
+    (
+        {'fg_color': "transparent", 'text_color': color},
+        {'fg_color': color, 'text_color': UI_COLORS['text_light']}
+    )
+    for color in SEVERITY_COLORS[1:]
+)
+
+# Plant guide rows, built once: (category, plants listed, "view more" text or None)
+PLANT_GUIDE_LISTED = 5  # Plants listed per category in the plant guide
+_PLANT_GUIDE_ROWS = tuple(
+    (
+        category,
+        plants[:PLANT_GUIDE_LISTED],
+        f"View {len(plants) - PLANT_GUIDE_LISTED} more {category.lower()}..." if len(plants) > PLANT_GUIDE_LISTED else None
+    )
+    for category, plants in PLANT_CATEGORIES.items()
+)
+
+# Plants of each category in alphabetical order, for the plant categories dialog
+_PLANT_CATEGORIES_SORTED = {category: tuple(sorted(plants)) for category, plants in PLANT_CATEGORIES.items()}
+
+# Shared styling of the plant guide's plant and "view more" buttons
+_PLANT_BTN_KW = {
+    'fg_color': "transparent",
+    'text_color': UI_COLORS['primary'],
+    'hover_color': UI_COLORS['divider'],
+    'anchor': "w"
+}
+_MORE_BTN_KW = dict(_PLANT_BTN_KW, text_color=UI_COLORS['secondary'])
+
+# Symptom row card colors, normally and while the pointer is over the row
+_SYMPTOM_ROW_STYLE = {'fg_color': UI_COLORS['card_bg'], 'border_color': UI_COLORS['border']}
+_SYMPTOM_ROW_HOVER_STYLE = {'fg_color': UI_COLORS['hover'], 'border_color': UI_COLORS['primary_light']}
+
+# Styling of the text tags used in the results and history textboxes
+_TEXT_TAG_STYLES = {
+    'title': {'font': (DEFAULT_FONT, 18, "bold")},
+    'subtitle': {'font': (DEFAULT_FONT, 14, "bold")},
+    'confidence_high': {'font': (DEFAULT_FONT, 13, "bold"), 'foreground': UI_COLORS['success']},
+    'confidence_medium': {'font': (DEFAULT_FONT, 13, "bold"), 'foreground': UI_COLORS['warning']},
+    'confidence_low': {'font': (DEFAULT_FONT, 13, "bold"), 'foreground': UI_COLORS['error']},
+    'normal': {'font': (DEFAULT_FONT, 12)},
+    'bullet': {'font': (DEFAULT_FONT, 12, "bold")},
+    'italic': {'font': (DEFAULT_FONT, 12, "italic")},
+    'divider': {'font': (DEFAULT_FONT, 12), 'foreground': UI_COLORS['text_secondary']},
+    'link': {'font': (DEFAULT_FONT, 12, "underline"), 'foreground': UI_COLORS['primary']}
+}
+
+# Text tags coloring severity levels (indexed 1-5), severity impact levels
+# and product types in the results view
+_SEVERITY_TAGS = (
+    None,
+    "confidence_low",
+    "confidence_low",
+    "confidence_medium",
+    "confidence_medium",
+    "confidence_high"
+)
+_IMPACT_LEVEL_TAGS = {'low': "confidence_low", 'medium': "confidence_medium"}  # Others: high
+_PRODUCT_TYPE_TAGS = {'Organic': "confidence_high", 'Chemical': "confidence_low"}  # Others: medium
+
+# Dividers between the diseases of a diagnosis, in the results view and in exports
+_RESULT_DIVIDER = "•" + "─" * 48 + "•\n\n"
+_EXPORT_DIVIDER = "-" * 50
+_TEXT_EXPORT_TITLE_RULE = "=" * 50 + "\n\n"
+_TEXT_EXPORT_DIVIDER = f"\n{_EXPORT_DIVIDER}\n\n"
+
+# Generic care tips shown for every plant, preformatted as one bulleted block
+_GENERIC_CARE_TIPS = "\n".join((
+    "• Ensure proper watering - check soil moisture before watering",
+    "• Provide adequate light according to plant needs",
+    "• Monitor for pests and diseases regularly",
+    "• Use appropriate fertilizer during growing season",
+    "• Maintain good air circulation to prevent fungal diseases"
+))
+
+# Advanced settings, with their defaults kept as (setting, value) pairs
+_DEFAULT_SETTINGS = (
+    ('animations', True),
+    ('tooltips', True),
+    ('auto_save', True),
+    ('expert_mode', False),
+    ('auto_update_check', True)
+)
+SETTINGS = dict(_DEFAULT_SETTINGS)
+
+# Tooltip descriptions of the settings in the settings dialog
+_SETTING_DESCRIPTIONS = {
+    'animations': "Enable UI animations for smooth transitions",
+    'tooltips': "Show helpful tooltips when hovering over elements",
+    'auto_save': "Automatically save your selections",
+    'expert_mode': "Enable advanced features for experienced users",
+    'auto_update_check': "Check for updates when application starts"
 }
 
 # Add responsive scaling option at the top of the file
@@ -94,10 +215,331 @@ SETTINGS = {
 DEFAULT_SCALING_FACTOR = 1.0  # Base scaling factor
 SCALING_ENABLED = True  # Enable responsive scaling
 
+# Shared CTkFont objects, keyed by (family, size, weight, slant). Creating a Tk
+# font is expensive, and the UI only uses a handful of distinct fonts
+_FONT_CACHE = {}
+
+def get_font(size, weight="normal", slant="roman", family=DEFAULT_FONT):
+    """
+    Get a shared CTkFont, creating it on first use.
+    
+    Args:
+        size: Font size
+        weight: "normal" or "bold"
+        slant: "roman" or "italic"
+        family: Font family (None for the theme's default family)
+        
+    Returns:
+        CTkFont instance shared by every widget using the same font
+    """
+    key = (family, size, weight, slant)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = _FONT_CACHE[key] = ctk.CTkFont(family=family, size=size, weight=weight, slant=slant)
+    return font
+
+@lru_cache(maxsize=256)
+def adjust_color_opacity(hex_color, opacity):
+    """
+    Tint a hex color towards white, as if drawn with opacity over a white background.
+    
+    Args:
+        hex_color: Color as "#rrggbb"
+        opacity: Opacity between 0 (white) and 1 (the color itself)
+        
+    Returns:
+        Tinted color as "#rrggbb"
+    """
+    # Remove # if present
+    hex_color = hex_color.lstrip('#')
+    # Convert hex to RGB
+    r = int(hex_color[0:2], 16)
+    g = int(hex_color[2:4], 16)
+    b = int(hex_color[4:6], 16)
+    # Calculate the tint (mix with white)
+    r = int(r + (255 - r) * (1 - opacity))
+    g = int(g + (255 - g) * (1 - opacity))
+    b = int(b + (255 - b) * (1 - opacity))
+    # Convert back to hex
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+def normalize_severity(value):
+    """
+    Get a symptom severity as an integer level.
+    
+    Args:
+        value: Severity as held by a severity variable or history entry (int or str)
+        
+    Returns:
+        Severity level from 1 to 5, or 3 (moderate) for an invalid value
+    """
+    try:
+        value = int(value)
+    except (ValueError, TypeError):
+        return 3
+    return value if 1 <= value <= 5 else 3
+
+def confidence_tag(confidence):
+    """
+    Get the text tag that colors a confidence score.
+    
+    Args:
+        confidence: Confidence percentage of a diagnosis
+        
+    Returns:
+        "confidence_high" (75% and up), "confidence_medium" (50% and up) or "confidence_low"
+    """
+    if confidence >= 75:
+        return "confidence_high"
+    return "confidence_medium" if confidence >= 50 else "confidence_low"
+
+def encode_json(data):
+    """
+    Serialize data as indented JSON, using orjson when it is installed.
+    
+    Args:
+        data: JSON-compatible data to serialize
+        
+    Returns:
+        UTF-8 encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def decode_json(payload):
+    """
+    Parse JSON data, using orjson when it is installed.
+    
+    Args:
+        payload: UTF-8 encoded JSON bytes
+        
+    Returns:
+        Parsed data
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(payload)
+    return json.loads(payload)
+
+def make_diagnosis_key(symptoms, symptom_severity, plant_type, environmental_factors):
+    """
+    Get a hashable key of a diagnosis's inputs, to tell when they repeat.
+    
+    Args:
+        symptoms: Selected symptom codes
+        symptom_severity: Dictionary of symptom -> severity value
+        plant_type: Selected plant type
+        environmental_factors: Dictionary of environmental conditions, or None
+        
+    Returns:
+        Tuple that compares equal for the same inputs in any order
+    """
+    return (
+        frozenset(symptoms),
+        tuple(sorted(symptom_severity.items())),
+        plant_type,
+        tuple(sorted(environmental_factors.items())) if environmental_factors else None
+    )
+
+@lru_cache(maxsize=256)
+def format_timestamp(timestamp):
+    """
+    Format a diagnosis timestamp for display and export.
+    
+    History entries are shown in the table, in the details view and in
+    every export, so each entry's timestamp is only formatted once.
+    
+    Args:
+        timestamp: datetime of the diagnosis
+        
+    Returns:
+        Timestamp as "YYYY-MM-DD HH:MM:SS"
+    """
+    return timestamp.strftime("%Y-%m-%d %H:%M:%S")
+
+@lru_cache(maxsize=None)
+def symptom_severity_label(symptom, severity):
+    """
+    Get the export text of an observed symptom and its severity, formatting it once.
+    
+    Args:
+        symptom: Symptom code
+        severity: Severity level (1-5)
+        
+    Returns:
+        Symptom name followed by its severity and severity description
+    """
+    return f"{SYMPTOM_NAMES[symptom]} (Severity: {severity}/5 - {SYMPTOM_SEVERITY[severity]})"
+
+@lru_cache(maxsize=None)
+def symptom_severity_segments(symptom, severity):
+    """
+    Get the results text of a matching symptom and its severity, formatting it once.
+    
+    Args:
+        symptom: Symptom code
+        severity: Severity level (1-5)
+        
+    Returns:
+        Tuple of alternating text and tag values for Text.insert
+    """
+    return (
+        f"• {SYMPTOM_NAMES[symptom]}\n", "bullet",
+        "  Severity: ", "normal",
+        f"{severity}/5 - {SYMPTOM_SEVERITY[severity]}\n", _SEVERITY_TAGS[severity]
+    )
+
+@lru_cache(maxsize=1)
+def get_pdf_styles():
+    """
+    Get the paragraph styles of the PDF export, building them on the first export.
+    
+    Returns:
+        Tuple of (stylesheet including the custom header styles,
+        dictionary of confidence tag -> confidence ParagraphStyle)
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(
+        name='GreenHeader',
+        parent=styles['Heading2'],
+        textColor=colors.HexColor(UI_COLORS['primary'])
+    ))
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading3'],
+        textColor=colors.HexColor(UI_COLORS['primary_dark'])
+    ))
+    
+    confidence_styles = {
+        tag: ParagraphStyle(name=name, parent=styles['Normal'], textColor=color)
+        for tag, name, color in (
+            ("confidence_high", 'ConfidenceHigh', colors.green),
+            ("confidence_medium", 'ConfidenceMedium', colors.orange),
+            ("confidence_low", 'ConfidenceLow', colors.red)
+        )
+    }
+    return styles, confidence_styles
+
+# Shared CTkImage objects, keyed by (path, size); None for a missing file.
+# Least recently used entries are dropped once IMAGE_CACHE_SIZE is reached
+IMAGE_CACHE_SIZE = 64
+_IMAGE_CACHE = OrderedDict()
+
+# Single worker thread that decodes image files off the UI thread
+_IMAGE_LOADER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="image-loader")
+
+def _cache_image(key, image):
+    """Store an image in the LRU cache, evicting the oldest entry if it is full."""
+    _IMAGE_CACHE[key] = image
+    if len(_IMAGE_CACHE) > IMAGE_CACHE_SIZE:
+        _IMAGE_CACHE.popitem(last=False)
+    return image
+
+def _decode_image(path, size):
+    """
+    Decode an image file and shrink it to at most twice the display size.
+    
+    Runs on the loader thread. Twice the size keeps HiDPI displays sharp while
+    leaving customtkinter only a small image to rescale.
+    
+    Args:
+        path: Path to the image file
+        size: (width, height) the image will be displayed at
+        
+    Returns:
+        Decoded PIL image
+    """
+    image = Image.open(path)
+    image.thumbnail((size[0] * 2, size[1] * 2), getattr(Image, "Resampling", Image).LANCZOS)
+    return image
+
+def get_image(path, size):
+    """
+    Get a shared CTkImage for an image file, loading it on first use.
+    
+    Args:
+        path: Path to the image file
+        size: (width, height) to display the image at
+        
+    Returns:
+        CTkImage (scaled by customtkinter for HiDPI displays), or None if the file doesn't exist
+    """
+    key = (path, size)
+    if key in _IMAGE_CACHE:
+        _IMAGE_CACHE.move_to_end(key)
+        return _IMAGE_CACHE[key]
+    image = ctk.CTkImage(light_image=_decode_image(path, size), size=size) if os.path.exists(path) else None
+    return _cache_image(key, image)
+
+def get_image_async(root, path, size, callback):
+    """
+    Get a shared CTkImage without blocking the UI on decoding the file.
+    
+    A cached image is passed to the callback straight away. Otherwise the file
+    is decoded on the loader thread, which is polled from the Tk thread, and the
+    CTkImage is built there, since Tk may only be used from that thread.
+    
+    Args:
+        root: Tk widget used to get back onto the UI thread
+        path: Path to the image file
+        size: (width, height) to display the image at
+        callback: Called on the UI thread with the CTkImage, or None if the
+                  file doesn't exist or can't be decoded
+    """
+    key = (path, size)
+    if key in _IMAGE_CACHE:
+        _IMAGE_CACHE.move_to_end(key)
+        callback(_IMAGE_CACHE[key])
+        return
+    if not os.path.exists(path):
+        callback(_cache_image(key, None))
+        return
+    
+    def finish(future):
+        # Polled from the Tk thread until the loader thread is done
+        if not future.done():
+            root.after(IMAGE_POLL_DELAY, finish, future)
+            return
+        try:
+            decoded = future.result()
+        except Exception:
+            callback(None)
+            return
+        # Another request may have loaded the same image meanwhile
+        image = _IMAGE_CACHE.get(key) or _cache_image(key, ctk.CTkImage(light_image=decoded, size=size))
+        callback(image)
+    
+    finish(_IMAGE_LOADER.submit(_decode_image, path, size))
+
+class TkVarDict(dict):
+    """
+    Dictionary of Tk variables that creates each variable on first access.
+    
+    Symptom rows are built on demand, so most symptoms never need a Tcl
+    variable. A missing key reads as `default`, which callers that reset
+    every variable also update so variables created later match the rest.
+    """
+    def __init__(self, factory, default):
+        super().__init__()
+        self.factory = factory
+        self.default = default
+    
+    def __missing__(self, key):
+        var = self[key] = self.factory(value=self.default)
+        return var
+
 class CreateToolTip:
     """
     Create a tooltip for a given widget with customized appearance.
     """
+    # One tooltip window shared by every tooltip, created hidden on first use
+    _shared_window = None
+    _shared_frame = None
+    _shared_label = None
+    
     def __init__(self, widget, text='Tooltip', bg_color=None, text_color=None, font=None):
         self.widget = widget
         self.text = text
@@ -112,6 +554,10 @@ class CreateToolTip:
         self.scheduled_id = None
     
     def on_enter(self, event=None):
+        # Tooltips may have been turned off since this one was created
+        if not SETTINGS['tooltips']:
+            return
+        
         # Schedule tooltip display after a small delay
         try:
             if self.scheduled_id:
@@ -136,37 +582,28 @@ class CreateToolTip:
     def show_tooltip(self):
         """Display the tooltip with animation."""
         try:
-            # Get widget's screen position
-            x, y, _, _ = self.widget.bbox("insert")
-            x += self.widget.winfo_rootx() + 25
-            y += self.widget.winfo_rooty() + 25
-            
-            # Create tooltip window
-            self.tooltip = tk.Toplevel(self.widget)
-            self.tooltip.wm_overrideredirect(True)
-            self.tooltip.wm_geometry(f"+{x}+{y}")
-            
-            # Create tooltip content
-            frame = ctk.CTkFrame(
-                self.tooltip,
-                fg_color=self.bg_color,
-                corner_radius=6,
-                border_width=0
-            )
-            frame.pack(ipadx=3, ipady=3)
-            
-            label = ctk.CTkLabel(
-                frame,
+            # Position just below the widget (from its screen position, as most
+            # widgets have no insert cursor to take a bbox of)
+            x = self.widget.winfo_rootx() + 25
+            y = self.widget.winfo_rooty() + self.widget.winfo_height() + 5
+            
+            # Fill in and move the shared tooltip window
+            window, frame, label = self._get_shared_window(self.widget)
+            frame.configure(fg_color=self.bg_color)
+            label.configure(
                 text=self.text,
                 text_color=self.text_color,
-                font=ctk.CTkFont(family=self.font[0], size=self.font[1]),
-                justify=tk.LEFT
+                font=get_font(self.font[1], family=self.font[0])
             )
-            label.pack(padx=8, pady=6)
+            window.wm_geometry(f"+{x}+{y}")
             
-            # Add fade-in effect
-            self.tooltip.attributes("-alpha", 0.0)
-            self._fade_in()
+            # Add fade-in effect (shown at once when animations are turned off)
+            window.attributes("-alpha", 0.0 if SETTINGS['animations'] else 1.0)
+            window.deiconify()
+            window.lift()
+            self.tooltip = window
+            if SETTINGS['animations']:
+                self._fade_in()
             
             # Auto-close after 5 seconds
             self.scheduled_id = self.widget.after(5000, self.hide_tooltip)
@@ -174,23 +611,58 @@ class CreateToolTip:
             # Widget might have been destroyed during tooltip creation
             self.cleanup()
     
+    @classmethod
+    def _get_shared_window(cls, widget):
+        """
+        Get the shared tooltip window, creating it on first use.
+        
+        Args:
+            widget: Any widget of the application (used to find the root window)
+            
+        Returns:
+            Tuple of (window, frame, label) of the hidden tooltip window
+        """
+        if cls._shared_window is None or not cls._shared_window.winfo_exists():
+            # Parented to the root, so closing a dialog doesn't take it along
+            window = tk.Toplevel(widget._root())
+            window.withdraw()
+            window.wm_overrideredirect(True)
+            
+            frame = ctk.CTkFrame(window, corner_radius=6, border_width=0)
+            frame.pack(ipadx=3, ipady=3)
+            
+            label = ctk.CTkLabel(frame, text="", justify=tk.LEFT)
+            label.pack(padx=8, pady=6)
+            
+            cls._shared_window, cls._shared_frame, cls._shared_label = window, frame, label
+        return cls._shared_window, cls._shared_frame, cls._shared_label
+    
+    @classmethod
+    def hide_shared_window(cls):
+        """Hide the shared tooltip window, whichever tooltip is showing in it."""
+        try:
+            if cls._shared_window is not None and cls._shared_window.winfo_exists():
+                cls._shared_window.withdraw()
+        except tk.TclError:
+            pass
+    
     def _fade_in(self, alpha=0.0):
         """Animate the tooltip fade-in."""
         try:
             if self.tooltip:
                 if alpha < 1.0:
-                    alpha += 0.1
+                    alpha += 0.25
                     self.tooltip.attributes("-alpha", alpha)
-                    self.tooltip.after(20, lambda: self._fade_in(alpha))
+                    self.tooltip.after(30, self._fade_in, alpha)
         except (tk.TclError, AttributeError):
             # Widget might have been destroyed during animation
             self.cleanup()
     
     def hide_tooltip(self):
-        """Hide and destroy the tooltip."""
+        """Hide the tooltip (the shared window is kept for the next one)."""
         try:
             if self.tooltip:
-                self.tooltip.destroy()
+                self.tooltip.withdraw()
                 self.tooltip = None
         except (tk.TclError, AttributeError):
             # Widget might have been destroyed during hiding
@@ -206,10 +678,11 @@ class CreateToolTip:
         except (tk.TclError, AttributeError):
             pass
             
-        # Destroy tooltip if it exists
+        # Hide tooltip if it is showing
         try:
             if self.tooltip and self.tooltip.winfo_exists():
-                self.tooltip.destroy()
+                self.tooltip.withdraw()
+            self.tooltip = None
         except (tk.TclError, AttributeError):
             pass
             
@@ -251,35 +724,60 @@ class PlantDiseaseExpertGUI:
         
         # Add debounce variables for search performance
         self._search_after_id = None
-        self._last_search_time = 0
         self._debounce_delay = 300  # milliseconds
         
-        # Create variables for all symptoms
-        self.symptom_vars = {symptom: tk.BooleanVar(value=False) for symptom in ALL_SYMPTOMS}
-        self.severity_vars = {symptom: tk.StringVar(value="0") for symptom in ALL_SYMPTOMS}
-        
-        # Add severity descriptions and colors for performance
-        self.severity_descriptions = {
-            0: "None",
-            1: "Very mild",
-            2: "Mild",
-            3: "Moderate",
-            4: "Severe",
-            5: "Very severe"
+        # Settings changed since they were last applied, applied together shortly after
+        self._settings_dirty = set()
+        self._settings_apply_pending = False
+        
+        # Snackbar notification widgets, created on first use
+        self._snackbar = None
+        self._snackbar_shadow = None
+        self._snackbar_label = None
+        self._snackbar_after_id = None
+        
+        # Overlay colors of the tab fade animation, from transparent to opaque
+        self._fade_palette = tuple(
+            adjust_color_opacity(UI_COLORS['bg_light'], alpha / 10) for alpha in range(11)
+        )
+        
+        # Other derived colors, computed once: the snackbar shadow (20% opacity),
+        # lighter backgrounds of the confidence highlights, and the hover colors
+        # of the severity level buttons
+        self._shadow_color = adjust_color_opacity(UI_COLORS['shadow'], 0.2)
+        self._confidence_highlight_colors = {
+            "confidence_high": adjust_color_opacity(UI_COLORS['success'], 0.2),
+            "confidence_medium": adjust_color_opacity(UI_COLORS['warning'], 0.2),
+            "confidence_low": adjust_color_opacity(UI_COLORS['error'], 0.2)
         }
+        self._severity_hover_colors = tuple(adjust_color_opacity(color, 0.8) for color in SEVERITY_COLORS)
         
-        self.severity_colors = {
-            0: "gray80",
-            1: UI_COLORS['low_severity'],
-            2: UI_COLORS['low_severity'],
-            3: UI_COLORS['medium_severity'],
-            4: UI_COLORS['medium_severity'],
-            5: UI_COLORS['high_severity']
-        }
+        # Inputs of the last diagnosis, to recognise an unchanged re-run
+        self._last_diagnosis_key = None
+        self._diagnosis_running = False  # Only one diagnosis runs at a time
+        
+        # Symptom variables, created as symptoms are displayed or selected
+        self.symptom_vars = TkVarDict(tk.BooleanVar, False)
+        self.severity_vars = TkVarDict(tk.StringVar, "0")
+        self._bulk_update = False  # Set while many symptoms are (un)checked at once
+        self._batch_depth = 0  # Nesting depth of _batched_updates blocks
+        self._pending_configs = {}  # Widget -> merged configure() options of the open batch
+        self._pending_severity_updates = {}  # Symptom -> after_idle id of its severity restyling
         
         # Store diagnosis history
         self.diagnosis_history = []
         
+        # Rendered history details (text and tag pairs), keyed by timestamp.
+        # History entries never change, so each is only formatted once
+        self._history_segments = {}
+        self._selected_history_item = None  # Entry shown in the history tab
+        self._history_buttons_built = False  # Apply/Export buttons, created on first selection
+        self._history_apply_button = None  # Disabled while a diagnosis runs
+        self._history_listed_count = 0  # History entries already in the history table
+        self._history_render_pending = False  # Selected entry not shown yet (history tab hidden)
+        self._history_select_after_id = None  # Pending debounced history selection
+        self._last_export_snapshot = (None, None)  # (history entry, export snapshot)
+        
         # Environmental factors (new)
         self.environmental_factors = {
             'temperature': tk.StringVar(value="moderate"),
@@ -290,19 +788,52 @@ class PlantDiseaseExpertGUI:
             'season': tk.StringVar(value="summer")
         }
         
-        # Get plant types from categories
-        self.plant_types = ["All Plants"]
-        for category, plants in PLANT_CATEGORIES.items():
-            self.plant_types.extend(plants)
-        # Remove duplicates and sort
-        self.plant_types = ["All Plants"] + sorted(list(set(self.plant_types) - {"All Plants"}))
+        # Get plant types from categories, without duplicates and sorted
+        plants = {plant for category_plants in PLANT_CATEGORIES.values() for plant in category_plants}
+        plants.discard("All Plants")
+        self.plant_types = ["All Plants"] + sorted(plants)
+        
+        # Search lookup tables, built once: each symptom's lowercased name and
+        # words, and the symptoms of the diseases that list each plant type.
+        # Symptom lists are kept in display order (by name), so search results
+        # come out sorted and the display doesn't have to sort them again
+        self._symptom_search_text = {s: SYMPTOM_NAMES[s].lower() for s in ALL_SYMPTOMS}
+        self._symptom_search_words = {
+            s: frozenset(text.split()) for s, text in self._symptom_search_text.items()
+        }
+        display_order = lambda s: SYMPTOM_NAMES[s].lower()
+        self._symptoms_by_name = sorted(ALL_SYMPTOMS, key=display_order)
+        self._plant_to_symptoms = {
+            plant_type: sorted({
+                symptom for disease in diseases
+                for symptom in self.engine.knowledge_base[disease]['symptoms']
+            }, key=display_order)
+            for plant_type, diseases in PLANT_TYPE_TO_DISEASES.items()
+            if plant_type != "All Plants"
+        }
+        
+        # Plant -> [(disease name, short description)] for the plant info window
+        self._plant_disease_summaries = {}
+        
+        # Plant info window, built on first use and reused (hidden when closed)
+        self._plant_info_window = None
+        self._plant_info_plant = None  # Plant currently shown in it
+        self._plant_info_rows = []  # Pooled (title label, description label) disease rows
+        
+        # Help and About windows, also built on first use and hidden when closed
+        self._help_window = None
+        self._about_window = None
+        
+        # Recent search results, as the same queries come back while typing/deleting
+        self._find_symptoms = lru_cache(maxsize=32)(self._find_symptoms_uncached)
+        self._last_search = ("", "All Plants")  # Query and plant type of visible_symptoms
         
         # Path for saved data
         self.saved_data_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "saved_data")
         os.makedirs(self.saved_data_dir, exist_ok=True)
         
         # Track visible/filtered symptoms
-        self.visible_symptoms = list(ALL_SYMPTOMS)
+        self.visible_symptoms = list(self._symptoms_by_name)
         
         # Store current diagnosis results
         self.current_results = []
@@ -310,6 +841,10 @@ class PlantDiseaseExpertGUI:
         # Store symptom frames for updating UI
         self.symptom_frames = {}
         
+        # Widget scaling is applied by customtkinter as a whole
+        if SCALING_ENABLED:
+            ctk.set_widget_scaling(DEFAULT_SCALING_FACTOR)
+        
         # Create the main layout
         self.create_layout()
     
@@ -374,27 +909,24 @@ class PlantDiseaseExpertGUI:
         
         # Try to load and display logo
         try:
-            logo_path = os.path.join(ASSETS_DIR, "plant_logo.png")
-            if os.path.exists(logo_path):
-                logo_img = Image.open(logo_path).resize((50, 50))
-                logo_photo = ImageTk.PhotoImage(logo_img)
-                logo_label = ctk.CTkLabel(header_frame, image=logo_photo, text="")
-                logo_label.image = logo_photo  # Keep reference
+            logo_image = get_image(os.path.join(ASSETS_DIR, "plant_logo.png"), (50, 50))
+            if logo_image:
+                logo_label = ctk.CTkLabel(header_frame, image=logo_image, text="")
                 logo_label.grid(row=0, column=0, padx=20, pady=10)
             else:
                 # If no logo file, use an emoji as a placeholder
-                logo_label = ctk.CTkLabel(header_frame, text="🌿", font=ctk.CTkFont(family=DEFAULT_FONT, size=28, weight="bold"))
+                logo_label = ctk.CTkLabel(header_frame, text="🌿", font=get_font(28, weight="bold"))
                 logo_label.grid(row=0, column=0, padx=20, pady=10)
         except Exception as e:
             # Fallback to text if image loading fails
-            logo_label = ctk.CTkLabel(header_frame, text="🌿", font=ctk.CTkFont(family=DEFAULT_FONT, size=28, weight="bold"))
+            logo_label = ctk.CTkLabel(header_frame, text="🌿", font=get_font(28, weight="bold"))
             logo_label.grid(row=0, column=0, padx=20, pady=10)
         
         # Title
         title_label = ctk.CTkLabel(
             header_frame, 
             text=APP_NAME,
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=22, weight="bold"),
+            font=get_font(22, weight="bold"),
             text_color=UI_COLORS['text_light']
         )
         title_label.grid(row=0, column=1, padx=10, pady=10, sticky="w")
@@ -408,7 +940,7 @@ class PlantDiseaseExpertGUI:
             border_width=0,
             hover_color=UI_COLORS['primary_dark'],
             text_color=UI_COLORS['text_light'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         settings_button.grid(row=0, column=2, padx=20, pady=10)
     
@@ -431,7 +963,7 @@ class PlantDiseaseExpertGUI:
         plant_label = ctk.CTkLabel(
             plant_frame,
             text="Plant Type:",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=14),
+            font=get_font(14),
             text_color=UI_COLORS['text_primary']
         )
         plant_label.pack(side=tk.LEFT, padx=(0, 10))
@@ -453,7 +985,7 @@ class PlantDiseaseExpertGUI:
             command=self.view_plant_categories,
             fg_color=UI_COLORS['secondary'],
             hover_color=UI_COLORS['secondary_dark'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         category_button.pack(side=tk.RIGHT, padx=(10, 0))
         
@@ -464,13 +996,13 @@ class PlantDiseaseExpertGUI:
         search_label = ctk.CTkLabel(
             self.search_frame,
             text="Search Symptoms:",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=14),
+            font=get_font(14),
             text_color=UI_COLORS['text_primary']
         )
         search_label.pack(side=tk.LEFT, padx=(0, 10))
         
         self.search_var = tk.StringVar()
-        self.search_var.trace("w", lambda name, index, mode: self.search_symptoms())
+        self.search_var.trace_add("write", self._on_search_change)
         
         search_entry = ctk.CTkEntry(
             self.search_frame,
@@ -501,7 +1033,7 @@ class PlantDiseaseExpertGUI:
         self.symptoms_scrollable = ctk.CTkScrollableFrame(
             symptoms_frame,
             label_text="Symptoms",
-            label_font=ctk.CTkFont(family=DEFAULT_FONT, size=14, weight="bold")
+            label_font=get_font(14, weight="bold")
         )
         self.symptoms_scrollable.grid(row=0, column=0, sticky="nsew")
         
@@ -519,7 +1051,7 @@ class PlantDiseaseExpertGUI:
         env_label = ctk.CTkLabel(
             env_header,
             text="Environmental Factors",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=14, weight="bold"),
+            font=get_font(14, weight="bold"),
             text_color=UI_COLORS['text_primary']
         )
         env_label.pack(side=tk.LEFT)
@@ -531,7 +1063,7 @@ class PlantDiseaseExpertGUI:
             command=self.toggle_env_factors,
             width=80,
             fg_color=UI_COLORS['primary_light'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         self.env_toggle_btn.pack(side=tk.RIGHT)
         
@@ -552,6 +1084,9 @@ class PlantDiseaseExpertGUI:
             ("Season", "season", ["spring", "summer", "fall", "winter"])
         ]
         
+        # Display value -> internal value of each factor's options
+        self._env_maps = {}
+        
         for i, (label_text, factor_key, options) in enumerate(factors):
             factor_frame = ctk.CTkFrame(self.env_content, fg_color="transparent")
             factor_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -559,7 +1094,7 @@ class PlantDiseaseExpertGUI:
             label = ctk.CTkLabel(
                 factor_frame,
                 text=label_text + ":",
-                font=ctk.CTkFont(family=DEFAULT_FONT, size=12),
+                font=get_font(12),
                 width=100,
                 anchor="w"
             )
@@ -567,11 +1102,12 @@ class PlantDiseaseExpertGUI:
             
             # Convert options to more readable format for display
             display_options = [opt.replace('_', ' ').title() for opt in options]
+            self._env_maps[factor_key] = dict(zip(display_options, options))
             
             combobox = ctk.CTkComboBox(
                 factor_frame,
                 values=display_options,
-                command=lambda selected, key=factor_key, opts=options: self.set_env_factor(key, selected, opts),
+                command=partial(self.set_env_factor, factor_key),
                 variable=self.environmental_factors[factor_key],
                 width=150,
                 state="readonly"
@@ -579,11 +1115,10 @@ class PlantDiseaseExpertGUI:
             combobox.pack(side=tk.LEFT, fill=tk.X, expand=True)
             combobox.set(display_options[options.index(self.environmental_factors[factor_key].get())])
     
-    def set_env_factor(self, key, selected_display, options):
+    def set_env_factor(self, key, selected_display):
         """Set environmental factor based on selection."""
         # Convert display value back to internal value
-        selected_index = [opt.replace('_', ' ').title() for opt in options].index(selected_display)
-        self.environmental_factors[key].set(options[selected_index])
+        self.environmental_factors[key].set(self._env_maps[key][selected_display])
     
     def toggle_env_factors(self):
         """Toggle visibility of environmental factors panel."""
@@ -617,7 +1152,7 @@ class PlantDiseaseExpertGUI:
             command=self.save_symptom_selection,
             fg_color=UI_COLORS['primary'],
             hover_color=UI_COLORS['primary_dark'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         save_button.pack(side=tk.LEFT, padx=(0, 10))
         
@@ -627,7 +1162,7 @@ class PlantDiseaseExpertGUI:
             command=self.load_symptom_selection,
             fg_color=UI_COLORS['primary'],
             hover_color=UI_COLORS['primary_dark'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         load_button.pack(side=tk.LEFT, padx=(0, 10))
         
@@ -637,23 +1172,23 @@ class PlantDiseaseExpertGUI:
             command=self.show_export_menu,
             fg_color=UI_COLORS['secondary'],
             hover_color=UI_COLORS['secondary_dark'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         export_menu_button.pack(side=tk.LEFT)
         
-        diagnose_button = ctk.CTkButton(
+        self.diagnose_button = ctk.CTkButton(
             actions_frame,
             text="Diagnose",
             command=self.diagnose,
             fg_color=UI_COLORS['success'],
             hover_color=UI_COLORS['primary_dark'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=14, weight="bold"),
+            font=get_font(14, weight="bold"),
             height=35
         )
-        diagnose_button.pack(side=tk.RIGHT)
+        self.diagnose_button.pack(side=tk.RIGHT)
         
         # Create tabview for results and history
-        self.results_tabview = ctk.CTkTabview(right_frame)
+        self.results_tabview = ctk.CTkTabview(right_frame, command=self._on_results_tab_change)
         self.results_tabview.grid(row=1, column=0, padx=DEFAULT_PADDING, pady=DEFAULT_PADDING, sticky="nsew")
         
         # Add tabs
@@ -676,12 +1211,18 @@ class PlantDiseaseExpertGUI:
         # Results textbox
         self.results_text = ctk.CTkTextbox(
             self.results_tabview.tab("Diagnosis Results"),
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12),
+            font=get_font(12),
             wrap="word",
             padx=15,
             pady=10
         )
         self.results_text.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+        self.configure_text_tags(self.results_text)
+        self._highlight_tags = set()  # Highlight tags configured in results_text
+        # Confidence tag -> highlighted variant with a lighter background
+        self._confidence_highlight_tags = {
+            tag: self.highlight_tag(tag, bg_color) for tag, bg_color in self._confidence_highlight_colors.items()
+        }
         
         # History tab components
         history_list_frame = ctk.CTkFrame(self.results_tabview.tab("Diagnosis History"))
@@ -690,66 +1231,102 @@ class PlantDiseaseExpertGUI:
         history_label = ctk.CTkLabel(
             history_list_frame,
             text="Previous Diagnoses:",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=14, weight="bold"),
+            font=get_font(14, weight="bold"),
             anchor="w"
         )
         history_label.pack(side=tk.LEFT, padx=5, pady=5)
         
-        # History listbox (using standard Listbox as CTk doesn't have an equivalent)
+        # History table (using a ttk Treeview as CTk doesn't have an equivalent),
+        # one column per field so rows don't need formatting into a string
         history_list_frame_inner = tk.Frame(history_list_frame, bg=UI_COLORS['card_bg'])
         history_list_frame_inner.pack(side=tk.RIGHT, fill=tk.X, expand=True, padx=5, pady=5)
         
-        self.history_listbox = tk.Listbox(
-            history_list_frame_inner,
-            bg=UI_COLORS['card_bg'],
-            fg=UI_COLORS['text_primary'],
+        style = ttk.Style()
+        style.configure(
+            "History.Treeview",
+            background=UI_COLORS['card_bg'],
+            fieldbackground=UI_COLORS['card_bg'],
+            foreground=UI_COLORS['text_primary'],
             font=(DEFAULT_FONT, 12),
-            height=6,
-            selectbackground=UI_COLORS['primary'],
-            selectforeground=UI_COLORS['text_light'],
-            relief="flat",
-            borderwidth=1
+            rowheight=24,
+            borderwidth=0
         )
-        self.history_listbox.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.history_listbox.bind('<<ListboxSelect>>', self.load_history_item)
+        style.map(
+            "History.Treeview",
+            background=[("selected", UI_COLORS['primary'])],
+            foreground=[("selected", UI_COLORS['text_light'])]
+        )
+        style.configure("History.Treeview.Heading", font=(DEFAULT_FONT, 11, "bold"))
+        
+        self.history_tree = ttk.Treeview(
+            history_list_frame_inner,
+            columns=("timestamp", "plant_type", "symptoms", "results"),
+            show="headings",
+            selectmode="browse",
+            height=6,
+            style="History.Treeview"
+        )
+        for column, heading, width, anchor in (
+            ("timestamp", "Date", 160, "w"),
+            ("plant_type", "Plant Type", 120, "w"),
+            ("symptoms", "Symptoms", 80, "center"),
+            ("results", "Results", 80, "center")
+        ):
+            self.history_tree.heading(column, text=heading, anchor=anchor)
+            self.history_tree.column(column, width=width, anchor=anchor, stretch=column == "plant_type")
+        self.history_tree.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        self.history_tree.bind('<<TreeviewSelect>>', self._on_history_select)
         
         history_scrollbar = ttk.Scrollbar(history_list_frame_inner, orient="vertical")
         history_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        self.history_listbox.config(yscrollcommand=history_scrollbar.set)
-        history_scrollbar.config(command=self.history_listbox.yview)
+        self.history_tree.config(yscrollcommand=history_scrollbar.set)
+        history_scrollbar.config(command=self.history_tree.yview)
         
         # History details text
         self.history_text = ctk.CTkTextbox(
             self.results_tabview.tab("Diagnosis History"),
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12),
+            font=get_font(12),
             wrap="word",
             padx=15,
             pady=10
         )
         self.history_text.grid(row=1, column=0, sticky="nsew", padx=5, pady=5)
+        self.configure_text_tags(self.history_text)
         
         # Add history buttons frame below the text
         self.history_buttons_frame = ctk.CTkFrame(self.results_tabview.tab("Diagnosis History"))
         self.history_buttons_frame.grid(row=2, column=0, sticky="ew", padx=5, pady=5)
         
         # Plant guide tab
-        plant_guide_frame = ctk.CTkScrollableFrame(
+        self._plant_guide_frame = ctk.CTkScrollableFrame(
             self.results_tabview.tab("Plant Guide"),
             fg_color="transparent"
         )
-        plant_guide_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
-        plant_guide_frame.grid_columnconfigure(0, weight=1)
+        self._plant_guide_frame.grid(row=0, column=0, sticky="nsew", padx=5, pady=5)
+        self._plant_guide_frame.grid_columnconfigure(0, weight=1)
         
-        # Plant guide content
-        self.create_plant_guide(plant_guide_frame)
+        # Plant guide content is built the first time the tab is opened
+        self._plant_guide_built = False
+    
+    def _on_results_tab_change(self):
+        """
+        Results tab view callback: build the plant guide on its first visit, and
+        show the history entry selected while the history tab was hidden.
+        """
+        tab = self.results_tabview.get()
+        if tab == "Plant Guide" and not self._plant_guide_built:
+            self._plant_guide_built = True
+            self.create_plant_guide(self._plant_guide_frame)
+        elif tab == "Diagnosis History" and self._history_render_pending:
+            self.load_history_item()
     
     def create_plant_guide(self, parent):
         """Create content for the plant guide tab."""
         guide_title = ctk.CTkLabel(
             parent,
             text="Plant Care Guide",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=16, weight="bold"),
+            font=get_font(16, weight="bold"),
             anchor="w"
         )
         guide_title.grid(row=0, column=0, padx=10, pady=(10, 5), sticky="w")
@@ -757,7 +1334,7 @@ class PlantDiseaseExpertGUI:
         guide_desc = ctk.CTkLabel(
             parent,
             text="Basic information about caring for common plants and preventing diseases.",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12),
+            font=get_font(12),
             anchor="w",
             wraplength=600
         )
@@ -765,46 +1342,42 @@ class PlantDiseaseExpertGUI:
         
         # Plant categories
         row = 2
-        for category, plants in PLANT_CATEGORIES.items():
-            category_frame = ctk.CTkFrame(parent, fg_color=UI_COLORS['primary_light'])
-            category_frame.grid(row=row, column=0, padx=10, pady=(10, 5), sticky="ew")
-            
+        for category, plants, more_text in _PLANT_GUIDE_ROWS:
+            # Category heading: one colored label rather than a frame holding a label
             category_label = ctk.CTkLabel(
-                category_frame,
+                parent,
                 text=category,
-                font=ctk.CTkFont(family=DEFAULT_FONT, size=14, weight="bold"),
+                font=get_font(14, weight="bold"),
                 text_color=UI_COLORS['text_light'],
-                anchor="w"
+                fg_color=UI_COLORS['primary_light'],
+                corner_radius=6,
+                anchor="w",
+                padx=10,
+                height=38
             )
-            category_label.pack(padx=10, pady=5, fill=tk.X)
+            category_label.grid(row=row, column=0, padx=10, pady=(10, 5), sticky="ew")
             
             row += 1
             
             # Add some plants from this category
-            for i, plant in enumerate(plants[:5]):  # Show up to 5 plants per category
+            for plant in plants:
                 plant_btn = ctk.CTkButton(
                     parent,
                     text=plant,
-                    command=lambda p=plant: self.show_plant_info(p),
-                    fg_color="transparent",
-                    text_color=UI_COLORS['primary'],
-                    hover_color=UI_COLORS['divider'],
-                    anchor="w",
-                    font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+                    command=partial(self.show_plant_info, plant),
+                    font=get_font(12),
+                    **_PLANT_BTN_KW
                 )
                 plant_btn.grid(row=row, column=0, padx=20, pady=2, sticky="w")
                 row += 1
             
-            if len(plants) > 5:
+            if more_text:
                 more_btn = ctk.CTkButton(
                     parent,
-                    text=f"View {len(plants) - 5} more {category.lower()}...",
-                    command=lambda cat=category: self.show_plant_category(cat),
-                    fg_color="transparent",
-                    text_color=UI_COLORS['secondary'],
-                    hover_color=UI_COLORS['divider'],
-                    anchor="w",
-                    font=ctk.CTkFont(family=DEFAULT_FONT, size=12, slant="italic")
+                    text=more_text,
+                    command=partial(self.show_plant_category, category),
+                    font=get_font(12, slant="italic"),
+                    **_MORE_BTN_KW
                 )
                 more_btn.grid(row=row, column=0, padx=20, pady=2, sticky="w")
                 row += 1
@@ -820,7 +1393,7 @@ class PlantDiseaseExpertGUI:
         self.status_label = ctk.CTkLabel(
             footer_frame,
             text=f"{APP_NAME} v{APP_VERSION} | Ready",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=10),
+            font=get_font(10),
             text_color=UI_COLORS['text_secondary']
         )
         self.status_label.grid(row=0, column=0, padx=15, pady=5, sticky="w")
@@ -837,7 +1410,7 @@ class PlantDiseaseExpertGUI:
             height=25,
             fg_color=UI_COLORS['text_secondary'],
             text_color=UI_COLORS['text_light'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=11)
+            font=get_font(11)
         )
         help_button.pack(side=tk.LEFT, padx=(0, 10))
         
@@ -849,7 +1422,7 @@ class PlantDiseaseExpertGUI:
             height=25,
             fg_color=UI_COLORS['text_secondary'],
             text_color=UI_COLORS['text_light'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=11)
+            font=get_font(11)
         )
         about_button.pack(side=tk.LEFT, padx=(0, 10))
         
@@ -861,7 +1434,7 @@ class PlantDiseaseExpertGUI:
             height=25,
             fg_color=UI_COLORS['error'],
             text_color=UI_COLORS['text_light'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=11)
+            font=get_font(11)
         )
         exit_button.pack(side=tk.LEFT)
     
@@ -887,9 +1460,6 @@ class PlantDiseaseExpertGUI:
         # Store reference to destroy on window close
         self.settings_window.protocol("WM_DELETE_WINDOW", self._on_settings_close)
         
-        # Cache settings values to avoid frequent dictionary lookups
-        cached_settings = {k: v for k, v in SETTINGS.items()}
-        
         # Settings content
         settings_frame = ctk.CTkFrame(self.settings_window)
         settings_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
@@ -898,66 +1468,52 @@ class PlantDiseaseExpertGUI:
         title_label = ctk.CTkLabel(
             settings_frame,
             text="Application Settings",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=16, weight="bold")
+            font=get_font(16, weight="bold")
         )
         title_label.pack(pady=(0, 15))
         
         # Settings options - using grid for better performance
         settings_grid = ctk.CTkFrame(settings_frame, fg_color="transparent")
         settings_grid.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        settings_grid.grid_columnconfigure(0, weight=1)
         
         # Track setting variables for immediate apply
         self.setting_vars = {}
         
         # Create settings grid
-        for i, (setting, value) in enumerate(cached_settings.items()):
+        for i, (setting, value) in enumerate(SETTINGS.items()):
             self.setting_vars[setting] = tk.BooleanVar(value=value)
             
             # Format setting name for display
             display_name = setting.replace('_', ' ').title()
             
-            # Create tooltip descriptions based on setting name
-            tooltip_text = {
-                'animations': "Enable UI animations for smooth transitions",
-                'tooltips': "Show helpful tooltips when hovering over elements",
-                'auto_save': "Automatically save your selections",
-                'expert_mode': "Enable advanced features for experienced users",
-                'auto_update_check': "Check for updates when application starts"
-            }.get(setting, f"Toggle {display_name}")
-            
-            # Create setting row
-            setting_frame = ctk.CTkFrame(settings_grid, fg_color="transparent")
-            setting_frame.pack(fill=tk.X, pady=5)
-            
-            # Label with description
+            # Label with description, gridded straight into the settings grid
             setting_label = ctk.CTkLabel(
-                setting_frame,
+                settings_grid,
                 text=display_name,
-                font=ctk.CTkFont(family=DEFAULT_FONT, size=12),
+                font=get_font(12),
                 anchor="w",
                 width=150
             )
-            setting_label.pack(side=tk.LEFT, padx=10, fill=tk.X)
+            setting_label.grid(row=i, column=0, padx=10, pady=5, sticky="w")
             
-            # Tooltip for the label
-            try:
-                CreateToolTip(setting_label, tooltip_text)
-            except:
-                pass  # Skip tooltip if not supported
+            # Tooltip for the label, only set up when tooltips are turned on
+            if SETTINGS['tooltips']:
+                CreateToolTip(setting_label, _SETTING_DESCRIPTIONS.get(setting, f"Toggle {display_name}"))
             
             # Switch with optimized callback
             setting_switch = ctk.CTkSwitch(
-                setting_frame,
+                settings_grid,
                 text="",
                 variable=self.setting_vars[setting],
                 command=lambda s=setting, v=self.setting_vars[setting]: self._fast_update_setting(s, v),
-                font=ctk.CTkFont(family=DEFAULT_FONT, size=12),
+                font=get_font(12),
                 width=50,
                 progress_color=UI_COLORS['primary_light'],
                 button_color=UI_COLORS['primary'],
                 button_hover_color=UI_COLORS['primary_dark']
             )
-            setting_switch.pack(side=tk.RIGHT, padx=10)
+            setting_switch.grid(row=i, column=1, padx=10, pady=5, sticky="e")
         
         # Apply and Cancel buttons
         button_frame = ctk.CTkFrame(settings_frame, fg_color="transparent")
@@ -970,7 +1526,7 @@ class PlantDiseaseExpertGUI:
             command=self._reset_settings_to_default,
             fg_color=UI_COLORS['secondary'],
             hover_color=UI_COLORS['secondary_dark'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         reset_button.pack(side=tk.LEFT, padx=10)
         
@@ -981,13 +1537,14 @@ class PlantDiseaseExpertGUI:
             command=self._on_settings_close,
             fg_color=UI_COLORS['primary'],
             hover_color=UI_COLORS['primary_dark'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         close_button.pack(side=tk.RIGHT, padx=10)
     
     def _on_settings_close(self):
         """Handle settings window close with cleanup."""
-        # Apply any pending changes
+        # Apply any pending changes (all of them, so the queued flush has nothing left)
+        self._settings_dirty.clear()
         self.apply_settings()
         
         # Clear reference and destroy window
@@ -996,68 +1553,54 @@ class PlantDiseaseExpertGUI:
             self.settings_window = None
     
     def _fast_update_setting(self, setting, var):
-        """Update setting with optimized performance."""
-        # Get value directly from variable to avoid extra calls
-        value = var.get()
-        
-        # Update the setting in the global settings dict
-        SETTINGS[setting] = value
-        
-        # Apply immediate effect for relevant settings
-        if setting == 'animations':
-            # Apply animations setting immediately
-            if value:
-                # Enable animations
-                pass  # Animation effects are controlled when triggered
-            else:
-                # Disable animations
-                pass  # Animation effects are controlled when triggered
-        elif setting == 'tooltips':
-            # Update tooltips visibility
-            if not value:
-                # Hide any active tooltips
-                if hasattr(self, 'current_tooltips'):
-                    for tooltip in self.current_tooltips:
-                        try:
-                            tooltip.hide_tooltip()
-                        except:
-                            pass
-        elif setting == 'auto_save':
-            # Apply auto-save setting
-            if value and hasattr(self, 'symptoms_scrollable'):
-                # Save current state
-                self.save_symptom_selection()
-        elif setting == 'expert_mode':
-            # Toggle expert mode immediately
-            if value:
-                # Show advanced options
-                if hasattr(self, 'expert_options_frame'):
-                    self.expert_options_frame.pack(fill=tk.X, padx=10, pady=5)
+        """
+        Update a setting, applying its effect together with any other settings
+        changed in quick succession.
+        
+        Args:
+            setting: Name of the setting
+            var: BooleanVar holding its new value
+        """
+        SETTINGS[setting] = var.get()
+        self._settings_dirty.add(setting)
+        if not self._settings_apply_pending:
+            self._settings_apply_pending = True
+            self.root.after(SETTINGS_APPLY_DELAY, self._flush_settings)
+    
+    def _flush_settings(self):
+        """Apply the effects of the settings changed since the last flush."""
+        self._settings_apply_pending = False
+        dirty, self._settings_dirty = self._settings_dirty, set()
+        
+        # Animations are checked whenever one is triggered, so need nothing here
+        if 'tooltips' in dirty and not SETTINGS['tooltips']:
+            # Hide the tooltip if one is showing (they all share one window)
+            CreateToolTip.hide_shared_window()
+        
+        if 'expert_mode' in dirty and hasattr(self, 'expert_options_frame'):
+            # Show or hide advanced options
+            if SETTINGS['expert_mode']:
+                self.expert_options_frame.pack(fill=tk.X, padx=10, pady=5)
             else:
-                # Hide advanced options
-                if hasattr(self, 'expert_options_frame'):
-                    self.expert_options_frame.pack_forget()
+                self.expert_options_frame.pack_forget()
+        
+        if 'auto_save' in dirty and SETTINGS['auto_save'] and hasattr(self, 'symptoms_scrollable'):
+            # Save current state
+            self.save_symptom_selection()
     
     def _reset_settings_to_default(self):
         """Reset all settings to default values."""
-        default_settings = {
-            'animations': True,
-            'tooltips': True,
-            'auto_save': True,
-            'expert_mode': False,
-            'auto_update_check': True
-        }
-        
         # Update global settings
-        for setting, value in default_settings.items():
+        for setting, value in _DEFAULT_SETTINGS:
             SETTINGS[setting] = value
             
             # Update UI variables if they exist
             if hasattr(self, 'setting_vars') and setting in self.setting_vars:
                 self.setting_vars[setting].set(value)
         
-        # Apply changes immediately
-        self.apply_settings()
+        # Apply changes immediately, all at once
+        self._settings_dirty.update(SETTINGS)
+        self._flush_settings()
     
     def apply_settings(self):
         """Apply all settings changes to the UI."""
@@ -1101,100 +1644,119 @@ class PlantDiseaseExpertGUI:
     
     def show_plant_info(self, plant):
         """Show detailed information about a specific plant."""
-        info_window = ctk.CTkToplevel(self.root)
+        if self._plant_info_window is None or not self._plant_info_window.winfo_exists():
+            self._build_plant_info_window()
+        info_window = self._plant_info_window
+        self._plant_info_plant = plant
+        
         info_window.title(f"{plant} Information")
-        info_window.geometry("600x500")
-        info_window.transient(self.root)
+        self._plant_info_title.configure(text=plant)
+        self._plant_info_select.configure(
+            text=f"Select {plant} for Diagnosis",
+            command=partial(self.select_plant_and_close, plant, info_window)
+        )
         
-        # Make window modal
+        # Plant image, with a placeholder until the file has been decoded
+        self._plant_info_image.configure(image=None, text="🌱")
+        get_image_async(
+            self.root,
+            os.path.join(ASSETS_DIR, f"{plant.lower().replace(' ', '_')}.png"),
+            (200, 200),
+            partial(self._set_plant_info_image, plant)
+        )
+        
+        # Get diseases for this plant (formatted once per plant)
+        plant_diseases = self._plant_disease_summaries.get(plant)
+        if plant_diseases is None:
+            plant_diseases = self._plant_disease_summaries[plant] = [
+                (disease.replace('_', ' ').title(), self.engine.knowledge_base[disease]['description'][:100] + "...")
+                for disease in PLANT_TYPE_TO_DISEASES.get(plant, ())
+            ]
+        
+        # Reuse the pooled disease rows, creating more only when this plant
+        # has more diseases than any plant shown before
+        for title_label, desc_label in self._plant_info_rows:
+            title_label.pack_forget()
+            desc_label.pack_forget()
+        self._plant_info_no_diseases.pack_forget()
+        
+        diseases_frame = self._plant_info_diseases
+        while len(self._plant_info_rows) < len(plant_diseases):
+            self._plant_info_rows.append((
+                ctk.CTkLabel(
+                    diseases_frame,
+                    font=get_font(12, weight="bold"),
+                    anchor="w"
+                ),
+                ctk.CTkLabel(
+                    diseases_frame,
+                    font=get_font(11),
+                    wraplength=500,
+                    anchor="w",
+                    justify="left"
+                )
+            ))
+        
+        if plant_diseases:
+            for (disease_name, desc), (title_label, desc_label) in zip(plant_diseases, self._plant_info_rows):
+                title_label.configure(text=disease_name)
+                title_label.pack(fill=tk.X, padx=10, pady=(5, 0))
+                desc_label.configure(text=desc)
+                desc_label.pack(fill=tk.X, padx=10, pady=(0, 5))
+        else:
+            self._plant_info_no_diseases.pack(padx=10, pady=5)
+        
+        # Show the window again, scrolled back to the top
+        self._plant_info_content._parent_canvas.yview_moveto(0)
+        info_window.deiconify()
+        info_window.lift()
         info_window.focus_set()
+    
+    def _build_plant_info_window(self):
+        """Create the plant info window and the parts that are the same for every plant."""
+        info_window = self._plant_info_window = ctk.CTkToplevel(self.root)
+        info_window.geometry("600x500")
+        info_window.transient(self.root)
+        # Closing only hides the window so the next plant can reuse it
+        info_window.protocol("WM_DELETE_WINDOW", info_window.withdraw)
         
         # Content frame
-        content_frame = ctk.CTkScrollableFrame(info_window)
+        content_frame = self._plant_info_content = ctk.CTkScrollableFrame(info_window)
         content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
         
         # Title
-        title_label = ctk.CTkLabel(
+        self._plant_info_title = ctk.CTkLabel(
             content_frame,
-            text=plant,
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=18, weight="bold")
+            font=get_font(18, weight="bold")
         )
-        title_label.pack(pady=(0, 15))
+        self._plant_info_title.pack(pady=(0, 15))
         
-        # Plant image placeholder
-        try:
-            image_path = os.path.join(ASSETS_DIR, f"{plant.lower().replace(' ', '_')}.png")
-            if os.path.exists(image_path):
-                plant_img = Image.open(image_path).resize((200, 200))
-                photo = ImageTk.PhotoImage(plant_img)
-                img_label = ctk.CTkLabel(content_frame, image=photo, text="")
-                img_label.image = photo
-                img_label.pack(pady=10)
-            else:
-                # Placeholder text if no image
-                img_placeholder = ctk.CTkLabel(
-                    content_frame,
-                    text="🌱",
-                    font=ctk.CTkFont(size=48)
-                )
-                img_placeholder.pack(pady=10)
-        except Exception:
-            # Fallback if image loading fails
-            img_placeholder = ctk.CTkLabel(
-                content_frame,
-                text="🌱",
-                font=ctk.CTkFont(size=48)
-            )
-            img_placeholder.pack(pady=10)
+        # Plant image
+        self._plant_info_image = ctk.CTkLabel(
+            content_frame,
+            text="🌱",
+            font=get_font(48, family=None)
+        )
+        self._plant_info_image.pack(pady=10)
         
-        # Common diseases section
-        diseases_frame = ctk.CTkFrame(content_frame)
+        # Common diseases section (rows are filled in by show_plant_info)
+        diseases_frame = self._plant_info_diseases = ctk.CTkFrame(content_frame)
         diseases_frame.pack(fill=tk.X, pady=10)
+        self._plant_info_rows = []
         
         diseases_label = ctk.CTkLabel(
             diseases_frame,
             text="Common Diseases",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=14, weight="bold")
+            font=get_font(14, weight="bold")
         )
         diseases_label.pack(padx=10, pady=5, anchor="w")
         
-        # Get diseases for this plant
-        plant_diseases = []
-        for disease, data in self.engine.knowledge_base.items():
-            if 'plant_types' in data and plant in data['plant_types']:
-                disease_name = disease.replace('_', ' ').title()
-                plant_diseases.append((disease_name, data['description'][:100] + "..."))
-        
-        if plant_diseases:
-            for disease_name, desc in plant_diseases:
-                disease_item = ctk.CTkFrame(diseases_frame, fg_color="transparent")
-                disease_item.pack(fill=tk.X, padx=10, pady=5)
-                
-                disease_title = ctk.CTkLabel(
-                    disease_item,
-                    text=disease_name,
-                    font=ctk.CTkFont(family=DEFAULT_FONT, size=12, weight="bold"),
-                    anchor="w"
-                )
-                disease_title.pack(fill=tk.X)
-                
-                disease_desc = ctk.CTkLabel(
-                    disease_item,
-                    text=desc,
-                    font=ctk.CTkFont(family=DEFAULT_FONT, size=11),
-                    wraplength=500,
-                    anchor="w",
-                    justify="left"
-                )
-                disease_desc.pack(fill=tk.X)
-        else:
-            no_diseases = ctk.CTkLabel(
-                diseases_frame,
-                text="No specific disease information available for this plant.",
-                font=ctk.CTkFont(family=DEFAULT_FONT, size=11, slant="italic"),
-                text_color=UI_COLORS['text_secondary']
-            )
-            no_diseases.pack(padx=10, pady=5)
+        self._plant_info_no_diseases = ctk.CTkLabel(
+            diseases_frame,
+            text="No specific disease information available for this plant.",
+            font=get_font(11, slant="italic"),
+            text_color=UI_COLORS['text_secondary']
+        )
         
         # Care tips
         care_frame = ctk.CTkFrame(content_frame)
@@ -1203,64 +1765,89 @@ class PlantDiseaseExpertGUI:
         care_label = ctk.CTkLabel(
             care_frame,
             text="Care Tips",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=14, weight="bold")
+            font=get_font(14, weight="bold")
         )
         care_label.pack(padx=10, pady=5, anchor="w")
         
-        # Generic care tips
-        tips = [
-            "Ensure proper watering - check soil moisture before watering",
-            "Provide adequate light according to plant needs",
-            "Monitor for pests and diseases regularly",
-            "Use appropriate fertilizer during growing season",
-            "Maintain good air circulation to prevent fungal diseases"
-        ]
-        
-        for tip in tips:
-            tip_label = ctk.CTkLabel(
-                care_frame,
-                text=f"• {tip}",
-                font=ctk.CTkFont(family=DEFAULT_FONT, size=11),
-                wraplength=500,
-                anchor="w",
-                justify="left"
-            )
-            tip_label.pack(fill=tk.X, padx=10, pady=2, anchor="w")
+        # Generic care tips, all in a single label
+        tips_label = ctk.CTkLabel(
+            care_frame,
+            text=_GENERIC_CARE_TIPS,
+            font=get_font(11),
+            wraplength=500,
+            anchor="w",
+            justify="left"
+        )
+        tips_label.pack(fill=tk.X, padx=10, pady=2, anchor="w")
         
-        # Select plant button
-        select_button = ctk.CTkButton(
+        # Select plant button (text and command are set per plant)
+        self._plant_info_select = ctk.CTkButton(
             content_frame,
-            text=f"Select {plant} for Diagnosis",
-            command=lambda: self.select_plant_and_close(plant, info_window),
             fg_color=UI_COLORS['primary'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
-        select_button.pack(pady=15)
+        self._plant_info_select.pack(pady=15)
         
         # Close button
         close_button = ctk.CTkButton(
             content_frame,
             text="Close",
-            command=info_window.destroy,
+            command=info_window.withdraw,
             fg_color=UI_COLORS['text_secondary'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         close_button.pack(pady=(0, 15))
     
+    def _set_plant_info_image(self, plant, image):
+        """Show a loaded plant image, unless another plant is shown by now."""
+        if image and plant == self._plant_info_plant and self._plant_info_image.winfo_exists():
+            self._plant_info_image.configure(image=image, text="")
+    
     def select_plant_and_close(self, plant, window):
         """Select a plant and close the info window."""
         self.current_plant_type.set(plant)
         self.filter_symptoms_by_plant()
-        window.destroy()
+        window.withdraw()
     
     def show_plant_category(self, category):
         """Show all plants in a specific category."""
         self.view_plant_categories()
     
-    def diagnose(self):
-        """Diagnose based on selected symptoms with visual feedback."""
+    def get_symptom_selection(self):
+        """
+        Get the selected symptoms and their severities in a single pass.
+        
+        Returns:
+            Tuple of (list of selected symptom codes in knowledge base order,
+            dictionary of selected symptom -> severity value)
+        """
+        selected_symptoms = []
+        severity_data = {}
+        # dict.get skips symptoms that never had a variable created
+        get_symptom_var = self.symptom_vars.get
+        severity_vars = self.severity_vars
+        for symptom in ALL_SYMPTOMS:
+            symptom_var = get_symptom_var(symptom)
+            if symptom_var is not None and symptom_var.get():
+                selected_symptoms.append(symptom)
+                severity_data[symptom] = severity_vars[symptom].get()
+        return selected_symptoms, severity_data
+    
+    def diagnose(self, cached_diagnosis=None):
+        """
+        Diagnose based on selected symptoms with visual feedback.
+        
+        Args:
+            cached_diagnosis: History entry whose results can be shown instead of
+                              running the engine, if its inputs match the current
+                              selection (as after applying that entry)
+        """
+        # Only one diagnosis at a time (the buttons are disabled meanwhile)
+        if self._diagnosis_running:
+            return
+        
         # Get selected symptoms
-        selected_symptoms = [s for s in ALL_SYMPTOMS if self.symptom_vars[s].get()]
+        selected_symptoms, severity_data = self.get_symptom_selection()
         
         # Check if any symptoms are selected
         if not selected_symptoms:
@@ -1287,7 +1874,7 @@ class PlantDiseaseExpertGUI:
         progress_label = ctk.CTkLabel(
             progress_frame,
             text="Analyzing symptoms and environmental factors...",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         progress_label.pack(pady=(10, 5))
         
@@ -1296,86 +1883,168 @@ class PlantDiseaseExpertGUI:
         progress_bar.set(0)
         
         # Prepare the diagnosis data outside of the animation
-        severity_data = {s: self.severity_vars[s].get() for s in selected_symptoms}
-        results = self.engine.diagnose(selected_symptoms, severity_data, plant_type, env_factors)
-        self.current_results = results
-        
-        # Add to history now
-        history_item = {
-            "timestamp": datetime.datetime.now(),
-            "plant_type": plant_type,
-            "symptoms": selected_symptoms,
-            "severity": severity_data,
-            "environmental_factors": env_factors,
-            "results": results
-        }
-        self.diagnosis_history.append(history_item)
+        # The engine answers unchanged inputs from its cache, so a re-run shows
+        # the results right away instead of playing the progress animation
+        diagnosis_key = make_diagnosis_key(selected_symptoms, severity_data, plant_type, env_factors)
+        repeated = diagnosis_key == self._last_diagnosis_key
+        self._last_diagnosis_key = diagnosis_key
+        
+        # Block new diagnoses until this one has finished
+        self._set_diagnosis_running(True)
+        
+        # Outcome of the worker thread, filled in on the Tk thread from the
+        # worker's queue (Tk must not be called from other threads)
+        outcome = {}
+        worker_queue = queue.Queue()
+        
+        def run_engine():
+            # Runs on the worker thread: no Tk calls here
+            try:
+                results = self.engine.diagnose(selected_symptoms, severity_data, plant_type, env_factors)
+            except Exception as e:
+                worker_queue.put(("error", e))
+            else:
+                worker_queue.put(("results", results))
+        
+        def store_results(results):
+            self.current_results = results
+            outcome["results"] = results
+            
+            # Add to history now
+            history_item = {
+                "timestamp": datetime.datetime.now(),
+                "plant_type": plant_type,
+                "symptoms": selected_symptoms,
+                "severity": severity_data,
+                "environmental_factors": env_factors,
+                "results": results
+            }
+            self.diagnosis_history.append(history_item)
         
-        # Animate progress bar
+        # Animate progress bar (holding at full until the worker is done)
         def update_progress(value):
-            progress_bar.set(value)
-            if value < 1.0:
-                self.root.after(50, update_progress, value + 0.05)
+            try:
+                kind, payload = worker_queue.get_nowait()
+            except queue.Empty:
+                pass
             else:
-                # When finished, remove progress frame and show results
-                progress_frame.destroy()
-                
-                # Display results
-                self.display_results(results)
-                
-                # Update history list separately (now that data is already in the list)
-                self.update_history_list()
-                
-                # Switch to results tab
-                self.results_tabview.set("Diagnosis Results")
-                
-                # Show snackbar notification
-                self.show_snackbar(f"Diagnosis completed with {len(results)} potential diagnoses")
-                
-                # Reset status label
-                self.status_label.configure(text=f"{APP_NAME} v{APP_VERSION} | Ready")
+                if kind == "error":
+                    outcome["error"] = payload
+                else:
+                    store_results(payload)
+            
+            progress_bar.set(min(value, 1.0))
+            if value < 1.0 or not outcome:
+                self.root.after(PROGRESS_FRAME_DELAY, update_progress, value + PROGRESS_STEP)
+                return
+            
+            # When finished, remove progress frame and show results
+            progress_frame.destroy()
+            self._set_diagnosis_running(False)
+            self.status_label.configure(text=f"{APP_NAME} v{APP_VERSION} | Ready")
+            
+            if "error" in outcome:
+                self._last_diagnosis_key = None
+                messagebox.showerror("Error", f"Diagnosis failed: {outcome['error']}")
+                return
+            results = outcome["results"]
+            
+            # Display results
+            self.display_results(results, severity_data)
+            
+            # Update history list separately (now that data is already in the list)
+            self.update_history_list()
+            
+            # Switch to results tab
+            self.results_tabview.set("Diagnosis Results")
+            
+            # Show snackbar notification
+            self.show_snackbar(f"Diagnosis completed with {len(results)} potential diagnoses")
+        
+        # The results of a re-applied history entry still hold, so they're shown
+        # without running the engine again
+        if cached_diagnosis is not None and diagnosis_key == make_diagnosis_key(
+            cached_diagnosis["symptoms"],
+            cached_diagnosis["severity"],
+            cached_diagnosis["plant_type"],
+            cached_diagnosis.get("environmental_factors")
+        ):
+            store_results(cached_diagnosis["results"])
+            update_progress(1.0)
+            return
         
-        # Start animation
-        self.root.after(100, update_progress, 0)
+        # Run the inference on a worker thread so the UI keeps drawing meanwhile
+        threading.Thread(target=run_engine, daemon=True).start()
+        
+        # Start animation. With animations turned off, or for a repeated diagnosis,
+        # the bar starts full and the results show as soon as they are ready
+        if repeated or not SETTINGS['animations']:
+            update_progress(1.0)
+        else:
+            self.root.after(100, update_progress, 0)
+    
+    def _set_diagnosis_running(self, running):
+        """
+        Mark a diagnosis as running or finished, disabling the buttons that
+        would start another one meanwhile.
+        
+        Args:
+            running: True while a diagnosis is in progress
+        """
+        self._diagnosis_running = running
+        state = "disabled" if running else "normal"
+        self.diagnose_button.configure(state=state)
+        if self._history_apply_button is not None:
+            self._history_apply_button.configure(state=state)
     
     def show_snackbar(self, message, duration=3000):
         """Show a temporary notification at the bottom of the screen."""
-        # Create snackbar frame
-        snackbar = ctk.CTkFrame(
-            self.root, 
-            corner_radius=5,
-            fg_color=UI_COLORS['primary_dark'],
-        )
-        
-        # Add drop shadow effect with a slightly larger frame behind it
-        shadow = ctk.CTkFrame(
-            self.root,
-            corner_radius=7,
-            fg_color=self.adjust_color_opacity(UI_COLORS['shadow'], 0.2),  # 20% opacity for shadow
-        )
+        # The snackbar widgets are created once and reused for every message
+        if self._snackbar is None:
+            # Add drop shadow effect with a slightly larger frame behind it
+            self._snackbar_shadow = ctk.CTkFrame(
+                self.root,
+                corner_radius=7,
+                fg_color=self._shadow_color,
+            )
+            
+            # Create snackbar frame
+            self._snackbar = ctk.CTkFrame(
+                self.root, 
+                corner_radius=5,
+                fg_color=UI_COLORS['primary_dark'],
+            )
+            
+            # Add message
+            self._snackbar_label = ctk.CTkLabel(
+                self._snackbar,
+                text="",
+                font=get_font(12),
+                text_color=UI_COLORS['text_light']
+            )
+            self._snackbar_label.pack(pady=8, padx=15)
+        
+        # A new message replaces the one showing, and restarts the timer
+        if self._snackbar_after_id:
+            self.root.after_cancel(self._snackbar_after_id)
+        self._snackbar_label.configure(text=message)
         
         # Position the shadow slightly offset
-        shadow.place(relx=0.5, rely=0.95, anchor="center", relwidth=0.3, relheight=0.06)
+        self._snackbar_shadow.place(relx=0.5, rely=0.95, anchor="center", relwidth=0.3, relheight=0.06)
+        self._snackbar_shadow.lift()
         
         # Position the snackbar over the shadow
-        snackbar.place(relx=0.5, rely=0.95, anchor="center", relwidth=0.3, relheight=0.05)
-        
-        # Add message
-        message_label = ctk.CTkLabel(
-            snackbar,
-            text=message,
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12),
-            text_color=UI_COLORS['text_light']
-        )
-        message_label.pack(pady=8, padx=15)
-        
-        # Function to destroy snackbar
-        def close_snackbar():
-            shadow.destroy()
-            snackbar.destroy()
+        self._snackbar.place(relx=0.5, rely=0.95, anchor="center", relwidth=0.3, relheight=0.05)
+        self._snackbar.lift()
         
         # Auto close after duration
-        self.root.after(duration, close_snackbar)
+        self._snackbar_after_id = self.root.after(duration, self._hide_snackbar)
+    
+    def _hide_snackbar(self):
+        """Hide the snackbar (its widgets are kept for the next message)."""
+        self._snackbar_after_id = None
+        self._snackbar_shadow.place_forget()
+        self._snackbar.place_forget()
     
     def animate_tab_transition(self, tab_name):
         """Animate transition to a new tab."""
@@ -1383,265 +2052,294 @@ class PlantDiseaseExpertGUI:
         current_tab = self.results_tabview.get()
         
         # Only animate if changing tabs
-        if current_tab != tab_name:
-            # Create fade effect
-            overlay = ctk.CTkFrame(
-                self.results_tabview.tab(current_tab),
-                fg_color=self.adjust_color_opacity(UI_COLORS['bg_light'], 0.0)
-            )
-            overlay.place(x=0, y=0, relwidth=1, relheight=1)
-            
-            # Fade out current tab
-            for alpha in range(0, 10):
-                overlay.configure(fg_color=self.adjust_color_opacity(UI_COLORS['bg_light'], alpha/10))
-                self.root.update()
-                self.root.after(10)
-            
-            # Change tab
+        if current_tab == tab_name:
+            return
+        
+        # Create fade effect
+        overlay = ctk.CTkFrame(self.results_tabview.tab(current_tab), fg_color=self._fade_palette[0])
+        overlay.place(x=0, y=0, relwidth=1, relheight=1)
+        
+        def change_tab():
+            overlay.destroy()
             self.results_tabview.set(tab_name)
+            self._on_results_tab_change()  # set() doesn't run the tab view's command
             
-            # Create overlay on new tab
-            new_overlay = ctk.CTkFrame(
-                self.results_tabview.tab(tab_name),
-                fg_color=self.adjust_color_opacity(UI_COLORS['bg_light'], 1.0)
-            )
+            # Create overlay on new tab, then fade it back out
+            new_overlay = ctk.CTkFrame(self.results_tabview.tab(tab_name), fg_color=self._fade_palette[-1])
             new_overlay.place(x=0, y=0, relwidth=1, relheight=1)
-            
-            # Fade in new tab
-            for alpha in range(10, 0, -1):
-                new_overlay.configure(fg_color=self.adjust_color_opacity(UI_COLORS['bg_light'], alpha/10))
-                self.root.update()
-                self.root.after(10)
-            
-            # Remove overlays
-            overlay.destroy()
-            new_overlay.destroy()
+            self._fade_step(new_overlay, len(self._fade_palette) - 1, -1, new_overlay.destroy)
+        
+        # Fade out current tab, then change tab
+        self._fade_step(overlay, 0, 1, change_tab)
     
-    def display_results(self, results):
-        """Display diagnosis results in the text area."""
+    def _fade_step(self, overlay, index, step, done_callback):
+        """
+        Show one frame of an overlay fade and schedule the next, without
+        blocking the event loop.
+        
+        Args:
+            overlay: Frame being faded
+            index: Index of this frame's color in the fade palette
+            step: 1 to fade towards the background color, -1 to fade away from it
+            done_callback: Called once the last frame has been shown
+        """
+        if not overlay.winfo_exists():
+            return
+        if not 0 <= index < len(self._fade_palette):
+            done_callback()
+            return
+        overlay.configure(fg_color=self._fade_palette[index])
+        self.root.after(FADE_FRAME_DELAY, self._fade_step, overlay, index + step, step, done_callback)
+    
+    def configure_text_tags(self, textbox):
+        """
+        Configure the text tags of a results textbox once, when it is created.
+        
+        Args:
+            textbox: CTkTextbox to configure
+        """
+        text_widget = textbox._textbox
+        for tag, style in _TEXT_TAG_STYLES.items():
+            text_widget.tag_configure(tag, **style)
+    
+    def display_results(self, results, symptom_severity=None):
+        """
+        Display diagnosis results in the text area.
+        
+        Args:
+            results: Diagnosis results from the inference engine
+            symptom_severity: Severities the diagnosis was made with (defaults to
+                              the current selection)
+        """
         # Clear existing content
         self.results_text.delete("1.0", tk.END)
         
         # Get access to the underlying text widget
         text_widget = self.results_text._textbox
         
-        # Configure text tags
-        text_widget.tag_configure("title", font=(DEFAULT_FONT, 18, "bold"))
-        text_widget.tag_configure("subtitle", font=(DEFAULT_FONT, 14, "bold"))
-        text_widget.tag_configure("confidence_high", font=(DEFAULT_FONT, 13, "bold"), foreground=UI_COLORS['success'])
-        text_widget.tag_configure("confidence_medium", font=(DEFAULT_FONT, 13, "bold"), foreground=UI_COLORS['warning'])
-        text_widget.tag_configure("confidence_low", font=(DEFAULT_FONT, 13, "bold"), foreground=UI_COLORS['error'])
-        text_widget.tag_configure("normal", font=(DEFAULT_FONT, 12))
-        text_widget.tag_configure("bullet", font=(DEFAULT_FONT, 12, "bold"))
-        text_widget.tag_configure("italic", font=(DEFAULT_FONT, 12, "italic"))
-        text_widget.tag_configure("divider", font=(DEFAULT_FONT, 12), foreground=UI_COLORS['text_secondary'])
+        # Text and tag pairs, inserted with a single insert call at the end
+        # rather than one Tcl command per fragment
+        segments = []
+        add = lambda text, tag: segments.extend((text, tag))
         
         if not results:
-            self.results_text.insert(tk.END, "No matching diseases found for the selected symptoms.\n\n", "subtitle")
-            self.results_text.insert(tk.END, "Try adding more symptoms or adjusting their severity for better results.", "normal")
+            add("No matching diseases found for the selected symptoms.\n\n", "subtitle")
+            add("Try adding more symptoms or adjusting their severity for better results.", "normal")
+            text_widget.insert(tk.END, *segments)
             return
         
         # Header
         date_str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        self.results_text.insert(tk.END, f"Diagnosis Results - {date_str}\n\n", "title")
+        add(f"Diagnosis Results - {date_str}\n\n", "title")
         
         # Plant type if specified
         if self.current_plant_type.get() != "All Plants":
-            self.results_text.insert(tk.END, f"Plant Type: {self.current_plant_type.get()}\n\n", "subtitle")
+            add(f"Plant Type: {self.current_plant_type.get()}\n\n", "subtitle")
         
         # Environmental factors if provided
         if self.env_expanded.get():
-            self.results_text.insert(tk.END, "Environmental Conditions:\n", "subtitle")
+            add("Environmental Conditions:\n", "subtitle")
             for factor, value in self.environmental_factors.items():
                 display_factor = factor.replace('_', ' ').title()
                 display_value = value.get().replace('_', ' ').title()
-                self.results_text.insert(tk.END, f"• {display_factor}: {display_value}\n", "normal")
-            self.results_text.insert(tk.END, "\n", "normal")
+                add(f"• {display_factor}: {display_value}\n", "normal")
+            add("\n", "normal")
             
         # Results summary
-        self.results_text.insert(tk.END, f"Found {len(results)} potential diagnoses:\n\n", "subtitle")
+        add(f"Found {len(results)} potential diagnoses:\n\n", "subtitle")
+        
+        # Severity levels of the matching symptoms, normalized once for all results
+        if symptom_severity is None:
+            _, symptom_severity = self.get_symptom_selection()
+        severity_levels = {symptom: normalize_severity(value) for symptom, value in symptom_severity.items()}
+        
+        # Bound once rather than looked up for every result
+        confidence_highlights = self._confidence_highlight_tags
+        extend = segments.extend
         
         # Display each result
         for i, result in enumerate(results, 1):
             # Disease name
-            self.results_text.insert(tk.END, f"{i}. {result['name']}\n", "title")
-            self.results_text.insert(tk.END, "\n", "normal")  # Add extra space after title
+            add(f"{i}. {result['name']}\n", "title")
+            add("\n", "normal")  # Add extra space after title
             
             # Confidence score with color
             confidence = result['confidence']
-            confidence_tag = "confidence_high" if confidence >= 75 else \
-                           "confidence_medium" if confidence >= 50 else \
-                           "confidence_low"
-            confidence_bg = UI_COLORS['success'] if confidence >= 75 else \
-                           UI_COLORS['warning'] if confidence >= 50 else \
-                           UI_COLORS['error']
-            confidence_bg = self.adjust_color_opacity(confidence_bg, 0.2)  # Lighter background
-            self.results_text.insert(tk.END, "Confidence: ", "subtitle")
-            self.highlight_text(f"{confidence}%\n\n", confidence_tag, confidence_bg)
+            add("Confidence: ", "subtitle")
+            add(f"{confidence}%\n\n", confidence_highlights[confidence_tag(confidence)])
             
             # Description
-            self.results_text.insert(tk.END, "Description:\n", "subtitle")
-            self.results_text.insert(tk.END, f"{result['description']}\n\n\n", "normal")  # Extra spacing
+            add("Description:\n", "subtitle")
+            add(f"{result['description']}\n\n\n", "normal")  # Extra spacing
             
             # Severity impact
             if 'severity_impact' in result and result['severity_impact']:
-                self.results_text.insert(tk.END, "Severity Impact:\n", "subtitle")
+                add("Severity Impact:\n", "subtitle")
                 for level, impact in result['severity_impact'].items():
-                    level_display = level.title()
-                    level_tag = "confidence_low" if level == "low" else \
-                               "confidence_medium" if level == "medium" else \
-                               "confidence_high"
-                    
-                    self.results_text.insert(tk.END, f"• {level_display}: ", "bullet")
-                    self.results_text.insert(tk.END, f"{impact}\n", level_tag)
+                    add(f"• {level.title()}: ", "bullet")
+                    add(f"{impact}\n", _IMPACT_LEVEL_TAGS.get(level, "confidence_high"))
             
             # Treatment
-            self.results_text.insert(tk.END, "Treatment:\n", "subtitle")
-            self.results_text.insert(tk.END, f"{result['treatment']}\n\n", "normal")
+            add("Treatment:\n", "subtitle")
+            add(f"{result['treatment']}\n\n", "normal")
             
             # Product Recommendations
             if result['product_recommendations']:
-                self.results_text.insert(tk.END, "Recommended Products:\n", "subtitle")
+                add("Recommended Products:\n", "subtitle")
                 for product in result['product_recommendations']:
                     # Color-code by product type
-                    product_tag = "confidence_high" if product['type'] == 'Organic' else \
-                                 "confidence_low" if product['type'] == 'Chemical' else \
-                                 "confidence_medium"
-                    
-                    self.results_text.insert(tk.END, f"• {product['name']} ", "bullet")
-                    self.results_text.insert(tk.END, f"({product['type']})\n", product_tag)
-                    self.results_text.insert(tk.END, f"  {product['description']}\n", "normal")
-                self.results_text.insert(tk.END, "\n", "normal")
+                    add(f"• {product['name']} ", "bullet")
+                    add(f"({product['type']})\n", _PRODUCT_TYPE_TAGS.get(product['type'], "confidence_medium"))
+                    add(f"  {product['description']}\n", "normal")
+                add("\n", "normal")
             
             # Matching symptoms with severity
-            self.results_text.insert(tk.END, "Matching Symptoms:\n", "subtitle")
+            add("Matching Symptoms:\n", "subtitle")
             for symptom in result['matching_symptoms']:
-                severity = self.severity_vars[symptom].get()
-                # Convert severity to int if it's a string
-                if isinstance(severity, str):
-                    try:
-                        severity = int(severity)
-                    except (ValueError, TypeError):
-                        severity = 3  # Default to medium severity
-                
-                # Ensure severity is within valid range (1-5)
-                if severity < 1 or severity > 5:
-                    severity = 3  # Default to medium severity
-                        
-                severity_text = SYMPTOM_SEVERITY[severity]
-                severity_tag = "confidence_low" if severity <= 2 else \
-                              "confidence_medium" if severity <= 4 else \
-                              "confidence_high"
-                
-                self.results_text.insert(tk.END, f"• {SYMPTOM_NAMES[symptom]}\n", "bullet")
-                self.results_text.insert(tk.END, f"  Severity: ", "normal")
-                self.results_text.insert(tk.END, f"{severity}/5 - {severity_text}\n", severity_tag)
+                extend(symptom_severity_segments(symptom, severity_levels.get(symptom, 3)))
             
             # Divider between diseases
             if i < len(results):
-                self.results_text.insert(tk.END, "\n", "normal")
-                divider_str = "•" + "─" * 48 + "•"
-                self.results_text.insert(tk.END, divider_str + "\n\n", "divider")
+                add("\n", "normal")
+                add(_RESULT_DIVIDER, "divider")
+        
+        text_widget.insert(tk.END, *segments)
     
     def update_history_list(self):
-        """Update the history listbox with all past diagnoses."""
-        self.history_listbox.delete(0, tk.END)
-        
-        for i, item in enumerate(self.diagnosis_history):
-            timestamp = item["timestamp"].strftime("%Y-%m-%d %H:%M:%S")
-            plant_type = item["plant_type"]
-            symptom_count = len(item["symptoms"])
-            result_count = len(item["results"])
-            
-            list_text = f"{timestamp} - {plant_type} ({symptom_count} symptoms, {result_count} results)"
-            self.history_listbox.insert(tk.END, list_text)
+        """Update the history table with all past diagnoses."""
+        # History is only ever appended to, so the table rows line up with its
+        # entries (row IDs are the entry indexes) and just the new ones need inserting
+        history_tree = self.history_tree
+        listed_count = self._history_listed_count
+        if listed_count > len(self.diagnosis_history):
+            history_tree.delete(*history_tree.get_children())
+            listed_count = 0
+        self._history_listed_count = len(self.diagnosis_history)
+        
+        for index in range(listed_count, len(self.diagnosis_history)):
+            item = self.diagnosis_history[index]
+            history_tree.insert("", tk.END, iid=str(index), values=(
+                format_timestamp(item["timestamp"]),
+                item["plant_type"],
+                len(item["symptoms"]),
+                len(item["results"])
+            ))
         
-        # Select the most recent entry only if we have any items
+        # Select the most recent entry; the selection event loads it
         if self.diagnosis_history:
-            try:
-                last_index = len(self.diagnosis_history) - 1
-                self.history_listbox.select_set(last_index)
-                # Load history item only if it's actually available
-                if last_index >= 0:
-                    self.load_history_item()
-            except Exception as e:
-                print(f"Error selecting history item: {e}")
-                # Don't try to load history item if selection fails
+            last_iid = str(len(self.diagnosis_history) - 1)
+            history_tree.selection_set(last_iid)
+            history_tree.see(last_iid)
+    
+    def _on_history_select(self, event=None):
+        """
+        History table selection callback. The entry is shown straight away if
+        the history tab is open, otherwise once it is (diagnoses open the
+        results tab).
+        """
+        if self.results_tabview.get() == "Diagnosis History":
+            # Debounced, so holding an arrow key only shows the row it stops on
+            if self._history_select_after_id:
+                self.root.after_cancel(self._history_select_after_id)
+            self._history_select_after_id = self.root.after(HISTORY_SELECT_DELAY, self._load_selected_history_item)
+        else:
+            self._history_render_pending = True
+    
+    def _load_selected_history_item(self):
+        """Show the history entry selected when the debounce delay ran out."""
+        self._history_select_after_id = None
+        self.load_history_item()
     
     def load_history_item(self, event=None):
         """Load a selected history item."""
-        selection = self.history_listbox.curselection()
+        selection = self.history_tree.selection()
         if not selection:
             return
         
-        index = selection[0]
+        index = int(selection[0])
         history_item = self.diagnosis_history[index]
+        self._selected_history_item = history_item
+        self._history_render_pending = False
         
-        # Clear existing content
+        # Replace the content with a single insert call
         self.history_text.delete("1.0", tk.END)
+        self.history_text._textbox.insert(tk.END, *self._history_detail_segments(history_item))
+        
+        # The buttons act on whichever entry is selected, so they're only created once
+        if not self._history_buttons_built:
+            self._history_buttons_built = True
+            apply_button = self._history_apply_button = ctk.CTkButton(
+                self.history_buttons_frame,
+                text="Apply This Selection",
+                command=lambda: self.apply_history_selection(self._selected_history_item),
+                fg_color=UI_COLORS['primary'],
+                hover_color=UI_COLORS['primary_dark'],
+                font=get_font(12),
+                state="disabled" if self._diagnosis_running else "normal"
+            )
+            apply_button.pack(side=tk.LEFT, padx=10, pady=5)
+            
+            export_button = ctk.CTkButton(
+                self.history_buttons_frame,
+                text="Export",
+                command=lambda: self.show_export_menu(self._selected_history_item),
+                fg_color=UI_COLORS['secondary'],
+                hover_color=UI_COLORS['secondary_dark'],
+                font=get_font(12)
+            )
+            export_button.pack(side=tk.LEFT, padx=10, pady=5)
+    
+    def _history_detail_segments(self, history_item):
+        """
+        Get the history tab's text for an entry, formatting it on first use.
         
-        # Get access to the underlying text widget
-        text_widget = self.history_text._textbox
+        Args:
+            history_item: Entry from the diagnosis history
+            
+        Returns:
+            Tuple of alternating text and tag values for Text.insert
+        """
+        key = history_item["timestamp"]
+        segments = self._history_segments.get(key)
+        if segments is not None:
+            return segments
         
-        # Configure text tags
-        text_widget.tag_configure("title", font=(DEFAULT_FONT, 18, "bold"))
-        text_widget.tag_configure("subtitle", font=(DEFAULT_FONT, 14, "bold"))
-        text_widget.tag_configure("normal", font=(DEFAULT_FONT, 12))
-        text_widget.tag_configure("italic", font=(DEFAULT_FONT, 12, "italic"))
-        text_widget.tag_configure("bullet", font=(DEFAULT_FONT, 12, "bold"))
-        text_widget.tag_configure("link", font=(DEFAULT_FONT, 12, "underline"), foreground=UI_COLORS['primary'])
+        segments = []
+        add = lambda text, tag: segments.extend((text, tag))
         
         # Title with timestamp
-        timestamp = history_item["timestamp"].strftime("%Y-%m-%d %H:%M:%S")
-        self.history_text.insert(tk.END, f"Diagnosis from {timestamp}\n", "title")
-        self.history_text.insert(tk.END, f"Plant Type: {history_item['plant_type']}\n\n", "subtitle")
+        timestamp = format_timestamp(history_item["timestamp"])
+        add(f"Diagnosis from {timestamp}\n", "title")
+        add(f"Plant Type: {history_item['plant_type']}\n\n", "subtitle")
         
         # Symptoms
-        self.history_text.insert(tk.END, "Symptoms:\n", "subtitle")
+        add("Symptoms:\n", "subtitle")
         for symptom in history_item["symptoms"]:
             severity = history_item["severity"][symptom]
-            self.history_text.insert(tk.END, f"• {SYMPTOM_NAMES[symptom]} (Severity: {severity}/5)\n", "normal")
+            add(f"• {SYMPTOM_NAMES[symptom]} (Severity: {severity}/5)\n", "normal")
         
         # Environmental factors if present
         if history_item.get("environmental_factors"):
-            self.history_text.insert(tk.END, "\nEnvironmental Factors:\n", "subtitle")
+            add("\nEnvironmental Factors:\n", "subtitle")
             for factor, value in history_item["environmental_factors"].items():
                 display_factor = factor.replace('_', ' ').title()
                 display_value = value.replace('_', ' ').title()
-                self.history_text.insert(tk.END, f"• {display_factor}: {display_value}\n", "normal")
+                add(f"• {display_factor}: {display_value}\n", "normal")
         
         # Results summary
-        self.history_text.insert(tk.END, "\nResults:\n", "subtitle")
+        add("\nResults:\n", "subtitle")
         for result in history_item["results"]:
-            self.history_text.insert(tk.END, f"• {result['name']} ({result['confidence']}%)\n", "normal")
+            add(f"• {result['name']} ({result['confidence']}%)\n", "normal")
         
-        # Clear buttons frame first
-        for widget in self.history_buttons_frame.winfo_children():
-            widget.destroy()
-        
-        # Add buttons to the buttons frame
-        apply_button = ctk.CTkButton(
-            self.history_buttons_frame,
-            text="Apply This Selection",
-            command=lambda: self.apply_history_selection(history_item),
-            fg_color=UI_COLORS['primary'],
-            hover_color=UI_COLORS['primary_dark'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
-        )
-        apply_button.pack(side=tk.LEFT, padx=10, pady=5)
-        
-        export_button = ctk.CTkButton(
-            self.history_buttons_frame,
-            text="Export",
-            command=lambda: self.show_export_menu(history_item),
-            fg_color=UI_COLORS['secondary'],
-            hover_color=UI_COLORS['secondary_dark'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
-        )
-        export_button.pack(side=tk.LEFT, padx=10, pady=5)
+        segments = self._history_segments[key] = tuple(segments)
+        return segments
     
     def apply_history_selection(self, history_item):
         """Apply a history item's symptom selection and severity to the current view."""
+        # The selection can't change under a running diagnosis
+        if self._diagnosis_running:
+            return
+        
         # Clear current selection
         self.clear_selection()
         
@@ -1651,10 +2349,10 @@ class PlantDiseaseExpertGUI:
         
         # Set symptoms and severity
         for symptom in history_item["symptoms"]:
-            if symptom in self.symptom_vars:
+            if symptom in SYMPTOM_NAMES:
                 self.symptom_vars[symptom].set(True)
                 if symptom in history_item["severity"]:
-                    self.severity_vars[symptom].set(history_item["severity"][symptom])
+                    self._set_severity(symptom, history_item["severity"][symptom])
         
         # Set environmental factors if present
         if history_item.get("environmental_factors") and self.env_expanded.get():
@@ -1665,8 +2363,9 @@ class PlantDiseaseExpertGUI:
         # Show a notification
         self.show_snackbar("Applied history selection")
         
-        # Diagnose with the loaded selection
-        self.diagnose()
+        # Diagnose with the loaded selection (reusing the entry's results if the
+        # whole selection could be restored)
+        self.diagnose(cached_diagnosis=history_item)
     
     def clear_selection(self):
         """Clear all selected symptoms and reset severity values."""
@@ -1674,9 +2373,10 @@ class PlantDiseaseExpertGUI:
         for var in self.symptom_vars.values():
             var.set(False)
         
-        # Reset severity values
-        for var in self.severity_vars.values():
-            var.set(3)  # Reset to medium severity
+        # Reset severity values (including variables not created yet)
+        self.severity_vars.default = "3"
+        for symptom in self.severity_vars:
+            self._set_severity(symptom, 3)  # Reset to medium severity
         
         # Reset environmental factors
         for var in self.environmental_factors.values():
@@ -1720,7 +2420,7 @@ class PlantDiseaseExpertGUI:
         title_label = ctk.CTkLabel(
             options_frame,
             text="Export Results",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=16, weight="bold")
+            font=get_font(16, weight="bold")
         )
         title_label.pack(pady=(0, 15))
         
@@ -1731,7 +2431,7 @@ class PlantDiseaseExpertGUI:
             command=lambda: self.export_as_text(history_item),
             fg_color=UI_COLORS['primary'],
             hover_color=UI_COLORS['primary_dark'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         text_button.pack(fill=tk.X, pady=5)
         
@@ -1743,14 +2443,14 @@ class PlantDiseaseExpertGUI:
                 command=lambda: self.export_as_pdf(history_item),
                 fg_color=UI_COLORS['primary'],
                 hover_color=UI_COLORS['primary_dark'],
-                font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+                font=get_font(12)
             )
             pdf_button.pack(fill=tk.X, pady=5)
         else:
             pdf_note = ctk.CTkLabel(
                 options_frame,
                 text="Install ReportLab package for PDF export",
-                font=ctk.CTkFont(family=DEFAULT_FONT, size=11, slant="italic"),
+                font=get_font(11, slant="italic"),
                 text_color=UI_COLORS['text_secondary']
             )
             pdf_note.pack(pady=5)
@@ -1762,7 +2462,7 @@ class PlantDiseaseExpertGUI:
             command=lambda: self.export_as_json(history_item),
             fg_color=UI_COLORS['primary'],
             hover_color=UI_COLORS['primary_dark'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         json_button.pack(fill=tk.X, pady=5)
         
@@ -1772,14 +2472,29 @@ class PlantDiseaseExpertGUI:
             text="Cancel",
             command=export_menu.destroy,
             fg_color=UI_COLORS['text_secondary'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         close_button.pack(fill=tk.X, pady=(10, 0))
     
-    def export_as_text(self, history_item=None):
-        """Export diagnosis results as a text file."""
-        # Use either the specified history item or current results
+    def _export_snapshot(self, history_item=None):
+        """
+        Gather what the text and PDF exports need, from a history entry or the
+        current diagnosis.
+        
+        The snapshot of the last exported history entry is kept, so exporting
+        the same entry in another format reuses it.
+        
+        Args:
+            history_item: History entry to export (None for the current results)
+            
+        Returns:
+            Tuple of (results, symptoms, severity levels (integers 1-5), plant type,
+            environmental factors or None, timestamp)
+        """
         if history_item:
+            cached_item, snapshot = self._last_export_snapshot
+            if cached_item is history_item:
+                return snapshot
             results = history_item["results"]
             symptoms = history_item["symptoms"]
             severity = history_item["severity"]
@@ -1788,27 +2503,29 @@ class PlantDiseaseExpertGUI:
             timestamp = history_item["timestamp"]
         else:
             results = self.current_results
-            symptoms = [s for s, v in self.symptom_vars.items() if v.get()]
-            severity = {s: self.severity_vars[s].get() for s in symptoms}
+            symptoms, severity = self.get_symptom_selection()
             plant_type = self.current_plant_type.get()
             env_factors = {k: v.get() for k, v in self.environmental_factors.items()} if self.env_expanded.get() else None
             timestamp = datetime.datetime.now()
         
+        # Valid severity levels, normalized once up front. A new dict, so a
+        # history entry's own values are left as they were
+        severity = {symptom: normalize_severity(value) for symptom, value in severity.items()}
+        
+        snapshot = (results, symptoms, severity, plant_type, env_factors, timestamp)
+        if history_item:
+            self._last_export_snapshot = (history_item, snapshot)
+        return snapshot
+    
+    def export_as_text(self, history_item=None):
+        """Export diagnosis results as a text file."""
+        # Use either the specified history item or current results
+        results, symptoms, severity, plant_type, env_factors, timestamp = self._export_snapshot(history_item)
+        
         if not results:
             messagebox.showinfo("No Results", "No diagnosis results to export.")
             return
         
-        # Ensure we have valid severity values (integers 1-5)
-        for s in severity:
-            if isinstance(severity[s], str):
-                try:
-                    severity[s] = int(severity[s])
-                except (ValueError, TypeError):
-                    severity[s] = 3  # Default to medium severity
-            # Ensure value is in valid range
-            if severity[s] < 1 or severity[s] > 5:
-                severity[s] = 3  # Default to medium severity
-        
         filename = filedialog.asksaveasfilename(
             initialdir=self.saved_data_dir,
             title="Export Results as Text",
@@ -1820,84 +2537,65 @@ class PlantDiseaseExpertGUI:
             return
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                f.write(f"{APP_NAME} - DIAGNOSIS RESULTS\n")
-                f.write("=" * 50 + "\n\n")
-                f.write(f"Date: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+            # Build the whole report first, then write it with a single call
+            parts = []
+            write = parts.append
+            write(f"{APP_NAME} - DIAGNOSIS RESULTS\n")
+            write(_TEXT_EXPORT_TITLE_RULE)
+            write(f"Date: {format_timestamp(timestamp)}\n\n")
+            
+            # Plant type
+            write(f"Plant Type: {plant_type}\n\n")
+            
+            # Environmental factors if available
+            if env_factors:
+                write("Environmental Factors:\n")
+                for factor, value in env_factors.items():
+                    display_factor = factor.replace('_', ' ').title()
+                    display_value = value.replace('_', ' ').title()
+                    write(f"- {display_factor}: {display_value}\n")
+                write("\n")
+            
+            # Observed symptoms
+            write("Observed Symptoms:\n")
+            for symptom in symptoms:
+                write(f"- {symptom_severity_label(symptom, severity.get(symptom, 3))}\n")
+            write("\n")
+            
+            # Write diagnosis results
+            write(f"Found {len(results)} potential diagnoses:\n\n")
+            
+            for i, result in enumerate(results, 1):
+                write(f"{i}. {result['name']}\n")
+                write(f"   Confidence: {result['confidence']}%\n\n")
                 
-                # Plant type
-                f.write(f"Plant Type: {plant_type}\n\n")
+                write(f"   Description:\n   {result['description']}\n\n")
                 
-                # Environmental factors if available
-                if env_factors:
-                    f.write("Environmental Factors:\n")
-                    for factor, value in env_factors.items():
-                        display_factor = factor.replace('_', ' ').title()
-                        display_value = value.replace('_', ' ').title()
-                        f.write(f"- {display_factor}: {display_value}\n")
-                    f.write("\n")
+                # Severity impact if available
+                if 'severity_impact' in result and result['severity_impact']:
+                    write(f"   Severity Impact:\n")
+                    for level, impact in result['severity_impact'].items():
+                        write(f"   - {level.title()}: {impact}\n")
+                    write("\n")
                 
-                # Observed symptoms
-                f.write("Observed Symptoms:\n")
-                for symptom in symptoms:
-                    symptom_severity = severity.get(symptom, 3)
-                    # Ensure severity is an integer
-                    if isinstance(symptom_severity, str):
-                        try:
-                            symptom_severity = int(symptom_severity)
-                        except (ValueError, TypeError):
-                            symptom_severity = 3
-                    # Ensure severity is in valid range
-                    if symptom_severity < 1 or symptom_severity > 5:
-                        symptom_severity = 3
-                    
-                    severity_text = SYMPTOM_SEVERITY[symptom_severity]
-                    f.write(f"- {SYMPTOM_NAMES[symptom]} (Severity: {symptom_severity}/5 - {severity_text})\n")
-                f.write("\n")
+                write(f"   Treatment:\n   {result['treatment']}\n\n")
                 
-                # Write diagnosis results
-                f.write(f"Found {len(results)} potential diagnoses:\n\n")
+                if result['product_recommendations']:
+                    write(f"   Recommended Products:\n")
+                    for product in result['product_recommendations']:
+                        write(f"   - {product['name']} ({product['type']})\n")
+                        write(f"     {product['description']}\n")
+                    write("\n")
+                
+                write(f"   Matching Symptoms:\n")
+                for symptom in result['matching_symptoms']:
+                    write(f"   - {symptom_severity_label(symptom, severity.get(symptom, 3))}\n")
                 
-                for i, result in enumerate(results, 1):
-                    f.write(f"{i}. {result['name']}\n")
-                    f.write(f"   Confidence: {result['confidence']}%\n\n")
-                    
-                    f.write(f"   Description:\n   {result['description']}\n\n")
-                    
-                    # Severity impact if available
-                    if 'severity_impact' in result and result['severity_impact']:
-                        f.write(f"   Severity Impact:\n")
-                        for level, impact in result['severity_impact'].items():
-                            f.write(f"   - {level.title()}: {impact}\n")
-                        f.write("\n")
-                    
-                    f.write(f"   Treatment:\n   {result['treatment']}\n\n")
-                    
-                    if result['product_recommendations']:
-                        f.write(f"   Recommended Products:\n")
-                        for product in result['product_recommendations']:
-                            f.write(f"   - {product['name']} ({product['type']})\n")
-                            f.write(f"     {product['description']}\n")
-                        f.write("\n")
-                    
-                    f.write(f"   Matching Symptoms:\n")
-                    for symptom in result['matching_symptoms']:
-                        symptom_severity = severity.get(symptom, 3)
-                        # Ensure severity is an integer
-                        if isinstance(symptom_severity, str):
-                            try:
-                                symptom_severity = int(symptom_severity)
-                            except (ValueError, TypeError):
-                                symptom_severity = 3
-                        # Ensure severity is in valid range
-                        if symptom_severity < 1 or symptom_severity > 5:
-                            symptom_severity = 3
-                            
-                        severity_text = SYMPTOM_SEVERITY[symptom_severity]
-                        f.write(f"   - {SYMPTOM_NAMES[symptom]} (Severity: {symptom_severity}/5 - {severity_text})\n")
-                    
-                    if i < len(results):
-                        f.write("\n" + "-" * 50 + "\n\n")
+                if i < len(results):
+                    write(_TEXT_EXPORT_DIVIDER)
+            
+            with open(filename, 'w', encoding='utf-8') as f:
+                f.write("".join(parts))
             
             messagebox.showinfo("Success", f"Results exported to {os.path.basename(filename)}.")
         except Exception as e:
@@ -1909,38 +2607,20 @@ class PlantDiseaseExpertGUI:
             messagebox.showinfo("Feature Not Available", 
                                "PDF export requires the ReportLab library. Please install it with 'pip install reportlab'.")
             return
+        
+        # Imported on first export, to keep reportlab off the startup path
+        from reportlab.lib.pagesizes import letter
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, ListItem, ListFlowable, HRFlowable, Image as ReportLabImage
+        from reportlab.lib.units import inch
+        from reportlab.lib import colors
             
         # Use either the specified history item or current results
-        if history_item:
-            results = history_item["results"]
-            symptoms = history_item["symptoms"]
-            severity = history_item["severity"]
-            plant_type = history_item["plant_type"]
-            env_factors = history_item.get("environmental_factors")
-            timestamp = history_item["timestamp"]
-        else:
-            results = self.current_results
-            symptoms = [s for s, v in self.symptom_vars.items() if v.get()]
-            severity = {s: self.severity_vars[s].get() for s in symptoms}
-            plant_type = self.current_plant_type.get()
-            env_factors = {k: v.get() for k, v in self.environmental_factors.items()} if self.env_expanded.get() else None
-            timestamp = datetime.datetime.now()
+        results, symptoms, severity, plant_type, env_factors, timestamp = self._export_snapshot(history_item)
         
         if not results:
             messagebox.showinfo("No Results", "No diagnosis results to export.")
             return
         
-        # Ensure we have valid severity values (integers 1-5)
-        for s in severity:
-            if isinstance(severity[s], str):
-                try:
-                    severity[s] = int(severity[s])
-                except (ValueError, TypeError):
-                    severity[s] = 3  # Default to medium severity
-            # Ensure value is in valid range
-            if severity[s] < 1 or severity[s] > 5:
-                severity[s] = 3  # Default to medium severity
-        
         filename = filedialog.asksaveasfilename(
             initialdir=self.saved_data_dir,
             title="Export Results as PDF",
@@ -1954,22 +2634,10 @@ class PlantDiseaseExpertGUI:
         try:
             # Create document
             doc = SimpleDocTemplate(filename, pagesize=letter)
-            styles = getSampleStyleSheet()
+            # Shared styles, including the custom header and confidence styles
+            styles, confidence_styles = get_pdf_styles()
             elements = []
             
-            # Add custom styles
-            styles.add(ParagraphStyle(
-                name='GreenHeader',
-                parent=styles['Heading2'],
-                textColor=colors.HexColor(UI_COLORS['primary'].replace('#', '#'))
-            ))
-            
-            styles.add(ParagraphStyle(
-                name='SectionHeader',
-                parent=styles['Heading3'],
-                textColor=colors.HexColor(UI_COLORS['primary_dark'].replace('#', '#'))
-            ))
-            
             # Title and logo
             title_text = f"{APP_NAME} - Diagnosis Results"
             title = Paragraph(title_text, styles['Title'])
@@ -1987,7 +2655,7 @@ class PlantDiseaseExpertGUI:
                 pass  # Skip if logo can't be added
             
             # Date and plant type
-            date_str = f"Date: {timestamp.strftime('%Y-%m-%d %H:%M:%S')}"
+            date_str = f"Date: {format_timestamp(timestamp)}"
             elements.append(Paragraph(date_str, styles['Normal']))
             elements.append(Spacer(1, 6))
             
@@ -1995,38 +2663,31 @@ class PlantDiseaseExpertGUI:
             elements.append(Paragraph(plant_str, styles['Normal']))
             elements.append(Spacer(1, 12))
             
+            # Styles looked up once for all the paragraphs below
+            normal = styles['Normal']
+            section_header = styles['SectionHeader']
+            
+            def bullet_list(texts):
+                """Bulleted list of normal paragraphs, or None if there are no texts."""
+                items = [ListItem(Paragraph(text, normal)) for text in texts]
+                return ListFlowable(items, bulletType='bullet', start=None) if items else None
+            
             # Environmental factors if available
             if env_factors:
-                elements.append(Paragraph("Environmental Factors:", styles['SectionHeader']))
-                env_items = []
-                for factor, value in env_factors.items():
-                    display_factor = factor.replace('_', ' ').title()
-                    display_value = value.replace('_', ' ').title()
-                    env_items.append(ListItem(Paragraph(f"{display_factor}: {display_value}", styles['Normal'])))
-                if env_items:
-                    elements.append(ListFlowable(env_items, bulletType='bullet', start=None))
+                elements.append(Paragraph("Environmental Factors:", section_header))
+                env_list = bullet_list(
+                    f"{factor.replace('_', ' ').title()}: {value.replace('_', ' ').title()}"
+                    for factor, value in env_factors.items()
+                )
+                if env_list:
+                    elements.append(env_list)
             elements.append(Spacer(1, 12))
             
             # Observed symptoms
-            elements.append(Paragraph("Observed Symptoms:", styles['SectionHeader']))
-            symptom_items = []
-            for symptom in symptoms:
-                symptom_severity = severity.get(symptom, 3)
-                # Ensure severity is an integer
-                if isinstance(symptom_severity, str):
-                    try:
-                        symptom_severity = int(symptom_severity)
-                    except (ValueError, TypeError):
-                        symptom_severity = 3
-                # Ensure severity is in valid range
-                if symptom_severity < 1 or symptom_severity > 5:
-                    symptom_severity = 3
-                    
-                severity_text = SYMPTOM_SEVERITY[symptom_severity]
-                symptom_text = f"{SYMPTOM_NAMES[symptom]} (Severity: {symptom_severity}/5 - {severity_text})"
-                symptom_items.append(ListItem(Paragraph(symptom_text, styles['Normal'])))
-            if symptom_items:
-                elements.append(ListFlowable(symptom_items, bulletType='bullet', start=None))
+            elements.append(Paragraph("Observed Symptoms:", section_header))
+            symptom_list = bullet_list(symptom_severity_label(symptom, severity.get(symptom, 3)) for symptom in symptoms)
+            if symptom_list:
+                elements.append(symptom_list)
             elements.append(Spacer(1, 12))
             
             # Diagnoses header
@@ -2034,19 +2695,15 @@ class PlantDiseaseExpertGUI:
             elements.append(Paragraph(diagnoses_header, styles['GreenHeader']))
             elements.append(Spacer(1, 6))
             
+            # Separator between diseases, built once and reused (it holds no
+            # per-use state, unlike a Paragraph that would be parsed each time)
+            separator = (Spacer(1, 12), HRFlowable(width="100%", thickness=0.5, color=colors.grey), Spacer(1, 12))
+            
             # Each diagnosis
             for i, result in enumerate(results, 1):
-                # Create colored style for confidence
+                # Colored style for confidence
                 confidence = result['confidence']
-                confidence_color = colors.green if confidence >= 75 else \
-                                  colors.orange if confidence >= 50 else \
-                                  colors.red
-                
-                confidence_style = ParagraphStyle(
-                    name=f'Confidence{i}',
-                    parent=styles['Normal'],
-                    textColor=confidence_color
-                )
+                confidence_style = confidence_styles[confidence_tag(confidence)]
                 
                 # Disease name and confidence
                 disease_name = f"{i}. {result['name']}"
@@ -2055,68 +2712,50 @@ class PlantDiseaseExpertGUI:
                 elements.append(Spacer(1, 6))
                 
                 # Description
-                elements.append(Paragraph("Description:", styles['SectionHeader']))
-                elements.append(Paragraph(result['description'], styles['Normal']))
+                elements.append(Paragraph("Description:", section_header))
+                elements.append(Paragraph(result['description'], normal))
                 elements.append(Spacer(1, 6))
                 
                 # Severity impact if available
                 if 'severity_impact' in result and result['severity_impact']:
-                    elements.append(Paragraph("Severity Impact:", styles['SectionHeader']))
-                    impact_items = []
-                    for level, impact in result['severity_impact'].items():
-                        level_text = f"{level.title()}: {impact}"
-                        impact_items.append(ListItem(Paragraph(level_text, styles['Normal'])))
-                    if impact_items:
-                        elements.append(ListFlowable(impact_items, bulletType='bullet', start=None))
+                    elements.append(Paragraph("Severity Impact:", section_header))
+                    impact_list = bullet_list(
+                        f"{level.title()}: {impact}" for level, impact in result['severity_impact'].items()
+                    )
+                    if impact_list:
+                        elements.append(impact_list)
                 elements.append(Spacer(1, 6))
                 
                 # Treatment
-                elements.append(Paragraph("Treatment:", styles['SectionHeader']))
-                elements.append(Paragraph(result['treatment'], styles['Normal']))
+                elements.append(Paragraph("Treatment:", section_header))
+                elements.append(Paragraph(result['treatment'], normal))
                 elements.append(Spacer(1, 6))
                 
-                # Product Recommendations
+                # Product Recommendations (name and type, then the indented description)
                 if result['product_recommendations']:
-                    elements.append(Paragraph("Recommended Products:", styles['SectionHeader']))
-                    product_items = []
-                    for product in result['product_recommendations']:
-                        product_text = f"{product['name']} ({product['type']})"
-                        desc_text = f"{product['description']}"
-                        
-                        product_items.append(ListItem(Paragraph(product_text, styles['Normal'])))
-                        product_items.append(ListItem(Paragraph(desc_text, styles['Normal']), leftIndent=20))
-                    
-                    if product_items:
-                        elements.append(ListFlowable(product_items, bulletType='bullet', start=None))
+                    elements.append(Paragraph("Recommended Products:", section_header))
+                    product_items = [
+                        item
+                        for product in result['product_recommendations']
+                        for item in (
+                            ListItem(Paragraph(f"{product['name']} ({product['type']})", normal)),
+                            ListItem(Paragraph(product['description'], normal), leftIndent=20)
+                        )
+                    ]
+                    elements.append(ListFlowable(product_items, bulletType='bullet', start=None))
                     elements.append(Spacer(1, 6))
                 
                 # Matching symptoms
-                elements.append(Paragraph("Matching Symptoms:", styles['SectionHeader']))
-                matching_items = []
-                for symptom in result['matching_symptoms']:
-                    symptom_severity = severity.get(symptom, 3)
-                    # Ensure severity is an integer
-                    if isinstance(symptom_severity, str):
-                        try:
-                            symptom_severity = int(symptom_severity)
-                        except (ValueError, TypeError):
-                            symptom_severity = 3
-                    # Ensure severity is in valid range
-                    if symptom_severity < 1 or symptom_severity > 5:
-                        symptom_severity = 3
-                        
-                    severity_text = SYMPTOM_SEVERITY[symptom_severity]
-                    symptom_text = f"{SYMPTOM_NAMES[symptom]} (Severity: {symptom_severity}/5 - {severity_text})"
-                    matching_items.append(ListItem(Paragraph(symptom_text, styles['Normal'])))
-                
-                if matching_items:
-                    elements.append(ListFlowable(matching_items, bulletType='bullet', start=None))
+                elements.append(Paragraph("Matching Symptoms:", section_header))
+                matching_list = bullet_list(
+                    symptom_severity_label(symptom, severity.get(symptom, 3)) for symptom in result['matching_symptoms']
+                )
+                if matching_list:
+                    elements.append(matching_list)
                 
                 # Separator between diseases
                 if i < len(results):
-                    elements.append(Spacer(1, 12))
-                    elements.append(Paragraph("-" * 50, styles['Normal']))
-                    elements.append(Spacer(1, 12))
+                    elements.extend(separator)
             
             # Build PDF
             doc.build(elements)
@@ -2130,18 +2769,19 @@ class PlantDiseaseExpertGUI:
         if history_item:
             export_data = history_item.copy()
             # Convert datetime to string
-            export_data["timestamp"] = export_data["timestamp"].strftime('%Y-%m-%d %H:%M:%S')
+            export_data["timestamp"] = format_timestamp(export_data["timestamp"])
         else:
             if not self.current_results:
                 messagebox.showinfo("No Results", "No diagnosis results to export.")
                 return
             
             # Prepare data
+            symptoms, severity = self.get_symptom_selection()
             export_data = {
                 "timestamp": datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
                 "plant_type": self.current_plant_type.get(),
-                "symptoms": [s for s, v in self.symptom_vars.items() if v.get()],
-                "severity": {s: self.severity_vars[s].get() for s in [s for s, v in self.symptom_vars.items() if v.get()]},
+                "symptoms": symptoms,
+                "severity": severity,
                 "results": self.current_results
             }
             
@@ -2160,8 +2800,10 @@ class PlantDiseaseExpertGUI:
             return
         
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(export_data, f, indent=2)
+            # Serialized in one go: json.dump writes each token separately
+            payload = encode_json(export_data)
+            with open(filename, 'wb') as f:
+                f.write(payload)
             messagebox.showinfo("Success", f"Results exported to {os.path.basename(filename)}.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export JSON: {str(e)}")
@@ -2169,7 +2811,7 @@ class PlantDiseaseExpertGUI:
     def save_symptom_selection(self):
         """Save the current symptom selection to a file."""
         # Get selected symptoms
-        selected_symptoms = [symptom for symptom, var in self.symptom_vars.items() if var.get()]
+        selected_symptoms, severity_data = self.get_symptom_selection()
         
         if not selected_symptoms:
             messagebox.showinfo("No Selection", "Please select at least one symptom to save.")
@@ -2178,7 +2820,7 @@ class PlantDiseaseExpertGUI:
         # Prepare data
         data = {
             "selected_symptoms": selected_symptoms,
-            "symptom_severity": {s: self.severity_vars[s].get() for s in selected_symptoms},
+            "symptom_severity": severity_data,
             "plant_type": self.current_plant_type.get(),
             "timestamp": datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         }
@@ -2200,8 +2842,10 @@ class PlantDiseaseExpertGUI:
         
         # Save to file
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2)
+            # Serialized in one go: json.dump writes each token separately
+            payload = encode_json(data)
+            with open(filename, 'wb') as f:
+                f.write(payload)
             messagebox.showinfo("Success", f"Symptom selection saved to {os.path.basename(filename)}.")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save file: {str(e)}")
@@ -2220,33 +2864,53 @@ class PlantDiseaseExpertGUI:
         
         # Load from file
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filename, 'rb') as f:
+                data = decode_json(f.read())
             
-            # Clear current selection
-            self.clear_selection()
+            # Clear current results
+            self.results_text.delete("1.0", tk.END)
+            self.current_results = []
+            self.status_label.configure(text=f"{APP_NAME} v{APP_VERSION} | Ready")
             
             # Set plant type if available
             if "plant_type" in data and data["plant_type"] in self.plant_types:
                 self.current_plant_type.set(data["plant_type"])
                 self.filter_symptoms_by_plant()
             
-            # Set loaded symptoms
-            for symptom in data.get("selected_symptoms", []):
-                if symptom in self.symptom_vars:
+            # Replace the current selection with the loaded one. Unlike clearing
+            # everything first, only the variables whose value changes are
+            # written, since each write updates the widgets bound to it
+            loaded_symptoms = {symptom for symptom in data.get("selected_symptoms", []) if symptom in SYMPTOM_NAMES}
+            for symptom, var in list(self.symptom_vars.items()):
+                selected = symptom in loaded_symptoms
+                if var.get() != selected:
+                    var.set(selected)
+            for symptom in loaded_symptoms:
+                if not self.symptom_vars[symptom].get():
                     self.symptom_vars[symptom].set(True)
             
-            # Set severity if available
-            for symptom, severity in data.get("symptom_severity", {}).items():
-                if symptom in self.severity_vars:
-                    self.severity_vars[symptom].set(severity)
+            # Severities not in the file are reset to medium (including
+            # variables created later)
+            self.severity_vars.default = "3"
+            loaded_severity = {
+                symptom: str(severity) for symptom, severity in data.get("symptom_severity", {}).items()
+                if symptom in SYMPTOM_NAMES
+            }
+            for symptom, var in list(self.severity_vars.items()):
+                severity = loaded_severity.pop(symptom, "3")
+                if var.get() != severity:
+                    self._set_severity(symptom, severity)
+            for symptom, severity in loaded_severity.items():
+                self._set_severity(symptom, severity)
+            
+            # Environmental factors not in the file are reset to moderate
+            loaded_factors = data.get("environmental_factors", {})
+            for factor, var in self.environmental_factors.items():
+                value = loaded_factors.get(factor, "moderate")
+                if var.get() != value:
+                    var.set(value)
             
-            # Set environmental factors if available
             if "environmental_factors" in data:
-                for factor, value in data["environmental_factors"].items():
-                    if factor in self.environmental_factors:
-                        self.environmental_factors[factor].set(value)
-                
                 # Show environmental factors panel
                 if not self.env_expanded.get():
                     self.toggle_env_factors()
@@ -2257,10 +2921,16 @@ class PlantDiseaseExpertGUI:
     
     def show_help(self):
         """Show help information."""
-        help_window = ctk.CTkToplevel(self.root)
+        if self._help_window is not None and self._help_window.winfo_exists():
+            self._show_cached_window(self._help_window)
+            return
+        
+        help_window = self._help_window = ctk.CTkToplevel(self.root)
         help_window.title("Help")
         help_window.geometry("600x500")
         help_window.transient(self.root)
+        # Closing only hides the window, so the help is built once
+        help_window.protocol("WM_DELETE_WINDOW", help_window.withdraw)
         
         # Help content
         help_frame = ctk.CTkScrollableFrame(help_window)
@@ -2270,7 +2940,7 @@ class PlantDiseaseExpertGUI:
         title_label = ctk.CTkLabel(
             help_frame,
             text="Plant Disease Expert System - Help",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=16, weight="bold")
+            font=get_font(16, weight="bold")
         )
         title_label.pack(pady=(0, 15))
         
@@ -2307,7 +2977,7 @@ class PlantDiseaseExpertGUI:
             section_label = ctk.CTkLabel(
                 help_frame,
                 text=title,
-                font=ctk.CTkFont(family=DEFAULT_FONT, size=14, weight="bold"),
+                font=get_font(14, weight="bold"),
                 anchor="w"
             )
             section_label.pack(fill=tk.X, pady=(10, 5))
@@ -2316,7 +2986,7 @@ class PlantDiseaseExpertGUI:
                 item_label = ctk.CTkLabel(
                     help_frame,
                     text=item,
-                    font=ctk.CTkFont(family=DEFAULT_FONT, size=12),
+                    font=get_font(12),
                     wraplength=550,
                     anchor="w",
                     justify="left"
@@ -2327,18 +2997,24 @@ class PlantDiseaseExpertGUI:
         close_button = ctk.CTkButton(
             help_frame,
             text="Close",
-            command=help_window.destroy,
+            command=help_window.withdraw,
             fg_color=UI_COLORS['primary'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         close_button.pack(pady=15)
     
     def show_about(self):
         """Show about information."""
-        about_window = ctk.CTkToplevel(self.root)
+        if self._about_window is not None and self._about_window.winfo_exists():
+            self._show_cached_window(self._about_window)
+            return
+        
+        about_window = self._about_window = ctk.CTkToplevel(self.root)
         about_window.title("About")
         about_window.geometry("400x400")
         about_window.transient(self.root)
+        # Closing only hides the window, so it is built once
+        about_window.protocol("WM_DELETE_WINDOW", about_window.withdraw)
         
         # About content
         about_frame = ctk.CTkFrame(about_window)
@@ -2346,34 +3022,31 @@ class PlantDiseaseExpertGUI:
         
         # Logo
         try:
-            logo_path = os.path.join(ASSETS_DIR, "plant_logo.png")
-            if os.path.exists(logo_path):
-                logo_img = Image.open(logo_path).resize((100, 100))
-                logo_photo = ImageTk.PhotoImage(logo_img)
-                logo_label = ctk.CTkLabel(about_frame, image=logo_photo, text="")
-                logo_label.image = logo_photo
+            logo_image = get_image(os.path.join(ASSETS_DIR, "plant_logo.png"), (100, 100))
+            if logo_image:
+                logo_label = ctk.CTkLabel(about_frame, image=logo_image, text="")
                 logo_label.pack(pady=10)
             else:
                 # Emoji as fallback
-                logo_label = ctk.CTkLabel(about_frame, text="🌿", font=ctk.CTkFont(size=48))
+                logo_label = ctk.CTkLabel(about_frame, text="🌿", font=get_font(48, family=None))
                 logo_label.pack(pady=10)
         except Exception:
             # Fallback if image loading fails
-            logo_label = ctk.CTkLabel(about_frame, text="🌿", font=ctk.CTkFont(size=48))
+            logo_label = ctk.CTkLabel(about_frame, text="🌿", font=get_font(48, family=None))
             logo_label.pack(pady=10)
         
         # App info
         app_label = ctk.CTkLabel(
             about_frame,
             text=f"{APP_NAME}",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=16, weight="bold")
+            font=get_font(16, weight="bold")
         )
         app_label.pack(pady=(0, 5))
         
         version_label = ctk.CTkLabel(
             about_frame,
             text=f"Version {APP_VERSION}",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         version_label.pack(pady=(0, 10))
                 
@@ -2387,7 +3060,7 @@ class PlantDiseaseExpertGUI:
         desc_label = ctk.CTkLabel(
             about_frame,
             text=description,
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12),
+            font=get_font(12),
             wraplength=350,
             justify="center"
         )
@@ -2397,7 +3070,7 @@ class PlantDiseaseExpertGUI:
         credits_label = ctk.CTkLabel(
             about_frame,
             text="Developed as an expert systems project",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=11, slant="italic"),
+            font=get_font(11, slant="italic"),
             text_color=UI_COLORS['text_secondary']
         )
         credits_label.pack(pady=(20, 5))
@@ -2406,33 +3079,46 @@ class PlantDiseaseExpertGUI:
         close_button = ctk.CTkButton(
             about_frame,
             text="Close",
-            command=about_window.destroy,
+            command=about_window.withdraw,
             fg_color=UI_COLORS['primary'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         close_button.pack(pady=15)
-
-    def adjust_color_opacity(self, hex_color, opacity):
-        """Convert hex color to RGBA with opacity."""
-        # Remove # if present
-        hex_color = hex_color.lstrip('#')
-        # Convert hex to RGB
-        r = int(hex_color[0:2], 16)
-        g = int(hex_color[2:4], 16)
-        b = int(hex_color[4:6], 16)
-        # Calculate the tint (mix with white)
-        r = int(r + (255 - r) * (1 - opacity))
-        g = int(g + (255 - g) * (1 - opacity))
-        b = int(b + (255 - b) * (1 - opacity))
-        # Convert back to hex
-        return f"#{r:02x}{g:02x}{b:02x}"
+    
+    def _show_cached_window(self, window):
+        """
+        Show a previously built window again, in front of the main window.
+        
+        Args:
+            window: Toplevel window that was hidden when it was closed
+        """
+        window.deiconify()
+        window.lift()
+        window.focus_set()
 
     def highlight_text(self, text, tag, bg_color):
         """Insert text with a highlight background."""
+        self.results_text.insert(tk.END, text, self.highlight_tag(tag, bg_color))
+
+    def highlight_tag(self, tag, bg_color):
+        """
+        Get the highlighted variant of a results text tag, configuring it on first use.
+        
+        Args:
+            tag: Existing text tag to take the font and color from
+            bg_color: Highlight background color
+            
+        Returns:
+            Name of the highlight tag
+        """
         highlight_tag = f"{tag}_highlight"
-        text_widget = self.results_text._textbox
         
-        if highlight_tag not in text_widget.tag_names():
+        # Tracked on the Python side, rather than asking Tk for every tag
+        # name each time a result is shown
+        if highlight_tag not in self._highlight_tags:
+            self._highlight_tags.add(highlight_tag)
+            text_widget = self.results_text._textbox
+            
             # Get the font from existing tag
             font = text_widget.tag_cget(tag, "font")
             fg = text_widget.tag_cget(tag, "foreground")
@@ -2444,13 +3130,7 @@ class PlantDiseaseExpertGUI:
                 background=bg_color
             )
         
-        self.results_text.insert(tk.END, text, highlight_tag)
-
-    def apply_scaling(self, size):
-        """Apply scaling factor to a size value."""
-        if SCALING_ENABLED:
-            return int(size * DEFAULT_SCALING_FACTOR)
-        return size
+        return highlight_tag
 
     def update_scaling_factor(self):
         """Update scaling factor based on window size."""
@@ -2460,67 +3140,17 @@ class PlantDiseaseExpertGUI:
         
         # Adjust scaling factor based on window size
         if window_width < 800 or window_height < 600:
-            DEFAULT_SCALING_FACTOR = 0.8
+            scaling_factor = 0.8
         elif window_width > 1600 or window_height > 1000:
-            DEFAULT_SCALING_FACTOR = 1.2
+            scaling_factor = 1.2
         else:
-            DEFAULT_SCALING_FACTOR = 1.0
-        
-        # Update UI elements that need to be scaled
-        self.refresh_ui()
-
-    def refresh_ui(self):
-        """Refresh UI elements when scaling changes."""
-        # Update font sizes
-        self.update_font_sizes()
-        # Reapply padding
-        self.apply_padding()
-        # Refresh symptom display
-        self.update_symptom_display()
-
-    def update_font_sizes(self):
-        """Update font sizes based on scaling factor."""
-        # Update text tags in results display
-        if hasattr(self, 'results_text'):
-            # Define base font sizes
-            base_sizes = {
-                "title": 18,
-                "subtitle": 14,
-                "confidence": 13,
-                "normal": 12,
-                "bullet": 12,
-                "italic": 12,
-                "divider": 12
-            }
-            
-            # Access the underlying tkinter Text widget
-            text_widget = self.results_text._textbox
-            
-            # Apply scaling to each font
-            for tag, base_size in base_sizes.items():
-                scaled_size = self.apply_scaling(base_size)
-                # Update tags that exist
-                if tag == "title":
-                    text_widget.tag_configure("title", font=(DEFAULT_FONT, scaled_size, "bold"))
-                elif tag == "subtitle":
-                    text_widget.tag_configure("subtitle", font=(DEFAULT_FONT, scaled_size, "bold"))
-                elif tag == "confidence":
-                    text_widget.tag_configure("confidence_high", font=(DEFAULT_FONT, scaled_size, "bold"), foreground=UI_COLORS['success'])
-                    text_widget.tag_configure("confidence_medium", font=(DEFAULT_FONT, scaled_size, "bold"), foreground=UI_COLORS['warning'])
-                    text_widget.tag_configure("confidence_low", font=(DEFAULT_FONT, scaled_size, "bold"), foreground=UI_COLORS['error'])
-                elif tag == "normal":
-                    text_widget.tag_configure("normal", font=(DEFAULT_FONT, scaled_size))
-                elif tag == "bullet":
-                    text_widget.tag_configure("bullet", font=(DEFAULT_FONT, scaled_size, "bold"))
-                elif tag == "italic":
-                    text_widget.tag_configure("italic", font=(DEFAULT_FONT, scaled_size, "italic"))
-                elif tag == "divider":
-                    text_widget.tag_configure("divider", font=(DEFAULT_FONT, scaled_size), foreground=UI_COLORS['text_secondary'])
-
-    def apply_padding(self):
-        """Apply appropriate padding based on scaling factor."""
-        # Can be used to adjust padding in different widgets based on scale
-        pass
+            scaling_factor = 1.0
+        
+        # customtkinter rescales every widget and font itself, so only tell it
+        # when the factor actually changes
+        if SCALING_ENABLED and scaling_factor != DEFAULT_SCALING_FACTOR:
+            DEFAULT_SCALING_FACTOR = scaling_factor
+            ctk.set_widget_scaling(scaling_factor)
 
     def on_window_resize(self, event):
         """Handle window resize event to update UI scaling."""
@@ -2544,6 +3174,10 @@ class PlantDiseaseExpertGUI:
         # Update search to apply plant-based filtering
         self.search_symptoms()
 
+    def _on_search_change(self, *args):
+        """Search variable trace: debounce keystrokes into a single search."""
+        self.search_symptoms()
+
     def search_symptoms(self):
         """Filter symptoms based on search query using debounce for better performance."""
         # Cancel any pending search update
@@ -2552,10 +3186,7 @@ class PlantDiseaseExpertGUI:
             self._search_after_id = None
             
         # Schedule a new search with delay (debounce)
-        self._search_after_id = self.root.after(
-            self._debounce_delay, 
-            lambda: self._perform_search()
-        )
+        self._search_after_id = self.root.after(self._debounce_delay, self._perform_search)
     
     def _perform_search(self):
         """Actual search implementation, called after debounce delay."""
@@ -2563,190 +3194,230 @@ class PlantDiseaseExpertGUI:
         
         search_query = self.search_var.get().strip().lower()
         plant_type = self.current_plant_type.get()
-        
-        # Get symptoms for current plant type
-        if plant_type == "All Plants":
-            plant_symptoms = ALL_SYMPTOMS
-        else:
-            # Use cached plant symptoms if available
-            if hasattr(self, '_cached_plant_symptoms') and plant_type in self._cached_plant_symptoms:
-                plant_symptoms = self._cached_plant_symptoms[plant_type]
-            else:
-                # Filter symptoms based on plant type from knowledge base
-                plant_diseases = []
-                for disease, data in self.engine.knowledge_base.items():
-                    if 'plant_types' in data and plant_type in data['plant_types']:
-                        plant_diseases.append(disease)
-                
-                # Get all symptoms for these diseases
-                plant_symptoms = []
-                for disease in plant_diseases:
-                    plant_symptoms.extend(self.engine.knowledge_base[disease]['symptoms'])
-                
-                # Remove duplicates
-                plant_symptoms = list(set(plant_symptoms))
-                
-                # If no plant-specific symptoms found, show all
-                if not plant_symptoms:
-                    plant_symptoms = ALL_SYMPTOMS
-                
-                # Cache the result
-                if not hasattr(self, '_cached_plant_symptoms'):
-                    self._cached_plant_symptoms = {}
-                self._cached_plant_symptoms[plant_type] = plant_symptoms
-        
-        if search_query:
-            # Use more efficient search algorithm
-            self.visible_symptoms = []
-            
-            # For very short queries, require exact match to avoid too many results
-            if len(search_query) < 3:
-                self.visible_symptoms = [
-                    s for s in plant_symptoms 
-                    if search_query in SYMPTOM_NAMES[s].lower().split()
-                ]
-            else:
-                # For longer queries, use more flexible matching
-                for s in plant_symptoms:
-                    symptom_name = SYMPTOM_NAMES[s].lower()
-                    # Add symptom if search term is found in the symptom name
-                    if search_query in symptom_name:
-                        self.visible_symptoms.append(s)
-                    # Also add symptom if individual words in search query match
-                    elif any(word in symptom_name for word in search_query.split() if len(word) > 2):
-                        self.visible_symptoms.append(s)
+        previous_query, previous_plant_type = self._last_search
+        
+        if (plant_type == previous_plant_type and len(previous_query) >= 3
+                and search_query.startswith(previous_query)
+                and len(search_query.split()) == 1):
+            # Typing on at the end of a single-word query: its matches are the
+            # previous matches that still contain it, so only those are checked
+            search_text = self._symptom_search_text
+            self.visible_symptoms = [s for s in self.visible_symptoms if search_query in search_text[s]]
         else:
-            # No search query, show all symptoms for current plant type
-            self.visible_symptoms = plant_symptoms.copy()
-        
-        # Remove duplicates that might have been added
-        self.visible_symptoms = list(dict.fromkeys(self.visible_symptoms))
+            self.visible_symptoms = list(self._find_symptoms(search_query, plant_type))
+        self._last_search = (search_query, plant_type)
         
         # Update the display
         self.update_symptom_display()
 
+    def _find_symptoms_uncached(self, search_query, plant_type):
+        """
+        Find the symptoms of a plant type that match a search query.
+        
+        Args:
+            search_query: Lowercased search text (empty to match all symptoms)
+            plant_type: Selected plant type
+            
+        Returns:
+            Tuple of matching symptom codes, sorted by name
+        """
+        # Get symptoms for current plant type (all symptoms if no plant-specific ones)
+        plant_symptoms = self._plant_to_symptoms.get(plant_type) or self._symptoms_by_name
+        
+        if not search_query:
+            # No search query, show all symptoms for current plant type
+            return tuple(plant_symptoms)
+        
+        # For very short queries, require exact match to avoid too many results
+        if len(search_query) < 3:
+            return tuple(s for s in plant_symptoms if search_query in self._symptom_search_words[s])
+        
+        # For longer queries, use more flexible matching: the whole query or any
+        # of its longer words found in the symptom name, as one compiled pattern
+        terms = [search_query] + [word for word in search_query.split() if len(word) > 2]
+        pattern = re.compile("|".join(map(re.escape, terms)))
+        search_text = self._symptom_search_text
+        return tuple(s for s in plant_symptoms if pattern.search(search_text[s]))
+
     def update_symptom_display(self):
         """Efficiently refreshes the symptoms display with filtered symptoms."""
         # Keep track of displayed symptoms for managing UI elements
         if not hasattr(self, '_displayed_symptoms'):
             self._displayed_symptoms = set()
         
-        # Get the list of currently displayed symptom widgets
-        existing_widgets = {}
-        for widget in self.symptoms_scrollable.winfo_children():
-            if hasattr(widget, 'symptom_id'):
-                existing_widgets[widget.symptom_id] = widget
-        
-        # Get the sorted list of symptoms to display
-        filtered_symptoms = sorted(self.visible_symptoms, 
-                                 key=lambda s: SYMPTOM_NAMES[s].lower())
-        
-        # Remove header if it exists
-        header_widgets = [w for w in self.symptoms_scrollable.winfo_children() 
-                         if hasattr(w, 'is_header') and w.is_header]
-        for widget in header_widgets:
-            widget.destroy()
-        
-        # Add header with symptoms count and clear all button
-        header_frame = ctk.CTkFrame(self.symptoms_scrollable, fg_color="transparent")
-        header_frame.is_header = True  # Mark as header
-        header_frame.pack(fill="x", padx=10, pady=(5, 0))
-        
-        symptoms_count = ctk.CTkLabel(
-            header_frame,
-            text=f"{len(filtered_symptoms)} symptoms",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
-        )
-        symptoms_count.pack(side="left", padx=5)
+        # This pass supersedes any pending batch of row creation
+        if getattr(self, '_row_batch_after_id', None):
+            self.root.after_cancel(self._row_batch_after_id)
+        self._row_batch_after_id = None
         
-        clear_all_button = ctk.CTkButton(
-            header_frame,
-            text="Clear All",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12),
-            width=80,
-            height=25,
-            command=self.clear_all_symptoms
-        )
-        clear_all_button.pack(side="right", padx=5)
-        
-        # Keep track of symptoms to keep
+        # Symptoms to display, already sorted by name by the search
+        filtered_symptoms = self.visible_symptoms
         symptoms_to_keep = set()
-        
-        # Add or update symptoms
-        for i, symptom in enumerate(filtered_symptoms):
-            symptoms_to_keep.add(symptom)
-            
-            if symptom in existing_widgets:
-                # Widget exists, just make sure it's visible and in the right order
-                widget = existing_widgets[symptom]
-                widget.pack(fill=tk.X, padx=5, pady=5)
-            else:
-                # Create new widget
-                self.create_symptom_row(self.symptoms_scrollable, symptom, i)
-        
-        # Hide widgets for symptoms that shouldn't be displayed
-        for symptom, widget in existing_widgets.items():
-            if symptom not in symptoms_to_keep:
-                widget.pack_forget()
+        rows_created = 0
+        
+        # Rebuild the rows with geometry propagation suspended, so the scrollable
+        # frame is laid out once rather than once per row
+        with self._batched_layout(self.symptoms_scrollable):
+            # Header with symptoms count and clear all button, created only once
+            if not hasattr(self, '_symptoms_header'):
+                header_frame = ctk.CTkFrame(self.symptoms_scrollable, fg_color="transparent")
+                header_frame.pack(fill="x", padx=10, pady=(5, 0))
+                
+                self._symptoms_count_label = ctk.CTkLabel(
+                    header_frame,
+                    font=get_font(12)
+                )
+                self._symptoms_count_label.pack(side="left", padx=5)
+                
+                clear_all_button = ctk.CTkButton(
+                    header_frame,
+                    text="Clear All",
+                    font=get_font(12),
+                    width=80,
+                    height=25,
+                    command=self.clear_all_symptoms
+                )
+                clear_all_button.pack(side="right", padx=5)
+                self._symptoms_header = header_frame
+            
+            self._symptoms_count_label.configure(text=f"{len(filtered_symptoms)} symptoms")
+            
+            # Symptom rows are reused rather than destroyed, and only the rows whose
+            # visibility changed are touched. Each newly shown row is packed right
+            # after the previous visible one, so the list stays in sorted order.
+            # Missing rows are created a batch at a time: the top of the list
+            # appears at once and the rest is filled in on later idle passes
+            previous_widget = self._symptoms_header
+            for i, symptom in enumerate(filtered_symptoms):
+                widget = self.symptom_frames.get(symptom)
+                if widget is None:
+                    if rows_created == SYMPTOM_ROW_BATCH_SIZE:
+                        continue
+                    rows_created += 1
+                    widget = self.create_symptom_row(self.symptoms_scrollable, symptom, i)
+                    widget.pack_configure(after=previous_widget)
+                elif symptom not in self._displayed_symptoms:
+                    widget.pack(fill=tk.X, padx=7, pady=7, after=previous_widget)
+                symptoms_to_keep.add(symptom)
+                previous_widget = widget
+            
+            # Hide widgets for symptoms that shouldn't be displayed
+            for symptom in self._displayed_symptoms - symptoms_to_keep:
+                self.symptom_frames[symptom].pack_forget()
         
         # Update the displayed symptoms set
         self._displayed_symptoms = symptoms_to_keep
+        
+        # Schedule the next batch if some rows still have to be created
+        if len(symptoms_to_keep) < len(filtered_symptoms):
+            self._row_batch_after_id = self.root.after_idle(self.update_symptom_display)
+
+    @contextmanager
+    def _batched_layout(self, container):
+        """
+        Suspend geometry propagation of a container while its children are
+        rebuilt, and recompute its layout once at the end.
+        
+        Args:
+            container: Widget whose packed children are being updated
+        """
+        container.pack_propagate(False)
+        try:
+            yield container
+        finally:
+            container.pack_propagate(True)
+            container.update_idletasks()
+
+    @contextmanager
+    def _batched_updates(self):
+        """
+        Collect the widget changes made through _configure_widget and apply
+        them when the outermost batch ends, with one configure() per widget.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                pending, self._pending_configs = self._pending_configs, {}
+                for widget, options in pending.items():
+                    # Skip widgets destroyed meanwhile, without asking Tk first
+                    try:
+                        widget.configure(**options)
+                    except tk.TclError:
+                        pass
+
+    def _configure_widget(self, widget, **options):
+        """
+        Configure a widget, or merge the options into the open batch of updates.
+        
+        Args:
+            widget: Widget to configure
+            **options: configure() options
+        """
+        if self._batch_depth:
+            self._pending_configs.setdefault(widget, {}).update(options)
+        else:
+            widget.configure(**options)
 
     def clear_all_symptoms(self):
         """Clear all selected symptoms"""
         # Clear the search box
         self.search_var.set("")
         
-        # Clear selected symptoms
-        for symptom in list(self.symptom_vars.keys()):
-            if self.symptom_vars[symptom].get():
-                self.symptom_vars[symptom].set(False)
-                self.on_symptom_toggle(symptom)
+        # Clear selected symptoms, hiding their severity frames in one layout
+        # pass. Severities are reset below, so the toggle handler skips it
+        self._bulk_update = True
+        try:
+            with self._batched_layout(self.symptoms_scrollable):
+                for symptom, var in self.symptom_vars.items():
+                    if var.get():
+                        var.set(False)
+                        self.on_symptom_toggle(symptom)
+        finally:
+            self._bulk_update = False
         
-        # Reset all severity sliders to 0
-        for symptom in list(self.severity_vars.keys()):
-            self.severity_vars[symptom].set("0")
+        # Reset all severity sliders to 0 (only the changed ones, since each
+        # write redraws that symptom's severity buttons)
+        self.severity_vars.default = "0"
+        for symptom, var in self.severity_vars.items():
+            if var.get() != "0":
+                self._set_severity(symptom, "0")
             
         self.show_snackbar("All symptoms cleared")
 
     def create_symptom_row(self, parent, symptom, row_index):
         """Create a row for a symptom with checkbox and severity buttons."""
-        # Base frame with improved styling
-        symptom_frame = ctk.CTkFrame(parent, fg_color="transparent")
-        symptom_frame.pack(fill=tk.X, padx=5, pady=5)
+        # Card frame with improved styling (the row itself, so each row costs
+        # one canvas-drawn frame less than a transparent wrapper around it)
+        symptom_frame = ctk.CTkFrame(parent, corner_radius=10, border_width=1, **_SYMPTOM_ROW_STYLE)
+        symptom_frame.pack(fill=tk.X, padx=7, pady=7)
         
-        # Store the symptom id and reference to find it later
-        symptom_frame.symptom_id = symptom
+        # Store a reference to find it later
         self.symptom_frames[symptom] = symptom_frame
         
-        # Create an inner frame with hover effect
-        inner_frame = ctk.CTkFrame(symptom_frame, fg_color=UI_COLORS['card_bg'], corner_radius=10, border_width=1, border_color=UI_COLORS['border'])
-        inner_frame.pack(fill=tk.X, padx=2, pady=2)
-        
-        # Simplified hover effect with less overhead
-        inner_frame.bind("<Enter>", lambda e, frame=inner_frame: frame.configure(
-            fg_color=UI_COLORS['hover'], 
-            border_color=UI_COLORS['primary_light']
-        ))
-        inner_frame.bind("<Leave>", lambda e, frame=inner_frame: frame.configure(
-            fg_color=UI_COLORS['card_bg'], 
-            border_color=UI_COLORS['border']
-        ))
+        # Hover effect, with handlers shared by every row
+        symptom_frame.bind("<Enter>", self._on_symptom_row_enter)
+        symptom_frame.bind("<Leave>", self._on_symptom_row_leave)
         
         # Top section with checkbox and severity button
-        top_frame = ctk.CTkFrame(inner_frame, fg_color="transparent")
-        top_frame.pack(side=tk.TOP, fill=tk.X, padx=10, pady=10)
+        # (rows are laid out with grid, so the severity controls below can be
+        # hidden with grid_remove and shown again without re-specifying them)
+        symptom_frame.grid_columnconfigure(0, weight=1)
+        top_frame = ctk.CTkFrame(symptom_frame, fg_color="transparent")
+        top_frame.grid(row=0, column=0, sticky="ew", padx=10, pady=10)
         
         # Checkbox with improved styling
         checkbox = ctk.CTkCheckBox(
             top_frame,
             text=SYMPTOM_NAMES[symptom],
             variable=self.symptom_vars[symptom],
-            command=lambda s=symptom: self.on_symptom_toggle(s),
+            command=partial(self.on_symptom_toggle, symptom),
             fg_color=UI_COLORS['primary'],
             hover_color=UI_COLORS['primary_dark'],
             border_color=UI_COLORS['border'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=13, weight="bold")
+            font=get_font(13, weight="bold")
         )
         checkbox.pack(side=tk.LEFT, anchor="w")
         
@@ -2756,176 +3427,142 @@ class PlantDiseaseExpertGUI:
         severity_button = ctk.CTkButton(
             top_frame,
             text="⚙️ Symptom Severity",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12),
+            font=get_font(12),
             width=90,
             height=25,
             fg_color=UI_COLORS['secondary'],
             hover_color=UI_COLORS['secondary_dark'],
-            command=lambda s=symptom: self.toggle_severity_view(s)
+            command=partial(self.toggle_severity_view, symptom)
         )
         severity_button.pack(side=tk.RIGHT, padx=5)
         
+        # Severity controls, built the first time the symptom is checked
+        # (most rows are never checked, and the level buttons are the bulk of a row)
+        if self.symptom_vars[symptom].get():
+            self._set_severity_frame_shown(self._ensure_severity_frame(symptom_frame, symptom), True)
+        
+        return symptom_frame
+
+    def _ensure_severity_frame(self, symptom_frame, symptom):
+        """
+        Get the severity controls of a symptom row, building them on first use.
+        
+        Args:
+            symptom_frame: Symptom row frame
+            symptom: Symptom code of the row
+            
+        Returns:
+            The row's severity frame (hidden when newly built)
+        """
+        severity_frame = getattr(symptom_frame, 'severity_frame', None)
+        if severity_frame is not None:
+            return severity_frame
+        
         # Severity frame (BELOW instead of RIGHT side)
-        severity_frame = ctk.CTkFrame(inner_frame, fg_color="transparent", corner_radius=5)
+        severity_frame = ctk.CTkFrame(symptom_frame, fg_color="transparent", corner_radius=5)
         symptom_frame.severity_frame = severity_frame  # Store reference for toggling
+        # Give the frame its grid options once; grid_remove keeps them for grid()
+        severity_frame.grid(row=1, column=0, sticky="ew", padx=15, pady=10)
+        severity_frame.grid_remove()
+        severity_frame.shown = False  # Tracked here rather than asking Tk (winfo_ismapped)
         
-        # Only show severity if symptom is checked
-        if self.symptom_vars[symptom].get():
-            severity_frame.pack(side=tk.TOP, fill=tk.X, padx=15, pady=10)
-        
-        # Get current severity value
-        current_value = int(self.severity_vars[symptom].get() or 0)
-        if current_value == 0:
-            current_value = 1  # Set a minimum value of 1 for display
-            
-        # Define colors for severity levels
-        value_color = UI_COLORS['low_severity'] if current_value <= 2 else \
-                    UI_COLORS['medium_severity'] if current_value <= 4 else \
-                    UI_COLORS['high_severity']
-                    
-        # Horizontal separator
-        separator = ctk.CTkFrame(severity_frame, height=1, fg_color=UI_COLORS['border'])
-        separator.pack(fill=tk.X, pady=(0, 10))
+        # Get current severity value (0 until a level is chosen)
+        try:
+            current_value = int(self.severity_vars[symptom].get())
+        except (ValueError, TypeError):
+            current_value = 0
         
-        # Severity buttons in a clean layout
-        buttons_container = ctk.CTkFrame(severity_frame, fg_color="transparent")
-        buttons_container.pack(fill=tk.X, padx=5, pady=5)
+        # Description and color of the current level
+        current_level_text, value_color = (
+            _SEVERITY_LABEL_STYLES[current_value] if 0 <= current_value <= 5 else _SEVERITY_UNKNOWN_STYLE
+        )
+        
+        # Horizontal separator (a plain Tk frame: a flat line needs no canvas)
+        separator = tk.Frame(severity_frame, height=1, bg=UI_COLORS['border'], highlightthickness=0)
+        separator.pack(fill=tk.X, pady=(0, 10))
         
         # Title and current level
-        severity_header = ctk.CTkFrame(buttons_container, fg_color="transparent")
-        severity_header.pack(fill=tk.X, pady=(0, 10))
+        severity_header = ctk.CTkFrame(severity_frame, fg_color="transparent")
+        severity_header.pack(fill=tk.X, padx=5, pady=(5, 10))
         
         level_title = ctk.CTkLabel(
             severity_header,
             text="Severity level:",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12, weight="bold"),
+            font=get_font(12, weight="bold"),
             text_color=UI_COLORS['text_primary']
         )
         level_title.pack(side=tk.LEFT)
         
-        current_level_text = SYMPTOM_SEVERITY.get(current_value, "Not specified")
         level_desc = ctk.CTkLabel(
             severity_header,
             text=current_level_text,
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12),
+            font=get_font(12),
             text_color=value_color
         )
         level_desc.pack(side=tk.RIGHT)
         severity_frame.desc_label = level_desc
+        severity_frame.desc_style = (current_level_text, value_color)  # Shown (text, color)
 
         # Severity buttons
-        buttons_frame = ctk.CTkFrame(buttons_container, fg_color="transparent")
-        buttons_frame.pack(fill=tk.X, pady=5)
+        buttons_frame = ctk.CTkFrame(severity_frame, fg_color="transparent")
+        buttons_frame.pack(fill=tk.X, padx=5, pady=(5, 10))
         
         # Create simple number buttons
         level_buttons = []
         for i in range(1, 6):
-            # Determine if this button is selected
-            is_selected = i == current_value
-            
-            # Get color based on severity level
-            button_color = UI_COLORS['low_severity'] if i <= 2 else \
-                        UI_COLORS['medium_severity'] if i <= 4 else \
-                        UI_COLORS['high_severity']
-            
-            # Create the button
+            # Create the button, colored by its level and whether it is selected
             level_button = ctk.CTkButton(
                 buttons_frame,
                 text=str(i),
                 width=35,
                 height=35,
                 corner_radius=5,
-                fg_color=button_color if is_selected else "transparent",
                 border_width=1,
-                border_color=button_color,
-                hover_color=self.adjust_color_opacity(button_color, 0.8),
-                text_color=UI_COLORS['text_light'] if is_selected else button_color,
-                font=ctk.CTkFont(family=DEFAULT_FONT, size=12, weight="bold"),
-                command=lambda val=i, s=symptom: self.set_severity_direct(s, val)
+                border_color=SEVERITY_COLORS[i],
+                hover_color=self._severity_hover_colors[i],
+                font=get_font(12, weight="bold"),
+                command=partial(self.set_severity_direct, symptom, i),
+                **_SEVERITY_BUTTON_STYLES[i][i == current_value]
             )
             level_button.pack(side=tk.LEFT, expand=True, padx=3)
-            level_buttons.append({"button": level_button, "level": i})
+            level_buttons.append({"button": level_button, "level": i, "selected": i == current_value})
         
         # Store buttons for updates
         severity_frame.level_buttons = level_buttons
         
-        # Simple update function
-        def update_severity_visuals(*args):
-            try:
-                if not severity_frame.winfo_exists():
-                    return
-                    
-                # Get current severity value
-                severity_str = self.severity_vars[symptom].get()
-                
-                # Convert to integer
-                try:
-                    severity = int(float(severity_str))
-                except (ValueError, TypeError):
-                    severity = 0
-                
-                # Get appropriate color and text
-                if severity == 0:
-                    severity_text = "Not present"
-                    new_color = UI_COLORS['text_secondary']
-                else:
-                    new_color = UI_COLORS['low_severity'] if severity <= 2 else \
-                               UI_COLORS['medium_severity'] if severity <= 4 else \
-                               UI_COLORS['high_severity']
-                    severity_text = SYMPTOM_SEVERITY.get(severity, "Not specified")
-                
-                # Update buttons
-                for button_data in severity_frame.level_buttons:
-                    button = button_data["button"]
-                    level = button_data["level"]
-                    
-                    # Get color for this level
-                    level_color = UI_COLORS['low_severity'] if level <= 2 else \
-                               UI_COLORS['medium_severity'] if level <= 4 else \
-                               UI_COLORS['high_severity']
-                    
-                    # Is this the current selected level?
-                    is_selected = level == severity
-                    
-                    # Update button appearance
-                    button.configure(
-                        fg_color=level_color if is_selected else "transparent",
-                        text_color=UI_COLORS['text_light'] if is_selected else level_color
-                    )
-                
-                # Update description
-                severity_frame.desc_label.configure(text=severity_text, text_color=new_color)
-                
-            except Exception as e:
-                print(f"Error updating severity visuals: {e}")
-                try:
-                    self.severity_vars[symptom].trace_remove("write", *args)
-                except:
-                    pass
-        
-        # Call once to set initial state
-        update_severity_visuals()
-        
-        # Attach trace for updates
-        try:
-            trace_id = self.severity_vars[symptom].trace("w", update_severity_visuals)
-            if not hasattr(self, '_traces'):
-                self._traces = {}
-            self._traces[symptom] = trace_id
-        except Exception as e:
-            print(f"Error setting trace: {e}")
-        
-        return symptom_frame
+        return severity_frame
+
+    def _set_severity_frame_shown(self, severity_frame, shown):
+        """
+        Show or hide the severity controls of a symptom row, if that changes anything.
+        
+        Args:
+            severity_frame: Severity frame built by _ensure_severity_frame
+            shown: Whether the controls should be shown
+        """
+        if severity_frame.shown == shown:
+            return
+        severity_frame.shown = shown
+        if shown:
+            severity_frame.grid()  # Restores the options kept by grid_remove
+        else:
+            severity_frame.grid_remove()
+
+    def _on_symptom_row_enter(self, event):
+        """Highlight the symptom row under the pointer."""
+        # CTkFrame binds events on its drawing canvas, whose master is the frame
+        event.widget.master.configure(**_SYMPTOM_ROW_HOVER_STYLE)
+    
+    def _on_symptom_row_leave(self, event):
+        """Restore the symptom row the pointer left."""
+        event.widget.master.configure(**_SYMPTOM_ROW_STYLE)
 
     def on_symptom_toggle(self, symptom):
         """Handle symptom checkbox toggle with improved efficiency."""
         # Get the direct reference to the symptom frame
+        # (rows are hidden rather than destroyed, so a known row is always live)
         symptom_frame = self.symptom_frames.get(symptom)
-        if not symptom_frame or not hasattr(symptom_frame, 'severity_frame'):
-            return
-        
-        # Check if widget still exists
-        if not symptom_frame.winfo_exists():
+        if not symptom_frame:
             return
             
         # Get the checked state
@@ -2933,19 +3570,20 @@ class PlantDiseaseExpertGUI:
         
         # Show or hide severity frame based on checked state
         try:
-            if is_checked:
-                # Show severity frame when checked
-                if symptom_frame.severity_frame.winfo_exists():
-                    symptom_frame.severity_frame.pack(side=tk.TOP, padx=10, pady=5, fill=tk.X)
-            else:
-                # Hide severity frame when unchecked
-                if symptom_frame.severity_frame.winfo_exists():
-                    symptom_frame.severity_frame.pack_forget()
-                    # Reset severity to default
-                    self.severity_vars[symptom].set(3)
-        except Exception as e:
+            with self._batched_updates():
+                if is_checked:
+                    # Show severity frame when checked (building it the first time)
+                    self._set_severity_frame_shown(self._ensure_severity_frame(symptom_frame, symptom), True)
+                else:
+                    # Hide severity frame when unchecked
+                    if hasattr(symptom_frame, 'severity_frame'):
+                        self._set_severity_frame_shown(symptom_frame.severity_frame, False)
+                    # Reset severity to default (unless the caller resets it)
+                    if not self._bulk_update:
+                        self._set_severity(symptom, 3)
+        except Exception:
             # Log error but don't crash
-            print(f"Error in on_symptom_toggle: {e}")
+            logger.exception("Error in on_symptom_toggle")
 
     def view_plant_categories(self):
         """Open dialog to view plants by category."""
@@ -2967,12 +3605,12 @@ class PlantDiseaseExpertGUI:
         title_label = ctk.CTkLabel(
             category_frame,
             text="Select Plant by Category",
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=16, weight="bold")
+            font=get_font(16, weight="bold")
         )
         title_label.pack(pady=(0, 15))
         
         # List categories and plants
-        for category, plants in PLANT_CATEGORIES.items():
+        for category, plants in _PLANT_CATEGORIES_SORTED.items():
             # Category header
             category_header = ctk.CTkFrame(category_frame, fg_color=UI_COLORS['primary'])
             category_header.pack(fill=tk.X, pady=(10, 5))
@@ -2980,7 +3618,7 @@ class PlantDiseaseExpertGUI:
             category_label = ctk.CTkLabel(
                 category_header,
                 text=category,
-                font=ctk.CTkFont(family=DEFAULT_FONT, size=14, weight="bold"),
+                font=get_font(14, weight="bold"),
                 text_color=UI_COLORS['text_light']
             )
             category_label.pack(padx=10, pady=5)
@@ -2989,7 +3627,7 @@ class PlantDiseaseExpertGUI:
             plants_frame = ctk.CTkFrame(category_frame, fg_color=UI_COLORS['bg_light'])
             plants_frame.pack(fill=tk.X, pady=(0, 10))
             
-            for plant in sorted(plants):
+            for plant in plants:
                 plant_button = ctk.CTkButton(
                     plants_frame,
                     text=plant,
@@ -3008,26 +3646,29 @@ class PlantDiseaseExpertGUI:
             text="Close",
             command=category_window.destroy,
             fg_color=UI_COLORS['text_secondary'],
-            font=ctk.CTkFont(family=DEFAULT_FONT, size=12)
+            font=get_font(12)
         )
         close_button.pack(pady=15)
 
     def clear_search(self):
         """Clear only the search box without affecting selected symptoms."""
         self.search_var.set("")
-        # Update the symptom display to show all symptoms
-        self.update_symptom_display()
+        # Show all symptoms right away, instead of redisplaying the old matches
+        # now and the full list again when the debounced search runs
+        if self._search_after_id:
+            self.root.after_cancel(self._search_after_id)
+        self._perform_search()
         self.show_snackbar("Search cleared")
 
     def update_severity_visuals(self, symptom, severity_value=None):
         """Updates the visual elements based on severity value"""
         try:
             if severity_value is None:
-                severity_value = self.severity_vars.get(symptom, tk.StringVar(value="0")).get()
+                severity_value = self.severity_vars[symptom].get() if symptom in self.severity_vars else self.severity_vars.default
             
             # Convert string to integer (safely)
             try:
-                severity_int = int(float(severity_value))
+                severity_int = int(severity_value)
             except (ValueError, TypeError):
                 severity_int = 0
             
@@ -3037,45 +3678,56 @@ class PlantDiseaseExpertGUI:
                 return
             
             # Update description label
-            severity_desc = self.severity_descriptions.get(severity_int, "Not specified")
+            desc_style = (
+                _SEVERITY_LABEL_STYLES[severity_int] if 0 <= severity_int <= 5 else _SEVERITY_UNKNOWN_STYLE
+            )
             
-            # More robust way to find the label
+            # Only widgets whose look changes are reconfigured, since every
+            # configure() redraws the widget
             try:
                 # Try to find the desc_label that was stored
                 if hasattr(symptom_frame, 'severity_frame') and hasattr(symptom_frame.severity_frame, 'desc_label'):
-                    severity_label = symptom_frame.severity_frame.desc_label
-                    if hasattr(severity_label, 'configure'):
-                        severity_label.configure(text=severity_desc)
+                    severity_frame = symptom_frame.severity_frame
+                    if severity_frame.desc_style != desc_style:
+                        severity_frame.desc_style = desc_style
+                        severity_desc, desc_color = desc_style
+                        self._configure_widget(severity_frame.desc_label, text=severity_desc, text_color=desc_color)
             except Exception:
                 pass  # Skip if we can't update the label
             
-            # Update button colors if applicable
+            # Update button colors if applicable (only the ones that were or
+            # become the selected level)
             try:
                 if hasattr(symptom_frame, 'severity_frame') and hasattr(symptom_frame.severity_frame, 'level_buttons'):
                     for button_data in symptom_frame.severity_frame.level_buttons:
-                        button = button_data["button"]
                         level = button_data["level"]
-                        
-                        # Get color for this level
-                        level_color = self.severity_colors.get(level, "gray80")
-                        
-                        # Is this the current selected level?
                         is_selected = level == severity_int
-                        
-                        # Update button appearance
-                        button.configure(
-                            fg_color=level_color if is_selected else "transparent",
-                            text_color=UI_COLORS['text_light'] if is_selected else level_color
-                        )
+                        if button_data["selected"] != is_selected:
+                            button_data["selected"] = is_selected
+                            self._configure_widget(button_data["button"], **_SEVERITY_BUTTON_STYLES[level][is_selected])
             except Exception:
                 pass  # Skip if we can't update buttons
                 
-        except Exception as e:
-            print(f"Error updating severity visuals: {e}")
+        except Exception:
+            logger.exception("Error updating severity visuals")
+
+    def _set_severity(self, symptom, value):
+        """
+        Set a symptom's severity and update its severity controls, if built.
+        
+        Severity variables have no traces, so every write goes through here.
+        
+        Args:
+            symptom: Symptom code
+            value: Severity level (int or str)
+        """
+        self.severity_vars[symptom].set(value)
+        if symptom in self.symptom_frames:
+            self.update_severity_visuals(symptom, value)
 
     def set_severity_direct(self, symptom, value):
         """Sets the severity directly from button clicks"""
-        if symptom in self.severity_vars:
+        if symptom in SYMPTOM_NAMES:
             # Convert to integer if needed
             if isinstance(value, str):
                 try:
@@ -3083,25 +3735,31 @@ class PlantDiseaseExpertGUI:
                 except (ValueError, TypeError):
                     value = 3  # Default to medium severity
                 
-            # Set the severity value - store as integer
+            # Set the severity value now, but restyle the controls once the
+            # clicks settle, so clicking quickly through the levels redraws once
             self.severity_vars[symptom].set(value)
+            pending = self._pending_severity_updates.pop(symptom, None)
+            if pending:
+                self.root.after_cancel(pending)
+            self._pending_severity_updates[symptom] = self.root.after_idle(self._apply_severity_update, symptom)
             
             # Make sure the symptom is checked
             if not self.symptom_vars[symptom].get():
                 self.symptom_vars[symptom].set(True)
                 self.on_symptom_toggle(symptom)
             
-            # Update the visual elements based on severity value
-            self.update_severity_visuals(symptom, value)
-            
             # Update the severity slider if it exists
             symptom_frame = self.symptom_frames.get(symptom)
             if symptom_frame and hasattr(symptom_frame, 'severity_frame'):
                 # Show the severity frame if it's not visible
-                if not symptom_frame.severity_frame.winfo_ismapped():
-                    symptom_frame.severity_frame.pack(side=tk.TOP, fill=tk.X, padx=15, pady=10)
-            
-            self.show_snackbar(f"Severity for {SYMPTOM_NAMES.get(symptom, symptom)} set to {value}")
+                self._set_severity_frame_shown(symptom_frame.severity_frame, True)
+
+    def _apply_severity_update(self, symptom):
+        """Restyle a symptom's severity controls after the last severity click."""
+        self._pending_severity_updates.pop(symptom, None)
+        value = self.severity_vars[symptom].get()
+        self.update_severity_visuals(symptom, value)
+        self.show_snackbar(f"Severity for {SYMPTOM_NAMES[symptom]} set to {value}")
 
     def toggle_severity_view(self, symptom):
         """Toggle the visibility of severity controls for a symptom"""
@@ -3114,14 +3772,9 @@ class PlantDiseaseExpertGUI:
         if not self.symptom_vars[symptom].get():
             self.symptom_vars[symptom].set(True)
             
-        # Toggle the severity frame
-        if hasattr(symptom_frame, 'severity_frame'):
-            severity_frame = symptom_frame.severity_frame
-            if severity_frame.winfo_exists():
-                if severity_frame.winfo_ismapped():
-                    severity_frame.pack_forget()
-                else:
-                    severity_frame.pack(side=tk.RIGHT, padx=15, pady=10, fill=tk.X)
+        # Toggle the severity frame (building it the first time)
+        severity_frame = self._ensure_severity_frame(symptom_frame, symptom)
+        self._set_severity_frame_shown(severity_frame, not severity_frame.shown)
 
 
 def main():
@@ -7,7 +7,13 @@ plant-specific diagnoses and environmental factors.
 """
 
 from inference_engine import InferenceEngine
-from knowledge_base import SYMPTOM_NAMES, SYMPTOM_SEVERITY
+from knowledge_base import (
+    KNOWLEDGE_BASE, PLANT_DISEASE_SUSCEPTIBILITY, SYMPTOM_NAMES, SYMPTOM_SEVERITY
+)
+
+# Engine shared by the test cases (diagnoses don't change its state, so the
+# knowledge base indexes only need to be built once)
+_ENGINE = InferenceEngine()
 
 def run_test_case(test_name, symptoms, symptom_severity=None, plant_type=None, 
                 environmental_factors=None, expected_top_disease=None):
@@ -42,8 +48,7 @@ def run_test_case(test_name, symptoms, symptom_severity=None, plant_type=None,
             print(f"- {factor.replace('_', ' ').title()}: {value.replace('_', ' ').title()}")
     
     # Run diagnosis with all provided information
-    engine = InferenceEngine()
-    results = engine.diagnose(
+    results = _ENGINE.diagnose(
         symptoms, 
         symptom_severity, 
         plant_type, 
@@ -68,6 +73,110 @@ def run_test_case(test_name, symptoms, symptom_severity=None, plant_type=None,
     
     print("-" * 50)
 
+def run_batch_test(test_name, cases, workers=2):
+    """
+    Run a batch diagnosis and check it matches diagnosing each case on its own.
+    
+    Args:
+        test_name: Name of the test case
+        cases: List of dictionaries with diagnose() keyword arguments
+        workers: Number of worker processes to use
+    """
+    print(f"\n=== Test Case: {test_name} ===")
+    print(f"Cases: {len(cases)}, Workers: {workers}")
+    
+    batch_results = _ENGINE.diagnose_batch(cases, workers=workers)
+    expected_results = [_ENGINE.diagnose(**case) for case in cases]
+    
+    if batch_results == expected_results:
+        print("\nTest PASSED: Batch results match individual diagnoses")
+    else:
+        print("\nTest FAILED: Batch results differ from individual diagnoses")
+    
+    print("-" * 50)
+
+def run_top_k_test(test_name, symptoms, top_k):
+    """
+    Check that a top-k diagnosis returns the head of the full ranking.
+    
+    Args:
+        test_name: Name of the test case
+        symptoms: List of symptoms to diagnose
+        top_k: Number of top results to request
+    """
+    print(f"\n=== Test Case: {test_name} ===")
+    print(f"Symptoms: {len(symptoms)}, Top K: {top_k}")
+    
+    top_results = _ENGINE.diagnose(symptoms, top_k=top_k)
+    all_results = _ENGINE.diagnose(symptoms)
+    
+    if top_results == all_results[:top_k]:
+        print(f"\nTest PASSED: Top {top_k} results match the full ranking")
+    else:
+        print(f"\nTest FAILED: Top {top_k} results differ from the full ranking")
+    
+    print("-" * 50)
+
+def run_plant_filter_test(test_name, symptoms, plant_type):
+    """
+    Check that a plant-specific diagnosis only considers diseases the plant
+    type is susceptible to or that list the plant type specifically.
+    
+    Args:
+        test_name: Name of the test case
+        symptoms: List of symptoms to diagnose
+        plant_type: Type of plant in the susceptibility map
+    """
+    print(f"\n=== Test Case: {test_name} ===")
+    print(f"Symptoms: {len(symptoms)}, Plant Type: {plant_type}")
+    
+    plant_diseases = set(PLANT_DISEASE_SUSCEPTIBILITY[plant_type])
+    plant_diseases.update(disease for disease, data in KNOWLEDGE_BASE.items()
+                          if plant_type in data.get('plant_types', ()))
+    
+    plant_results = [r['disease'] for r in _ENGINE.diagnose(symptoms, plant_type=plant_type)]
+    expected_results = [r['disease'] for r in _ENGINE.diagnose(symptoms)
+                        if r['disease'] in plant_diseases]
+    
+    if plant_results and sorted(plant_results) == sorted(expected_results):
+        print(f"\nTest PASSED: Only diseases of {plant_type} were considered")
+    else:
+        print(f"\nTest FAILED: Expected {sorted(expected_results)} but got {sorted(plant_results)}")
+    
+    print("-" * 50)
+
+def run_cache_test(test_name, symptoms):
+    """
+    Check that a repeated diagnosis is answered from the cache, and that
+    modifying returned results does not leak into later answers.
+    
+    Args:
+        test_name: Name of the test case
+        symptoms: List of symptoms to diagnose
+    """
+    print(f"\n=== Test Case: {test_name} ===")
+    print(f"Symptoms: {len(symptoms)}")
+    
+    # Fresh engine, so the cache statistics only count this test
+    engine = InferenceEngine()
+    first_results = engine.diagnose(symptoms)
+    expected_results = [dict(r, matching_symptoms=list(r['matching_symptoms'])) for r in first_results]
+    
+    # Tamper with the first answer; the cached entry must be unaffected
+    first_results[0]['matching_symptoms'].append('tampered')
+    first_results[0]['confidence'] = 0
+    
+    # Same symptoms in a different order is the same question
+    repeat_results = engine.diagnose(list(reversed(symptoms)))
+    hits = engine._diagnose_cached.cache_info().hits
+    
+    if repeat_results == expected_results and hits == 1:
+        print("\nTest PASSED: Repeated diagnosis served from an intact cache")
+    else:
+        print(f"\nTest FAILED: Repeated diagnosis differs or missed the cache (hits: {hits})")
+    
+    print("-" * 50)
+
 def run_all_tests():
     """Run all test cases."""
     print("\n" + "=" * 80)
@@ -195,6 +304,43 @@ def run_all_tests():
         "No Matching Disease",
         ["foul_odor"],  # Only one symptom that's not specific enough
     )
+    
+    # Top-K Test Cases
+    # Test Case 13: Top 3 of Ambiguous Symptoms
+    run_top_k_test(
+        "Top 3 of Ambiguous Symptoms",
+        ["leaf_yellowing", "wilting", "stunted_growth", "leaf_drop"],
+        top_k=3
+    )
+    
+    # Batch Diagnosis Test Cases
+    # Test Case 14: Batch of Independent Cases
+    run_batch_test(
+        "Batch of Independent Cases",
+        [
+            {"observed_symptoms": ["white_powdery_patches", "leaf_yellowing"]},
+            {"observed_symptoms": ["brown_spots", "yellow_halo"], "plant_type": "Tomato"},
+            {"observed_symptoms": ["wilting", "yellow_leaves"],
+             "symptom_severity": {"wilting": 5, "yellow_leaves": "2"}},
+            {"observed_symptoms": ["yellow_spots_upper_leaves"],
+             "environmental_factors": {"temperature": "cool", "humidity": "high"}}
+        ]
+    )
+    
+    # Caching Test Cases
+    # Test Case 15: Repeated Diagnosis
+    run_cache_test(
+        "Repeated Diagnosis",
+        ["white_powdery_patches", "leaf_yellowing", "distorted_growth"]
+    )
+    
+    # Plant Filtering Test Cases
+    # Test Case 16: Rose with Ambiguous Symptoms
+    run_plant_filter_test(
+        "Rose with Ambiguous Symptoms",
+        ["leaf_yellowing", "wilting", "stunted_growth", "leaf_drop"],
+        plant_type="Rose"
+    )
 
 if __name__ == "__main__":
     run_all_tests()